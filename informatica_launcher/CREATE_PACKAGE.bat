@@ -17,6 +17,25 @@ echo Copying files...
 
 REM Copy essential files
 copy launcher.py %TEMP_DIR%\
+copy icon_cache.py %TEMP_DIR%\
+copy access_log.py %TEMP_DIR%\
+copy access_history.py %TEMP_DIR%\
+copy quiz_bank.py %TEMP_DIR%\
+copy quiz_cache.py %TEMP_DIR%\
+copy http_client.py %TEMP_DIR%\
+copy search_index.py %TEMP_DIR%\
+copy virtual_list.py %TEMP_DIR%\
+copy config_compiler.py %TEMP_DIR%\
+copy launch_dispatcher.py %TEMP_DIR%\
+copy launcher_cli.py %TEMP_DIR%\
+copy single_instance.py %TEMP_DIR%\
+copy health_probe.py %TEMP_DIR%\
+copy timing.py %TEMP_DIR%\
+copy browser_profiles.py %TEMP_DIR%\
+copy usage_export.py %TEMP_DIR%\
+copy scheduler.py %TEMP_DIR%\
+copy shared_state.py %TEMP_DIR%\
+copy okta_sync.py %TEMP_DIR%\
 copy launcher.bat %TEMP_DIR%\
 copy QUICK_START.bat %TEMP_DIR%\
 copy config.json %TEMP_DIR%\
@@ -29,6 +48,10 @@ REM Copy icons
 copy informatica_logo.png %TEMP_DIR%\
 copy optum_logo.png %TEMP_DIR%\
 
+REM Pre-size the icons so the launcher starts without importing Pillow
+python icon_cache.py %TEMP_DIR%
+if errorlevel 1 echo Could not pre-size icons (pip install pillow); the launcher will resize them on first start
+
 echo.
 echo Files copied successfully!
 echo.
@@ -0,0 +1,128 @@
+"""
+Indexed launch history for the Informatica Quick Launcher
+Keeps per-environment and per-day aggregates up to date on every insert
+so usage queries never scan the full history
+"""
+import sqlite3
+import threading
+from datetime import datetime
+from pathlib import Path
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS launches (
+    id INTEGER PRIMARY KEY,
+    ts INTEGER NOT NULL,
+    name TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS env_stats (
+    name TEXT PRIMARY KEY,
+    launch_count INTEGER NOT NULL,
+    last_launch INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS env_stats_by_count ON env_stats (launch_count DESC, last_launch DESC);
+CREATE INDEX IF NOT EXISTS env_stats_by_recent ON env_stats (last_launch DESC);
+CREATE TABLE IF NOT EXISTS daily_counts (
+    day TEXT NOT NULL,
+    name TEXT NOT NULL,
+    launch_count INTEGER NOT NULL,
+    PRIMARY KEY (day, name)
+);
+CREATE TABLE IF NOT EXISTS daily_totals (
+    day TEXT PRIMARY KEY,
+    launch_count INTEGER NOT NULL
+);
+"""
+
+
+class AccessHistory:
+    """SQLite store of environment launches with incrementally maintained rollups"""
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self.lock = threading.Lock()
+        # Bumped on every write, so callers can tell that query results changed without querying
+        self.version = 0
+        self.conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        with self.lock, self.conn:
+            # WAL needs shared memory, which does not work on network drives; the
+            # default rollback journal only needs the file locks the share provides
+            self.conn.execute("PRAGMA journal_mode=DELETE")
+            self.conn.executescript(SCHEMA)
+
+    def record_batch(self, launches):
+        """Insert (datetime, name) launches and update the rollups in one transaction"""
+        if not launches:
+            return
+        with self.lock, self.conn:
+            for when, name in launches:
+                ts = int(when.timestamp())
+                day = when.strftime("%Y-%m-%d")
+                self.conn.execute("INSERT INTO launches (ts, name) VALUES (?, ?)", (ts, name))
+                self.conn.execute(
+                    "INSERT OR IGNORE INTO env_stats (name, launch_count, last_launch) VALUES (?, 0, ?)",
+                    (name, ts)
+                )
+                self.conn.execute(
+                    "UPDATE env_stats SET launch_count = launch_count + 1, "
+                    "last_launch = MAX(last_launch, ?) WHERE name = ?",
+                    (ts, name)
+                )
+                self.conn.execute(
+                    "INSERT OR IGNORE INTO daily_counts (day, name, launch_count) VALUES (?, ?, 0)",
+                    (day, name)
+                )
+                self.conn.execute(
+                    "UPDATE daily_counts SET launch_count = launch_count + 1 WHERE day = ? AND name = ?",
+                    (day, name)
+                )
+                self.conn.execute(
+                    "INSERT OR IGNORE INTO daily_totals (day, launch_count) VALUES (?, 0)", (day,)
+                )
+                self.conn.execute(
+                    "UPDATE daily_totals SET launch_count = launch_count + 1 WHERE day = ?", (day,)
+                )
+            self.version += 1
+
+    def record(self, name, when=None):
+        """Record a single launch"""
+        self.record_batch([(when or datetime.now(), name)])
+
+    def top_environments(self, limit=10):
+        """Return [(name, launch_count)] ordered by most launched"""
+        with self.lock:
+            return self.conn.execute(
+                "SELECT name, launch_count FROM env_stats "
+                "ORDER BY launch_count DESC, last_launch DESC LIMIT ?",
+                (limit,)
+            ).fetchall()
+
+    def recent_environments(self, limit=10):
+        """Return [(name, last_launch datetime)] ordered by most recently launched"""
+        with self.lock:
+            rows = self.conn.execute(
+                "SELECT name, last_launch FROM env_stats ORDER BY last_launch DESC LIMIT ?",
+                (limit,)
+            ).fetchall()
+        return [(name, datetime.fromtimestamp(ts)) for name, ts in rows]
+
+    def last_launch(self, name):
+        """Return the datetime of an environment's last launch, or None"""
+        with self.lock:
+            row = self.conn.execute(
+                "SELECT last_launch FROM env_stats WHERE name = ?", (name,)
+            ).fetchone()
+        return datetime.fromtimestamp(row[0]) if row else None
+
+    def launches_per_day(self, days=30):
+        """Return [(day, launch_count)] for the most recent days with launches"""
+        with self.lock:
+            return self.conn.execute(
+                "SELECT day, launch_count FROM daily_totals ORDER BY day DESC LIMIT ?",
+                (days,)
+            ).fetchall()
+
+    def close(self):
+        """Close the database connection"""
+        with self.lock:
+            self.conn.close()
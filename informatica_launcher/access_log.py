@@ -0,0 +1,172 @@
+"""
+Buffered access log writer for the Informatica Quick Launcher
+Records are queued by the UI and flushed in batches on a background thread.
+Each batch is one O_APPEND write, so launchers sharing the log never
+interleave or overwrite each other's lines
+"""
+import atexit
+import getpass
+import json
+import os
+import queue
+import socket
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+from shared_state import FileLock, append_record
+
+
+def current_user_and_host():
+    """Return (user name, host name) for log records; either may be None if unknown"""
+    try:
+        user = getpass.getuser()
+    except (KeyError, OSError):
+        user = None
+    try:
+        host = socket.gethostname() or None
+    except OSError:
+        host = None
+    return user, host
+
+
+class AccessLogWriter:
+    """Queue-backed writer that appends access records to access_log.txt in batches"""
+
+    def __init__(self, path, log_format='text', max_bytes=1024 * 1024, backup_count=5,
+                 batch_size=50, flush_interval=1.0, history=None):
+        self.path = Path(path)
+        self.history = history
+        self.log_format = log_format
+        self.max_bytes = max_bytes
+        self.backup_count = backup_count
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        # JSON lines name who launched where, since a shared log mixes several people's records
+        self.user, self.host = current_user_and_host()
+
+        self.queue = queue.Queue()
+        self.closed = False
+        self.thread = threading.Thread(target=self.run, name="access-log-writer", daemon=True)
+        self.thread.start()
+        atexit.register(self.close)
+
+    @classmethod
+    def from_config(cls, path, config, history=None):
+        """Create a writer using the optional 'access_log' section of config.json"""
+        settings = config.get('access_log', {})
+        return cls(
+            path,
+            log_format=settings.get('format', 'text'),
+            max_bytes=settings.get('max_bytes', 1024 * 1024),
+            backup_count=settings.get('backup_count', 5),
+            history=history
+        )
+
+    def log_access(self, env_name):
+        """Queue an environment launch record"""
+        self.put({'event': 'access', 'name': env_name})
+
+    def log_logout(self):
+        """Queue an Okta logout record"""
+        self.put({'event': 'logout', 'name': None})
+
+    def put(self, record):
+        """Timestamp a record and hand it to the writer thread (no file I/O here)"""
+        if self.closed:
+            return
+        record['time'] = datetime.now()
+        self.queue.put(record)
+
+    def close(self, timeout=5.0):
+        """Flush pending records and stop the writer thread"""
+        if self.closed:
+            return
+        self.closed = True
+        self.queue.put(None)
+        self.thread.join(timeout)
+
+    def run(self):
+        """Collect records into batches and flush them on size or time thresholds"""
+        batch = []
+        deadline = None
+        while True:
+            timeout = None if deadline is None else max(0.0, deadline - time.monotonic())
+            try:
+                record = self.queue.get(timeout=timeout)
+            except queue.Empty:
+                record = False  # Flush interval elapsed
+
+            if record:
+                batch.append(record)
+                if deadline is None:
+                    deadline = time.monotonic() + self.flush_interval
+
+            if batch and (record is None or record is False or len(batch) >= self.batch_size):
+                self.write(batch)
+                batch = []
+                deadline = None
+
+            if record is None:
+                return
+
+    def format_record(self, record):
+        """Render a record as a text line or a JSON line"""
+        timestamp = record['time'].strftime("%Y-%m-%d %H:%M:%S")
+        if self.log_format == 'jsonl':
+            return json.dumps({
+                'time': timestamp,
+                'event': record['event'],
+                'name': record['name'],
+                'user': self.user,
+                'host': self.host
+            }, ensure_ascii=False) + "\n"
+
+        if record['event'] == 'logout':
+            return f"{timestamp} - Logged out from Okta\n"
+        return f"{timestamp} - Accessed: {record['name']}\n"
+
+    def write(self, batch):
+        """Append a batch of records in a single write, rotating first if needed"""
+        data = "".join(self.format_record(record) for record in batch)
+        try:
+            self.rotate_if_needed(len(data.encode('utf-8')))
+            append_record(self.path, data)
+        except Exception as e:
+            print(f"Error writing access log: {e}")
+
+        if self.history is not None:
+            try:
+                self.history.record_batch([
+                    (record['time'], record['name'])
+                    for record in batch if record['event'] == 'access'
+                ])
+            except Exception as e:
+                print(f"Error recording access history: {e}")
+
+    def rotate_if_needed(self, incoming_bytes):
+        """Shift access_log.txt -> .1 -> .2 ... when it would exceed max_bytes"""
+        if not self.max_bytes or self.backup_count <= 0:
+            return
+        size = self.log_size()
+        if not size or size + incoming_bytes <= self.max_bytes:
+            return
+
+        # Only one launcher rotates; the others see the fresh file once they hold the lock.
+        # A record appended to the old file during the rename lands in .1 and is kept
+        with FileLock(self.path):
+            size = self.log_size()
+            if not size or size + incoming_bytes <= self.max_bytes:
+                return
+            for index in range(self.backup_count - 1, 0, -1):
+                source = self.path.with_name(f"{self.path.name}.{index}")
+                if source.exists():
+                    os.replace(source, self.path.with_name(f"{self.path.name}.{index + 1}"))
+            os.replace(self.path, self.path.with_name(f"{self.path.name}.1"))
+
+    def log_size(self):
+        """Return the current size of the log, or 0 if it does not exist"""
+        try:
+            return self.path.stat().st_size
+        except OSError:
+            return 0
@@ -0,0 +1,496 @@
+"""
+Performance benchmarks for the Informatica Quick Launcher
+Runs the launcher's hot paths against synthetic configs and writes the
+timings as JSON with percentiles
+
+Usage:
+    python benchmark.py                                  # 10, 1k and 10k items
+    python benchmark.py --sizes 10 1000 --repeat 10
+    python benchmark.py --baseline old_results.json      # Exit 1 on regressions
+    python benchmark.py --sharded                        # One category file per tab
+    python benchmark.py --imports                        # Startup imports with and without Pillow
+
+Every size runs in its own process inside a temporary copy of the launcher,
+so the real config, caches and logs are never touched. Network calls go to a
+local stub server. Without $DISPLAY, Xvfb is started when it is installed;
+otherwise only the benchmarks that need no window are run.
+"""
+import argparse
+import json
+import math
+import os
+import platform
+import shutil
+import socket
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from datetime import datetime
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from pathlib import Path
+
+
+APP_DIR = Path(__file__).parent
+
+DEFAULT_SIZES = (10, 1000, 10000)
+DEFAULT_OUTPUT = "benchmark_results.json"
+
+# Modules imported on the startup path besides launcher.py itself; the
+# 'with_pillow' variant adds the Pillow import icon_cache.py used to do at load time
+IMPORT_VARIANTS = {
+    'without_pillow': (),
+    'with_pillow': ('PIL.Image', 'PIL.ImageTk'),
+}
+
+# Categories whose tabs are switched to in the switch_tab benchmark
+SWITCH_TAB_CATEGORIES = 5
+
+# Number of entries in the synthetic quiz history
+QUIZ_HISTORY_ENTRIES = 60
+
+
+def generate_config(item_count, stub_url):
+    """Return a config with item_count items spread over about sqrt(n)/2 categories"""
+    category_count = max(2, min(50, round(math.sqrt(item_count) / 2)))
+    types = ('dev', 'qa', 'uat', 'prod', 'default')
+    categories = {f"Category {c + 1:02d}": [] for c in range(category_count)}
+    names = list(categories)
+    for i in range(item_count):
+        categories[names[i % category_count]].append({
+            'name': f"Environment {i:05d}",
+            'shortName': f"ENV{i:05d}",
+            'url': f"{stub_url}/env/{i}",
+            'type': types[i % len(types)],
+            'description': f"Synthetic item {i}",
+        })
+    return {
+        'okta_domain': stub_url,
+        'quiz_api_url': f"{stub_url}/api.php",
+        'health_check': False,
+        'single_instance': False,
+        'categories': categories,
+    }
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    """Answers the quiz API with canned questions and every other URL with 200"""
+
+    def do_GET(self):
+        if self.path.startswith('/api.php'):
+            body = json.dumps({
+                'response_code': 0,
+                'results': [
+                    {
+                        'question': f"Synthetic question {i}?",
+                        'correct_answer': "Right",
+                        'incorrect_answers': ["Wrong 1", "Wrong 2", "Wrong 3"],
+                    }
+                    for i in range(50)
+                ],
+            }).encode('utf-8')
+        else:
+            body = b"ok"
+        self.send_response(200)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_HEAD(self):
+        self.send_response(200)
+        self.end_headers()
+
+    def log_message(self, format, *args):
+        pass
+
+
+def start_stub_server():
+    """Start the network stub on a free local port"""
+    server = ThreadingHTTPServer(('127.0.0.1', 0), StubHandler)
+    threading.Thread(target=server.serve_forever, name="stub-server", daemon=True).start()
+    return server
+
+
+def start_virtual_display():
+    """Start Xvfb when there is no display; return the process, or None"""
+    if os.environ.get('DISPLAY') or not shutil.which('Xvfb'):
+        return None
+    for number in range(99, 120):
+        if not Path(f"/tmp/.X11-unix/X{number}").exists():
+            break
+    process = subprocess.Popen(
+        ['Xvfb', f":{number}", '-screen', '0', '1280x1024x24', '-nolisten', 'tcp'],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL
+    )
+    deadline = time.time() + 10
+    while not Path(f"/tmp/.X11-unix/X{number}").exists():
+        if time.time() > deadline or process.poll() is not None:
+            process.kill()
+            return None
+        time.sleep(0.05)
+    os.environ['DISPLAY'] = f":{number}"
+    return process
+
+
+def has_display():
+    """Return True if Tk can open a window in this environment"""
+    probe = "import tkinter; tkinter.Tk().destroy()"
+    return subprocess.run([sys.executable, '-c', probe], capture_output=True).returncode == 0
+
+
+def prepare_app_dir(root, item_count, stub_url, sharded=False):
+    """Copy the launcher into a scratch directory with a synthetic config.json"""
+    app_dir = Path(root) / f"items_{item_count}"
+    app_dir.mkdir()
+    for pattern in ('*.py', '*.png'):
+        for path in APP_DIR.glob(pattern):
+            shutil.copy2(path, app_dir / path.name)
+
+    config = generate_config(item_count, stub_url)
+    if sharded:
+        # One file per category plus the index in config.json
+        (app_dir / "categories").mkdir()
+        config['category_files'] = {}
+        for number, (category_name, items) in enumerate(config.pop('categories').items()):
+            file_name = f"categories/category_{number:02d}.json"
+            with open(app_dir / file_name, 'w', encoding='utf-8') as f:
+                json.dump(items, f)
+            config['category_files'][category_name] = file_name
+    with open(app_dir / "config.json", 'w', encoding='utf-8') as f:
+        json.dump(config, f, indent=2)
+    return app_dir
+
+
+def summarize(name, size, samples, unit='ms'):
+    """Return one result record with percentiles (in milliseconds unless unit says otherwise)"""
+    ordered = sorted(samples)
+
+    def percentile(p):
+        # Nearest-rank percentile
+        return ordered[max(0, math.ceil(p / 100 * len(ordered)) - 1)]
+
+    return {
+        'benchmark': name,
+        'items': size,
+        'samples': len(ordered),
+        f'min_{unit}': round(ordered[0], 3),
+        f'p50_{unit}': round(percentile(50), 3),
+        f'p90_{unit}': round(percentile(90), 3),
+        f'p95_{unit}': round(percentile(95), 3),
+        f'p99_{unit}': round(percentile(99), 3),
+        f'max_{unit}': round(ordered[-1], 3),
+        f'mean_{unit}': round(sum(ordered) / len(ordered), 3),
+    }
+
+
+def record_unit(record):
+    """Return the unit of a result record ('ms' or 'mb')"""
+    return 'mb' if 'p50_mb' in record else 'ms'
+
+
+def time_ms(func, *args):
+    """Return the duration of one call in milliseconds"""
+    started = time.perf_counter()
+    func(*args)
+    return (time.perf_counter() - started) * 1000
+
+
+def run_child(argv):
+    """Run a child process and return its JSON output"""
+    completed = subprocess.run(
+        [sys.executable, str(Path(__file__).resolve())] + argv,
+        capture_output=True,
+        text=True
+    )
+    if completed.returncode != 0:
+        raise RuntimeError(f"Benchmark child failed:\n{completed.stderr}")
+    return json.loads(completed.stdout.strip().splitlines()[-1])
+
+
+def bench_startup(app_dir, size, repeat, gui):
+    """Time fresh launcher processes with and without the config snapshot"""
+    results = []
+    for label, clear_caches in (('cold_start', True), ('warm_start', False)):
+        runs = []
+        for _ in range(repeat):
+            if clear_caches:
+                (app_dir / ".config_snapshot.bin").unlink(missing_ok=True)
+                shutil.rmtree(app_dir / ".icon_cache", ignore_errors=True)
+            runs.append(run_child(['--child-startup', str(app_dir)] + ([] if gui else ['--no-gui'])))
+        for phase in runs[0]:
+            results.append(summarize(f"{label}.{phase}", size, [run[phase] for run in runs]))
+    return results
+
+
+def child_startup(app_dir, gui):
+    """Measure one start of the launcher in this process (child mode)"""
+    sys.path.insert(0, str(app_dir))
+    started = time.perf_counter()
+    if not gui:
+        import config_compiler
+        config_compiler.compile_config(app_dir / "config.json", app_dir / ".config_snapshot.bin")
+        return {'config_ms': (time.perf_counter() - started) * 1000}
+
+    import tkinter as tk
+    import launcher
+    imported = time.perf_counter()
+    root = tk.Tk()
+    app = launcher.InformaticaLauncher(root, resident=False)
+    constructed = time.perf_counter()
+    root.update()
+    painted = time.perf_counter()
+    app.close_services()
+    root.destroy()
+    return {
+        'import_ms': (imported - started) * 1000,
+        'init_ms': (constructed - imported) * 1000,
+        'first_paint_ms': (painted - imported) * 1000,
+    }
+
+
+def peak_rss_mb():
+    """Return this process's peak resident set size in MB, or None where it cannot be read"""
+    try:
+        import resource
+    except ImportError:
+        return None  # Windows
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS bytes
+    return peak / (1024 * 1024) if platform.system() == 'Darwin' else peak / 1024
+
+
+def bench_imports(repeat):
+    """Time the startup imports and their peak memory in fresh processes, with and without Pillow"""
+    results = []
+    for variant in IMPORT_VARIANTS:
+        runs = [run_child(['--child-imports', variant]) for _ in range(repeat)]
+        results.append(summarize(f"startup_imports.{variant}", 0, [run['import_ms'] for run in runs]))
+        if runs[0]['rss_mb'] is not None:
+            results.append(summarize(
+                f"startup_rss.{variant}", 0, [run['rss_mb'] for run in runs], unit='mb'
+            ))
+    return results
+
+
+def child_imports(variant):
+    """Import the launcher's modules in this process and report time and memory (child mode)"""
+    import importlib
+    sys.path.insert(0, str(APP_DIR))
+    started = time.perf_counter()
+    for module in IMPORT_VARIANTS[variant]:
+        importlib.import_module(module)
+    import launcher
+    imported = time.perf_counter()
+    return {'import_ms': (imported - started) * 1000, 'rss_mb': peak_rss_mb()}
+
+
+def child_suite(app_dir, size, repeat, gui):
+    """Run the in-process benchmarks for one synthetic config (child mode)"""
+    sys.path.insert(0, str(app_dir))
+    results = []
+
+    # Quiz cache load/save, independent of the config size
+    from quiz_cache import QuizCache
+    cache_path = app_dir / "bench_quiz_cache.json"
+    history_path = app_dir / "bench_quiz_history.jsonl"
+    with open(history_path, 'w', encoding='utf-8') as f:
+        for i in range(QUIZ_HISTORY_ENTRIES):
+            f.write(json.dumps({'date': f"2026-01-{i % 28 + 1:02d}", 'question': f"Q{i}?"}) + "\n")
+    results.append(summarize('quiz_cache.load', size, [
+        time_ms(QuizCache, cache_path, history_path) for _ in range(repeat)
+    ]))
+    cache = QuizCache(cache_path, history_path, history_limit=10 ** 6)
+    quiz = {'question': "Q?", 'correct_answer': "A", 'all_answers': ["A", "B", "C", "D"]}
+    results.append(summarize('quiz_cache.save', size, [
+        time_ms(cache.record, f"2026-02-{i % 28 + 1:02d}", dict(quiz, question=f"Save {i}?"))
+        for i in range(repeat)
+    ]))
+
+    if not gui:
+        return results
+
+    import tkinter as tk
+    import launcher
+    root = tk.Tk()
+    app = launcher.InformaticaLauncher(root, resident=False)
+    root.update()
+
+    def switch(name):
+        app.switch_tab(name)
+        root.update_idletasks()
+
+    # switch_tab: first visit builds the frame, a revisit reuses the cached one
+    names = app.categories.names()[:SWITCH_TAB_CATEGORIES]
+    built, cached = [], []
+    for _ in range(repeat):
+        for name in names:
+            switch("Quiz")
+            app.invalidate_tab(name)
+            built.append(time_ms(switch, name))
+            switch("Quiz")
+            cached.append(time_ms(switch, name))
+    results.append(summarize('switch_tab.build', size, built))
+    results.append(summarize('switch_tab.cached', size, cached))
+
+    # create_environment_button on a scratch frame
+    parent = tk.Frame(root)
+    items = app.categories.get(names[0])
+    samples = [
+        time_ms(app.create_environment_button, parent, items[i % len(items)], i)
+        for i in range(repeat * 10)
+    ]
+    parent.destroy()
+    results.append(summarize('create_environment_button', size, samples))
+
+    # reload_config after an edit that renames one item
+    config_path = app_dir / "config.json"
+    with open(config_path, 'r', encoding='utf-8') as f:
+        raw = json.load(f)
+    if 'category_files' in raw:
+        config_path = app_dir / raw['category_files'][names[0]]
+        with open(config_path, 'r', encoding='utf-8') as f:
+            edited_items = json.load(f)
+    else:
+        edited_items = raw['categories'][names[0]]
+    samples = []
+    for i in range(repeat):
+        edited_items[0]['shortName'] = f"EDITED{i}"
+        with open(config_path, 'w', encoding='utf-8') as f:
+            json.dump(edited_items if 'category_files' in raw else raw, f)
+
+        def reload():
+            app.reload_config(show_errors=False)
+            root.update_idletasks()
+
+        samples.append(time_ms(reload))
+    results.append(summarize('reload_config', size, samples))
+
+    app.close_services()
+    root.destroy()
+    return results
+
+
+def git_revision():
+    """Return the current commit, or None outside a git checkout"""
+    try:
+        return subprocess.run(
+            ['git', 'rev-parse', '--short', 'HEAD'],
+            cwd=APP_DIR, capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(results, baseline_path, tolerance):
+    """Print benchmarks whose p50 grew by more than tolerance; return their count"""
+    with open(baseline_path, 'r', encoding='utf-8') as f:
+        baseline = {
+            (record['benchmark'], record['items']): record
+            for record in json.load(f)['results']
+        }
+    regressions = 0
+    for record in results:
+        key = f"p50_{record_unit(record)}"
+        previous = baseline.get((record['benchmark'], record['items']))
+        if previous is None or previous.get(key, 0) <= 0:
+            continue
+        change = record[key] / previous[key] - 1
+        if change > tolerance:
+            regressions += 1
+            print(f"REGRESSION {record['benchmark']} ({record['items']} items): "
+                  f"p50 {previous[key]:.2f} -> {record[key]:.2f} {record_unit(record)} (+{change:.0%})")
+    return regressions
+
+
+def build_parser():
+    """Create the argument parser for the benchmark runner"""
+    parser = argparse.ArgumentParser(description="Benchmark the launcher's hot paths")
+    parser.add_argument('--sizes', type=int, nargs='+', default=list(DEFAULT_SIZES),
+                        help="Item counts of the synthetic configs")
+    parser.add_argument('--repeat', type=int, default=20, help="Samples per benchmark")
+    parser.add_argument('--startup-repeat', type=int, default=5, help="Launcher processes started per size")
+    parser.add_argument('--output', default=DEFAULT_OUTPUT, help="Where to write the JSON results")
+    parser.add_argument('--baseline', help="Earlier results to compare against")
+    parser.add_argument('--tolerance', type=float, default=0.2,
+                        help="Allowed p50 slowdown before a benchmark counts as a regression")
+    parser.add_argument('--no-gui', action='store_true', help="Skip the benchmarks that need a window")
+    parser.add_argument('--sharded', action='store_true',
+                        help="Split the synthetic configs into one category file per tab")
+    parser.add_argument('--imports', action='store_true',
+                        help="Also measure startup import time and memory with and without Pillow")
+    parser.add_argument('--child-startup', help=argparse.SUPPRESS)
+    parser.add_argument('--child-suite', help=argparse.SUPPRESS)
+    parser.add_argument('--child-size', type=int, help=argparse.SUPPRESS)
+    parser.add_argument('--child-imports', choices=list(IMPORT_VARIANTS), help=argparse.SUPPRESS)
+    return parser
+
+
+def main(argv=None):
+    """Run all benchmarks and write the results; returns the exit code"""
+    args = build_parser().parse_args(argv)
+    gui = not args.no_gui
+
+    if args.child_startup:
+        print(json.dumps(child_startup(Path(args.child_startup), gui)))
+        return 0
+    if args.child_imports:
+        print(json.dumps(child_imports(args.child_imports)))
+        return 0
+    if args.child_suite:
+        print(json.dumps(child_suite(Path(args.child_suite), args.child_size, args.repeat, gui)))
+        return 0
+
+    display = start_virtual_display() if gui else None
+    if gui and not has_display():
+        print("No display available (set DISPLAY or install Xvfb); running only headless benchmarks",
+              file=sys.stderr)
+        gui = False
+
+    stub = start_stub_server()
+    stub_url = f"http://127.0.0.1:{stub.server_port}"
+    results = bench_imports(args.startup_repeat) if args.imports else []
+    try:
+        with tempfile.TemporaryDirectory(prefix="launcher_bench_") as scratch:
+            for size in args.sizes:
+                print(f"Benchmarking {size} items...", file=sys.stderr)
+                app_dir = prepare_app_dir(scratch, size, stub_url, sharded=args.sharded)
+                results.extend(bench_startup(app_dir, size, args.startup_repeat, gui))
+                child_args = ['--child-suite', str(app_dir), '--child-size', str(size),
+                              '--repeat', str(args.repeat)]
+                results.extend(run_child(child_args + ([] if gui else ['--no-gui'])))
+    finally:
+        stub.shutdown()
+        if display is not None:
+            display.terminate()
+
+    report = {
+        'meta': {
+            'created': datetime.now().isoformat(timespec='seconds'),
+            'revision': git_revision(),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'hostname': socket.gethostname(),
+            'gui': gui,
+            'sharded': args.sharded,
+            'repeat': args.repeat,
+        },
+        'results': results,
+    }
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2)
+
+    for record in results:
+        unit = record_unit(record)
+        print(f"{record['benchmark']:<34}{record['items']:>7} items  "
+              f"p50 {record[f'p50_{unit}']:>9.2f} {unit}  p95 {record[f'p95_{unit}']:>9.2f} {unit}")
+    print(f"Results written to {args.output}")
+
+    if args.baseline:
+        return 1 if compare(results, args.baseline, args.tolerance) else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,174 @@
+"""
+Isolated browser profiles for the Informatica Quick Launcher
+With "launch_mode": "isolated_profiles" every environment opens in its own
+persistent browser profile, so each keeps its own Okta session
+"""
+import os
+import platform
+import re
+import shutil
+import subprocess
+from pathlib import Path
+from launch_dispatcher import LaunchError
+from shared_state import user_data_dir
+
+
+LAUNCH_MODE = 'isolated_profiles'
+
+# Browsers tried, in order, when 'browser' is "auto"
+AUTO_BROWSERS = ('chrome', 'edge', 'chromium', 'firefox')
+
+# Executable names looked up on PATH (Linux and others)
+PATH_NAMES = {
+    'chrome': ('google-chrome', 'google-chrome-stable', 'chrome'),
+    'edge': ('microsoft-edge', 'microsoft-edge-stable', 'msedge'),
+    'chromium': ('chromium', 'chromium-browser'),
+    'firefox': ('firefox',),
+}
+
+# Install locations relative to the Windows program folders
+WINDOWS_PATHS = {
+    'chrome': r"Google\Chrome\Application\chrome.exe",
+    'edge': r"Microsoft\Edge\Application\msedge.exe",
+    'chromium': r"Chromium\Application\chrome.exe",
+    'firefox': r"Mozilla Firefox\firefox.exe",
+}
+
+MACOS_PATHS = {
+    'chrome': "/Applications/Google Chrome.app/Contents/MacOS/Google Chrome",
+    'edge': "/Applications/Microsoft Edge.app/Contents/MacOS/Microsoft Edge",
+    'chromium': "/Applications/Chromium.app/Contents/MacOS/Chromium",
+    'firefox': "/Applications/Firefox.app/Contents/MacOS/firefox",
+}
+
+
+def find_browser(name):
+    """Return the executable of a browser by name, or None if it is not installed"""
+    candidates = []
+    system = platform.system()
+    if system == 'Windows':
+        for variable in ('ProgramFiles', 'ProgramFiles(x86)', 'LocalAppData'):
+            folder = os.environ.get(variable)
+            if folder and name in WINDOWS_PATHS:
+                candidates.append(Path(folder) / WINDOWS_PATHS[name])
+    elif system == 'Darwin' and name in MACOS_PATHS:
+        candidates.append(Path(MACOS_PATHS[name]))
+
+    for candidate in candidates:
+        if candidate.exists():
+            return str(candidate)
+    for executable in PATH_NAMES.get(name, ()):
+        found = shutil.which(executable)
+        if found:
+            return found
+    return None
+
+
+def default_profile_root():
+    """Return the per-user local folder for profiles; never the launcher's (possibly shared) folder"""
+    return user_data_dir() / "profiles"
+
+
+def profile_name(item):
+    """Return the profile an item opens in: its 'profile', else its type, else its shortName"""
+    if item.get('profile'):
+        return item['profile']
+    if item.get('type', 'default') != 'default':
+        return item['type']
+    return item.get('shortName') or item.get('name', 'default')
+
+
+class BrowserProfiles:
+    """Starts the browser with a dedicated user data directory per profile name"""
+
+    def __init__(self, profile_root, browser='auto'):
+        self.profile_root = Path(profile_root)
+        self.browser = browser
+        self.executable = None
+        self.kind = None
+
+    @classmethod
+    def from_config(cls, config):
+        """Create profiles for the 'isolated_profiles' launch mode, or None for the default browser.
+
+        Profiles hold Okta session cookies, so by default they live in the user's
+        own local folder even when the launcher runs from a shared drive.
+        """
+        if config.get('launch_mode', 'default') != LAUNCH_MODE:
+            return None
+        settings = config.get('browser_profiles', {})
+        profile_root = settings.get('profile_root')
+        return cls(
+            Path(profile_root).expanduser() if profile_root else default_profile_root(),
+            browser=settings.get('browser', 'auto')
+        )
+
+    def resolve(self):
+        """Find the browser executable once and remember whether it is Firefox"""
+        if self.executable:
+            return self.executable
+
+        if self.browser == 'auto':
+            names = AUTO_BROWSERS
+        elif self.browser in PATH_NAMES:
+            names = (self.browser,)
+        else:
+            # An explicit path to the browser executable
+            if not Path(self.browser).exists():
+                raise LaunchError(f"Browser not found: {self.browser}")
+            self.executable = self.browser
+            self.kind = 'firefox' if 'firefox' in Path(self.browser).name.lower() else 'chromium'
+            return self.executable
+
+        for name in names:
+            executable = find_browser(name)
+            if executable:
+                self.executable = executable
+                self.kind = 'firefox' if name == 'firefox' else 'chromium'
+                return executable
+        raise LaunchError(
+            "No supported browser found for isolated profiles (Chrome, Edge, Chromium or Firefox)"
+        )
+
+    def profile_dir(self, name):
+        """Return the persistent data directory for a profile name"""
+        safe_name = re.sub(r'[^A-Za-z0-9_.-]+', '_', name).strip('_').lower() or 'default'
+        return self.profile_root / safe_name
+
+    def build_command(self, url, name):
+        """Return the command line opening url in the named profile"""
+        executable = self.resolve()
+        directory = self.profile_dir(name)
+        if self.kind == 'firefox':
+            return [executable, '-profile', str(directory), '-new-tab', url]
+        return [
+            executable,
+            f"--user-data-dir={directory}",
+            '--no-first-run',
+            '--no-default-browser-check',
+            url,
+        ]
+
+    def open_item(self, url, item):
+        """Open url in the profile of a config item"""
+        self.open(url, profile_name(item))
+
+    def open(self, url, name):
+        """Open url in the named profile without waiting for the browser (runs on a worker thread)"""
+        command = self.build_command(url, name)
+        self.profile_dir(name).mkdir(parents=True, exist_ok=True)
+
+        options = {
+            'stdin': subprocess.DEVNULL,
+            'stdout': subprocess.DEVNULL,
+            'stderr': subprocess.DEVNULL,
+            'close_fds': True,
+        }
+        if platform.system() == 'Windows':
+            options['creationflags'] = subprocess.DETACHED_PROCESS | subprocess.CREATE_NEW_PROCESS_GROUP
+        else:
+            options['start_new_session'] = True
+        try:
+            subprocess.Popen(command, **options)
+        except OSError as e:
+            raise LaunchError(f"Could not start {Path(command[0]).name}: {e}")
@@ -0,0 +1,221 @@
+"""
+Self-check for the launcher's health probes
+Starts a local stub server with endpoints that are up, slow, failing (HTTP
+500), hanging past the probe timeout and rejecting HEAD with 405, then checks
+the status HealthProber reports for each, that a URL is not probed again
+within the check interval and that results expire after the TTL
+
+Usage:
+    python check_health_probe.py
+
+Exits with 1 when any check fails.
+"""
+import socket
+import sys
+import threading
+import time
+from collections import Counter
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from health_probe import HealthProber
+
+
+# Probe settings, scaled down so the whole check runs in a few seconds
+TIMEOUT = 0.5
+SLOW_MS = 150
+INTERVAL = 1.0
+TTL = 2.0
+
+# How long the stub takes to answer the slow and hanging endpoints
+SLOW_DELAY = 0.3
+HANG_DELAY = 2.0
+
+# Endpoint -> (expected status, expected detail)
+EXPECTED = {
+    '/up': ('up', "HTTP 200"),
+    '/slow': ('slow', "HTTP 200"),
+    '/fail': ('down', "HTTP 500"),
+    '/hang': ('down', "timed out"),
+    '/head405': ('up', "HTTP 200"),
+    '/redirect': ('up', "HTTP 302"),
+}
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    """Answers HEAD and GET like the kinds of environments the launcher probes"""
+
+    hits = Counter()
+
+    def do_HEAD(self):
+        self.respond(head=True)
+
+    def do_GET(self):
+        self.respond(head=False)
+
+    def respond(self, head):
+        self.hits[(self.command, self.path)] += 1
+        try:
+            if self.path == '/slow':
+                time.sleep(SLOW_DELAY)
+            elif self.path == '/hang':
+                time.sleep(HANG_DELAY)
+
+            if self.path == '/fail':
+                self.send_response(500)
+            elif self.path == '/head405' and head:
+                self.send_response(405)
+                self.send_header('Allow', 'GET')
+            elif self.path == '/redirect':
+                self.send_response(302)
+                self.send_header('Location', '/login')
+            elif self.path in EXPECTED:
+                self.send_response(200)
+            else:
+                self.send_response(404)
+            body = b"" if head else b"ok"
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+        except (BrokenPipeError, ConnectionResetError):
+            pass  # The probe gave up waiting
+
+    def log_message(self, format, *args):
+        pass
+
+
+class FakeRoot:
+    """Stands in for the Tk root: runs after() callbacks when pump() is called"""
+
+    def __init__(self):
+        self.timers = []
+
+    def after(self, delay_ms, callback):
+        self.timers.append((time.monotonic() + delay_ms / 1000, callback))
+
+    def pump(self, until, timeout):
+        """Run due callbacks until until() is true or timeout seconds pass; returns until()"""
+        deadline = time.monotonic() + timeout
+        while not until() and time.monotonic() < deadline:
+            now = time.monotonic()
+            due = [timer for timer in self.timers if timer[0] <= now]
+            self.timers = [timer for timer in self.timers if timer[0] > now]
+            for _, callback in due:
+                callback()
+            time.sleep(0.01)
+        return until()
+
+
+def unused_port():
+    """Return a local port with nothing listening on it"""
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+def check_statuses(prober, root, base_url):
+    """Probe every endpoint once (twice in a row) and compare the results; returns problems"""
+    urls = [base_url + path for path in EXPECTED]
+    refused_url = f"http://127.0.0.1:{unused_port()}/"
+    results = {}
+
+    def on_result(url, result):
+        results.setdefault(url, []).append(result)
+
+    prober.check(urls + [refused_url], on_result)
+    # A second check while the first probes are in flight must not probe again
+    prober.check(urls + [refused_url], on_result)
+    root.pump(lambda: len(results) == len(urls) + 1, timeout=TIMEOUT * 4)
+
+    problems = []
+    for path, (status, detail) in EXPECTED.items():
+        got = results.get(base_url + path)
+        if not got:
+            problems.append(f"{path}: no result")
+            continue
+        if len(got) != 1:
+            problems.append(f"{path}: {len(got)} results for one check")
+        if (got[0].status, got[0].detail) != (status, detail):
+            problems.append(f"{path}: {got[0].status} ({got[0].detail}), expected {status} ({detail})")
+        if status != 'down' and got[0].latency_ms is None:
+            problems.append(f"{path}: no latency")
+    refused = results.get(refused_url)
+    if not refused or refused[0].status != 'down' or refused[0].latency_ms is not None:
+        problems.append(f"refused connection: {refused}")
+
+    if StubHandler.hits[('HEAD', '/head405')] != 1 or StubHandler.hits[('GET', '/head405')] != 1:
+        problems.append("/head405: expected one HEAD and one GET fallback")
+    if StubHandler.hits[('GET', '/up')]:
+        problems.append("/up: probed with GET although HEAD worked")
+    if any(hits != 1 for (method, _), hits in StubHandler.hits.items() if method == 'HEAD'):
+        problems.append(f"in-flight URLs were probed again: {dict(StubHandler.hits)}")
+    return problems
+
+
+def check_interval(prober, root, base_url):
+    """Checks within the interval use the cache; after it, URLs are probed again; returns problems"""
+    problems = []
+    results = []
+    up_url = base_url + '/up'
+    before = StubHandler.hits[('HEAD', '/up')]
+    cached = prober.get(up_url)
+    if cached is None:
+        return ["/up: no cached result from the first round"]
+
+    prober.check([up_url], lambda url, result: results.append(result))
+    root.pump(lambda: False, timeout=0.2)
+    if results or StubHandler.hits[('HEAD', '/up')] != before:
+        problems.append("probed again within the interval")
+
+    time.sleep(max(0.0, cached.checked_at + INTERVAL - time.time()) + 0.05)
+    prober.check([up_url], lambda url, result: results.append(result))
+    if not root.pump(lambda: results, timeout=TIMEOUT * 2):
+        problems.append("not probed again after the interval")
+    elif StubHandler.hits[('HEAD', '/up')] != before + 1:
+        problems.append(f"expected one new probe after the interval, saw {StubHandler.hits[('HEAD', '/up')] - before}")
+    return problems
+
+
+def check_ttl(prober, base_url):
+    """Results are served until they are TTL seconds old, then dropped; returns problems"""
+    problems = []
+    fail_url = base_url + '/fail'
+    up_url = base_url + '/up'
+    cached = prober.get(fail_url)
+    if cached is None:
+        return ["/fail: fresh result not served"]
+
+    # /fail was last probed in the first round, /up just now in the interval check
+    time.sleep(max(0.0, cached.checked_at + TTL - time.time()) + 0.05)
+    if prober.get(fail_url) is not None:
+        problems.append("/fail: result served after the TTL")
+    if prober.get(up_url) is None:
+        problems.append("/up: result dropped before the TTL")
+    return problems
+
+
+def main():
+    """Run the checks against a local stub server; returns the exit code"""
+    server = ThreadingHTTPServer(('127.0.0.1', 0), StubHandler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base_url = f"http://127.0.0.1:{server.server_address[1]}"
+
+    root = FakeRoot()
+    prober = HealthProber(root, interval=INTERVAL, ttl=TTL, timeout=TIMEOUT, slow_ms=SLOW_MS, poll_interval_ms=10)
+    failures = 0
+    try:
+        for name, run in (
+            ('statuses', lambda: check_statuses(prober, root, base_url)),
+            ('interval', lambda: check_interval(prober, root, base_url)),
+            ('ttl', lambda: check_ttl(prober, base_url)),
+        ):
+            problems = run()
+            print(f"{name:<10}{'ok' if not problems else 'FAILED: ' + '; '.join(problems)}")
+            failures += bool(problems)
+    finally:
+        prober.shutdown()
+        server.shutdown()
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
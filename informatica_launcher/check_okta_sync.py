@@ -0,0 +1,164 @@
+"""
+Self-check for the Okta dashboard sync
+Serves app links with okta_standin's handler, then checks that the first sync
+gets a full response, the next one a 304 without rewriting the cache, that a
+changed list is fetched again, and how the config compiler merges the cached
+apps into the tabs (rules, exclusions, default tab, duplicates, skipped apps)
+
+Usage:
+    python check_okta_sync.py
+
+Exits with 1 when any check fails.
+"""
+import json
+import sys
+import tempfile
+import threading
+from http.server import ThreadingHTTPServer
+from pathlib import Path
+from config_compiler import compile_config, ConfigError
+from http_client import HttpClient
+from okta_standin import StandInHandler
+from okta_sync import APPS_PATH, OktaSync, read_cache
+from shared_state import user_data_dir
+
+
+FIRST_APPS = [
+    {"label": "Informatica MDM Dev", "appName": "salesforce_informaticamdmdev_1",
+     "linkUrl": "https://example.okta.com/home/salesforce_informaticamdmdev_1/0oa1/aln1", "sortOrder": 0},
+    {"label": "Optum HSA", "appName": "bookmark",
+     "linkUrl": "https://example.okta.com/home/bookmark/0oa2/2557", "sortOrder": 1},
+    {"label": "Slack", "appName": "slack", "linkUrl": "https://example.okta.com/home/slack/0oa3/1", "sortOrder": 2},
+]
+
+# The dashboard after a change: a new app for the default tab, one already configured
+# by hand (host in another case, trailing slash), a hidden one and one with a bad link
+CHANGED_APPS = FIRST_APPS + [
+    {"label": "Payroll", "appName": "bookmark", "linkUrl": "https://example.okta.com/home/bookmark/0oa4/9", "sortOrder": 3},
+    {"label": "Team Wiki", "appName": "bookmark", "linkUrl": "https://Wiki.Example.com/", "sortOrder": 4},
+    {"label": "Old Portal", "appName": "bookmark", "linkUrl": "https://old.example.com", "sortOrder": 5, "hidden": True},
+    {"label": "File Share", "appName": "bookmark", "linkUrl": "ftp://files.example.com", "sortOrder": 6},
+]
+
+CONFIG = {
+    "categories": {
+        "Informatica": [{"name": "Informatica QA", "shortName": "QA", "url": "https://qa.example.com", "type": "qa"}],
+        "Apps": [{"name": "Wiki", "url": "https://wiki.example.com"}],
+    },
+    "okta_sync": {
+        "rules": [
+            {"match": "slack", "exclude": True},
+            {"match": "informaticamdm", "field": "appName", "category": "Informatica", "type": "dev"},
+            {"match": "hsa", "category": "Apps"},
+        ],
+        "default_category": "Okta",
+    },
+}
+
+# Tab -> item names expected after merging CHANGED_APPS into CONFIG
+EXPECTED_TABS = {
+    'Informatica': ['Informatica QA', 'Informatica MDM Dev'],
+    'Apps': ['Wiki', 'Optum HSA'],
+    'Okta': ['Payroll'],
+}
+
+
+class QuietHandler(StandInHandler):
+    """The stand-in handler without its request log"""
+
+    def log_message(self, format, *args):
+        pass
+
+
+def check_conditional(sync, apps_path):
+    """200, then 304 without touching the cache, then 200 for a changed list; returns problems"""
+    problems = []
+    count = sync.sync()
+    if count != len(FIRST_APPS) or QuietHandler.counts != {'200': 1, '304': 0}:
+        problems.append(f"first sync: {count} apps, responses {QuietHandler.counts}")
+    cache = read_cache(sync.cache_path)
+    if not cache.get('etag') or len(cache.get('apps', [])) != len(FIRST_APPS):
+        problems.append(f"first sync: cache holds {len(cache.get('apps', []))} apps, etag {cache.get('etag')}")
+
+    stamp = sync.cache_path.stat().st_mtime_ns
+    count = sync.sync()
+    if count is not None or QuietHandler.counts != {'200': 1, '304': 1}:
+        problems.append(f"unchanged sync: {count} apps, responses {QuietHandler.counts}")
+    if sync.cache_path.stat().st_mtime_ns != stamp:
+        problems.append("unchanged sync rewrote the cache")
+
+    apps_path.write_text(json.dumps(CHANGED_APPS), encoding='utf-8')
+    count = sync.sync()
+    if count != len(CHANGED_APPS) or QuietHandler.counts != {'200': 2, '304': 1}:
+        problems.append(f"changed sync: {count} apps, responses {QuietHandler.counts}")
+    if read_cache(sync.cache_path).get('etag') == cache.get('etag'):
+        problems.append("changed sync kept the old etag")
+    return problems
+
+
+def check_location(sync, app_dir):
+    """The cache is kept in the user's own folder, not next to config.json; returns problems"""
+    if sync.cache_path.parent != user_data_dir() or app_dir in sync.cache_path.parents:
+        return [f"cache stored at {sync.cache_path}"]
+    return []
+
+
+def check_merge(config_path):
+    """The cached apps land in the right tabs after the hand-written items; returns problems"""
+    try:
+        config = compile_config(config_path, config_path.parent / ".config_snapshot.bin")
+    except ConfigError as e:
+        return [f"config rejected: {e}"]
+
+    problems = []
+    tabs = {name: [item['name'] for item in items] for name, items in config['categories'].items()}
+    if tabs != EXPECTED_TABS:
+        problems.append(f"tabs {tabs}, expected {EXPECTED_TABS}")
+    synced = {item['name']: item for items in config['categories'].values() for item in items
+              if item.get('source') == 'okta'}
+    if synced.get('Informatica MDM Dev', {}).get('type') != 'dev':
+        problems.append("the matching rule's type was not applied")
+    if len(config['synced_errors']) != 1 or 'File Share' not in config['synced_errors'][0]:
+        problems.append(f"expected one skipped app (File Share), got {config['synced_errors']}")
+    return problems
+
+
+def main():
+    """Run the checks against a local stand-in; returns the exit code"""
+    with tempfile.TemporaryDirectory() as folder:
+        app_dir = Path(folder).resolve()
+        apps_path = app_dir / "apps.json"
+        apps_path.write_text(json.dumps(FIRST_APPS), encoding='utf-8')
+        QuietHandler.apps_path = apps_path
+        QuietHandler.counts = {'200': 0, '304': 0}
+
+        server = ThreadingHTTPServer(('127.0.0.1', 0), QuietHandler)
+        server.daemon_threads = True
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+
+        config = dict(CONFIG)
+        config['okta_sync'] = dict(CONFIG['okta_sync'], apps_url=f"http://127.0.0.1:{server.server_address[1]}/{APPS_PATH}")
+        config_path = app_dir / "config.json"
+        config_path.write_text(json.dumps(config), encoding='utf-8')
+
+        http = HttpClient(app_dir / "http_state.json", retries=0)
+        sync = OktaSync.from_config(app_dir, config, http)
+        failures = 0
+        try:
+            for name, run in (
+                ('sync', lambda: check_conditional(sync, apps_path)),
+                ('location', lambda: check_location(sync, app_dir)),
+                ('merge', lambda: check_merge(config_path)),
+            ):
+                problems = run()
+                print(f"{name:<10}{'ok' if not problems else 'FAILED: ' + '; '.join(problems)}")
+                failures += bool(problems)
+        finally:
+            server.shutdown()
+            http.close()
+            sync.cache_path.unlink(missing_ok=True)
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
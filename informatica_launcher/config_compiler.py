@@ -0,0 +1,590 @@
+"""
+Config compiler for the Informatica Quick Launcher
+Validates config.json, normalizes old and new formats into one shape and
+caches the result in a binary snapshot keyed by the source file's hash
+"""
+import hashlib
+import json
+import marshal
+import os
+import re
+import sys
+import threading
+from pathlib import Path
+from okta_sync import (
+    cache_path as okta_cache_path, sync_settings, validate_sync_settings, map_apps,
+    merge_items, read_cache, url_key
+)
+from shared_state import replace_atomically
+
+
+# Bump when the normalized shape changes so old snapshots are ignored
+SNAPSHOT_VERSION = 6
+
+# Top-level keys and the types they must have
+TOP_LEVEL_SCHEMA = {
+    'okta_domain': str,
+    'okta_logout_url': str,
+    'launch_mode': str,
+    'quiz_api_url': str,
+    'categories': dict,
+    'environments': list,
+    'access_log': dict,
+    'frequent_tab': (dict, bool),
+    'http': dict,
+    'launch_sets': dict,
+    'single_instance': bool,
+    'keep_resident': bool,
+    'health_check': (dict, bool),
+    'browser_profiles': dict,
+    'category_files': dict,
+    'okta_sync': (dict, bool),
+}
+
+# Accepted values of 'launch_mode'
+LAUNCH_MODES = ('default', 'isolated_profiles')
+
+
+def is_bool(value):
+    """Check for true or false"""
+    return isinstance(value, bool)
+
+
+def is_positive_number(value):
+    """Check for a number above zero (not a bool)"""
+    return isinstance(value, (int, float)) and not isinstance(value, bool) and value > 0
+
+
+def is_positive_int(value):
+    """Check for a whole number above zero (not a bool)"""
+    return isinstance(value, int) and not isinstance(value, bool) and value > 0
+
+
+def is_non_negative_number(value):
+    """Check for a number of zero or more (not a bool)"""
+    return isinstance(value, (int, float)) and not isinstance(value, bool) and value >= 0
+
+
+def is_non_negative_int(value):
+    """Check for a whole number of zero or more (not a bool)"""
+    return isinstance(value, int) and not isinstance(value, bool) and value >= 0
+
+
+def is_non_empty_str(value):
+    """Check for a string that is not empty"""
+    return isinstance(value, str) and bool(value.strip())
+
+
+def one_of(*values):
+    """Return a check that accepts only the given values"""
+    return lambda value: value in values
+
+
+# Settings sections, with a check and its description for each key
+SECTION_SCHEMA = {
+    'http': {
+        'connect_timeout': (is_positive_number, "a positive number"),
+        'read_timeout': (is_positive_number, "a positive number"),
+        'retries': (is_non_negative_int, "a whole number of 0 or more"),
+        'cooldown_seconds': (is_non_negative_number, "a number of 0 or more"),
+    },
+    'access_log': {
+        'format': (one_of('text', 'jsonl'), '"text" or "jsonl"'),
+        'max_bytes': (is_non_negative_int, "a whole number of 0 or more"),
+        'backup_count': (is_non_negative_int, "a whole number of 0 or more"),
+    },
+    'frequent_tab': {
+        'limit': (is_positive_int, "a positive whole number"),
+        'order': (one_of('most_used', 'recent'), '"most_used" or "recent"'),
+    },
+    'browser_profiles': {
+        'profile_root': (is_non_empty_str, "a folder path"),
+        'browser': (is_non_empty_str, '"auto", a browser name or the path to a browser'),
+    },
+    'health_check': {
+        'enabled': (is_bool, "true or false"),
+        'interval_seconds': (is_positive_number, "a positive number"),
+        'ttl_seconds': (is_positive_number, "a positive number"),
+        'max_concurrency': (is_positive_int, "a positive whole number"),
+        'timeout_seconds': (is_positive_number, "a positive number"),
+        'slow_ms': (is_positive_number, "a positive number"),
+    },
+}
+
+# Item keys, their types and whether they are required
+ITEM_SCHEMA = {
+    'name': (str, True),
+    'url': (str, True),
+    'shortName': (str, False),
+    'type': (str, False),
+    'description': (str, False),
+    'icon': (str, False),
+    'pinned': (bool, False),
+    'health_url': (str, False),
+    'profile': (str, False),
+}
+
+
+class ConfigError(Exception):
+    """Raised with every problem found in config.json"""
+
+    def __init__(self, errors):
+        self.errors = list(errors)
+        super().__init__("\n".join(self.errors))
+
+
+def type_name(expected):
+    """Return a readable name for a type or tuple of types"""
+    if isinstance(expected, tuple):
+        return " or ".join(t.__name__ for t in expected)
+    return expected.__name__
+
+
+def validate_section(section, settings):
+    """Return the problems of one settings section, like 'health_check'"""
+    return [
+        f"{section}.{key} must be {description}"
+        for key, (check, description) in SECTION_SCHEMA[section].items()
+        if key in settings and not check(settings[key])
+    ]
+
+
+def validate(raw):
+    """Return a list of all schema problems in a parsed config"""
+    if not isinstance(raw, dict):
+        return ["The top level of config.json must be an object"]
+
+    errors = []
+    for key, expected in TOP_LEVEL_SCHEMA.items():
+        if key in raw and not isinstance(raw[key], expected):
+            errors.append(f"'{key}' must be of type {type_name(expected)}")
+
+    for section in SECTION_SCHEMA:
+        if isinstance(raw.get(section), dict):
+            errors.extend(validate_section(section, raw[section]))
+
+    launch_mode = raw.get('launch_mode', 'default')
+    if isinstance(launch_mode, str) and launch_mode not in LAUNCH_MODES:
+        errors.append(f"'launch_mode' must be one of: {', '.join(LAUNCH_MODES)}")
+
+    categories = raw.get('categories')
+    if isinstance(categories, dict) and categories:
+        for category_name, items in categories.items():
+            if not isinstance(items, list):
+                errors.append(f"categories.{category_name} must be a list of items")
+                continue
+            for index, item in enumerate(items):
+                errors.extend(validate_item(item, f"categories.{category_name}[{index}]"))
+    elif isinstance(raw.get('environments'), list):
+        for index, item in enumerate(raw['environments']):
+            errors.extend(validate_item(item, f"environments[{index}]"))
+    elif not isinstance(categories, dict) and 'environments' not in raw and 'category_files' not in raw:
+        errors.append("config.json must define 'categories'")
+
+    category_files = raw.get('category_files')
+    if isinstance(category_files, dict):
+        for category_name, file_name in category_files.items():
+            if not isinstance(file_name, str) or not file_name:
+                errors.append(f"category_files.{category_name} must be a file name")
+            elif isinstance(categories, dict) and category_name in categories:
+                errors.append(f"category_files.{category_name} is also defined in 'categories'")
+
+    if isinstance(raw.get('okta_sync'), dict):
+        errors.extend(validate_sync_settings(raw['okta_sync']))
+
+    return errors
+
+
+def validate_item(item, location):
+    """Return the schema problems of a single item"""
+    if not isinstance(item, dict):
+        return [f"{location} must be an object"]
+
+    errors = []
+    for key, (expected, required) in ITEM_SCHEMA.items():
+        if key not in item:
+            if required:
+                errors.append(f"{location}: missing '{key}'")
+        elif not isinstance(item[key], expected):
+            errors.append(f"{location}: '{key}' must be of type {type_name(expected)}")
+
+    url = item.get('url')
+    if isinstance(url, str) and url and not url.startswith(('http://', 'https://')):
+        errors.append(f"{location}: 'url' must start with http:// or https://")
+    elif url == '':
+        errors.append(f"{location}: 'url' is empty")
+
+    health_url = item.get('health_url')
+    if isinstance(health_url, str) and not health_url.startswith(('http://', 'https://')):
+        errors.append(f"{location}: 'health_url' must start with http:// or https://")
+
+    return errors
+
+
+def normalize_item(item, base_dir):
+    """Fill item defaults and resolve its icon path"""
+    name = item['name']
+    normalized = dict(item)
+    normalized['shortName'] = item.get('shortName', name)
+    normalized['type'] = item.get('type', 'default')
+    normalized['description'] = item.get('description', '')
+    normalized['pinned'] = item.get('pinned', False)
+    normalized['icon_path'] = str(base_dir / item['icon']) if item.get('icon') else None
+    return normalized
+
+
+def normalize(raw, base_dir):
+    """Convert either config format into the single 'categories' shape"""
+    config = {key: value for key, value in raw.items() if key not in ('categories', 'environments')}
+    config['base_dir'] = str(base_dir)
+    config['category_files'] = {
+        category_name: str(base_dir / file_name)
+        for category_name, file_name in raw.get('category_files', {}).items()
+    }
+
+    categories = raw.get('categories')
+    if not categories and not config['category_files']:
+        # Fallback to old format
+        categories = {'Informatica': raw.get('environments', [])}
+    categories = categories or {}
+
+    config['categories'] = {
+        category_name: [normalize_item(item, base_dir) for item in items]
+        for category_name, items in categories.items()
+    }
+    return config
+
+
+def merge_synced_apps(config, synced_path, synced_stamp):
+    """Add the apps cached by the Okta sync to their categories, skipping URLs configured by hand"""
+    config['synced_path'] = None
+    config['synced_stamp'] = None
+    config['synced_items'] = {}
+    config['synced_errors'] = []
+    settings = sync_settings(config)
+    if settings is None:
+        return
+
+    # Remembered so that a new sync result triggers a reload (CategoryStore.files_changed)
+    config['synced_path'] = str(synced_path)
+    config['synced_stamp'] = synced_stamp
+    base_dir = Path(config['base_dir'])
+    known_urls = {url_key(item['url']) for items in config['categories'].values() for item in items}
+    for category_name, items in map_apps(read_cache(synced_path).get('apps', []), settings).items():
+        # Synced apps get the same checks as hand-written items; a bad one is skipped, not fatal
+        valid = []
+        for item in items:
+            problems = validate_item(item, f"Okta app {item['name']!r}")
+            if problems:
+                print(f"Skipping Okta app: {'; '.join(problems)}")
+                config['synced_errors'].extend(problems)
+            else:
+                valid.append(normalize_item(item, base_dir))
+        items = valid
+        if category_name in config['category_files']:
+            # Merged when the category file is read
+            config['synced_items'][category_name] = items
+        else:
+            config['categories'][category_name] = merge_items(
+                config['categories'].get(category_name, []), items, known_urls
+            )
+
+
+def build_lookup(categories):
+    """Map lower-cased shortName and name to [category, index]; the first occurrence wins"""
+    lookup = {}
+    for category_name, items in categories.items():
+        for index, item in enumerate(items):
+            for key in (item['shortName'], item['name']):
+                lookup.setdefault(key.lower(), [category_name, index])
+    return lookup
+
+
+def find_item(config, reference):
+    """Return the item whose shortName or name matches reference, or None"""
+    location = config.get('lookup', {}).get(reference.lower())
+    if location is None:
+        return None
+    category_name, index = location
+    return config['categories'][category_name][index]
+
+
+def raw_reference_problems(raw, synced_path):
+    """Return launch set problems in a config that has other errors, so all are reported at once"""
+    launch_sets = raw.get('launch_sets')
+    if not isinstance(launch_sets, dict):
+        return []
+
+    # Names an item can be referenced by, as build_lookup would index them
+    names = set()
+    categories = raw.get('categories')
+    groups = list(categories.values()) if isinstance(categories, dict) else [raw.get('environments')]
+    for items in groups:
+        for item in items if isinstance(items, list) else []:
+            if isinstance(item, dict):
+                names.update(item[key].lower() for key in ('name', 'shortName') if isinstance(item.get(key), str))
+    settings = sync_settings(raw)
+    if settings is not None:
+        try:
+            for items in map_apps(read_cache(synced_path).get('apps', []), settings).values():
+                names.update(item['name'].lower() for item in items if isinstance(item['name'], str))
+        except (re.error, TypeError, KeyError, AttributeError):
+            names = None  # The sync rules are invalid themselves (reported by validate)
+
+    errors = check_launch_sets({'launch_sets': launch_sets})
+    if names is None or 'category_files' in raw:
+        return errors  # Items in category files are only checked once the config is valid
+    for set_name, references in launch_sets.items():
+        if isinstance(references, list) and all(isinstance(ref, str) for ref in references):
+            errors.extend(
+                f"launch_sets.{set_name}: no item named '{reference}'"
+                for reference in references if reference.lower() not in names
+            )
+    return errors
+
+
+def check_launch_sets(config):
+    """Return the launch sets that are not lists of item names"""
+    return [
+        f"launch_sets.{set_name} must be a list of item names"
+        for set_name, references in config.get('launch_sets', {}).items()
+        if not isinstance(references, list) or not all(isinstance(ref, str) for ref in references)
+    ]
+
+
+def resolve_launch_sets(config, find=None):
+    """Replace launch set references with their items; return unresolved references"""
+    find = find or (lambda reference: find_item(config, reference))
+    errors = []
+    resolved = {}
+    for set_name, references in config.get('launch_sets', {}).items():
+        if not isinstance(references, list) or not all(isinstance(ref, str) for ref in references):
+            errors.append(f"launch_sets.{set_name} must be a list of item names")
+            continue
+        items = []
+        for reference in references:
+            item = find(reference)
+            if item is None:
+                errors.append(f"launch_sets.{set_name}: no item named '{reference}'")
+            else:
+                items.append(item)
+        resolved[set_name] = items
+    config['launch_sets'] = resolved
+    return errors
+
+
+def compile_config(config_path, snapshot_path):
+    """Return the normalized config, loading the snapshot when the source is unchanged"""
+    config_path = Path(config_path)
+    snapshot_path = Path(snapshot_path)
+
+    try:
+        source = config_path.read_bytes()
+    except FileNotFoundError:
+        raise ConfigError([f"Config file not found: {config_path}\n\nPlease create config.json"])
+    digest = hashlib.sha256(source).hexdigest()
+    # Apps from the Okta sync are merged in, so the snapshot also depends on this user's cache file
+    synced_path = okta_cache_path(config_path.parent)
+    synced_stamp = file_stamp(synced_path)
+    snapshot_key = (SNAPSHOT_VERSION, sys.version_info[:2], str(config_path.resolve()), digest,
+                    str(synced_path), synced_stamp)
+
+    # Warm start: the snapshot matches the source byte for byte
+    try:
+        # marshal.loads on the whole file; marshal.load on a file object reads it in tiny chunks
+        snapshot = marshal.loads(snapshot_path.read_bytes())
+        if snapshot.get('key') == list(snapshot_key):
+            return snapshot['config']
+    except (OSError, EOFError, ValueError, TypeError, AttributeError):
+        pass
+
+    try:
+        raw = json.loads(source.decode('utf-8-sig'))
+    except (ValueError, UnicodeDecodeError) as e:
+        raise ConfigError([f"Invalid JSON in config.json:\n{e}"])
+
+    errors = validate(raw)
+    if errors:
+        raise ConfigError(errors + raw_reference_problems(raw, synced_path))
+
+    config = normalize(raw, config_path.parent.resolve())
+    merge_synced_apps(config, synced_path, synced_stamp)
+    config['lookup'] = build_lookup(config['categories'])
+    if config['category_files']:
+        # Items in category files are not read yet; CategoryStore resolves the sets on demand
+        errors = check_launch_sets(config)
+    else:
+        errors = resolve_launch_sets(config)
+    if errors:
+        raise ConfigError(errors)
+
+    write_snapshot(snapshot_path, {'key': list(snapshot_key), 'config': config})
+    return config
+
+
+def write_snapshot(snapshot_path, snapshot):
+    """Write the compiled snapshot atomically (launchers sharing a folder each use their own temp file)"""
+    try:
+        replace_atomically(snapshot_path, marshal.dumps(snapshot))
+    except Exception as e:
+        print(f"Could not write config snapshot: {e}")
+
+
+def file_stamp(path):
+    """Return a cheap (mtime, size) fingerprint of a file, or None if it is missing"""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size)
+
+
+def load_category_file(path, category_name, base_dir):
+    """Read, validate and normalize the items of one category file"""
+    path = Path(path)
+    try:
+        items = json.loads(path.read_bytes().decode('utf-8-sig'))
+    except FileNotFoundError:
+        raise ConfigError([f"Category file for '{category_name}' not found: {path}"])
+    except (ValueError, UnicodeDecodeError) as e:
+        raise ConfigError([f"Invalid JSON in {path.name}:\n{e}"])
+
+    if not isinstance(items, list):
+        raise ConfigError([f"{path.name} must contain a list of items"])
+    errors = []
+    for index, item in enumerate(items):
+        errors.extend(validate_item(item, f"{path.name}[{index}]"))
+    if errors:
+        raise ConfigError(errors)
+    return [normalize_item(item, Path(base_dir)) for item in items]
+
+
+class CategoryStore:
+    """Items per category; categories kept in their own file are parsed on first access"""
+
+    def __init__(self, config, previous=None):
+        self.config = config
+        self.files = config.get('category_files', {})
+        self.base_dir = config.get('base_dir', '.')
+        self.lock = threading.RLock()
+        self.categories = dict(config.get('categories', {}))
+        self.lookups = {}
+        self.stamps = {}
+        self.errors = {}
+        self.resolved_sets = None
+
+        # Keep unchanged files from the previous store; re-read the changed ones that were open
+        if previous is not None:
+            for category_name, path in self.files.items():
+                if previous.files.get(category_name) != path or category_name not in previous.stamps:
+                    continue
+                stamp = file_stamp(path)
+                same_synced = (previous.config.get('synced_items', {}).get(category_name)
+                               == config.get('synced_items', {}).get(category_name))
+                if stamp == previous.stamps[category_name] and category_name in previous.categories and same_synced:
+                    self.categories[category_name] = previous.categories[category_name]
+                    self.lookups[category_name] = previous.lookups[category_name]
+                    self.stamps[category_name] = stamp
+                    continue
+                try:
+                    self.get(category_name)
+                except ConfigError as e:
+                    print(f"Error reloading category '{category_name}': {e}")
+
+    def names(self):
+        """Return all category names in tab order"""
+        return list(self.config.get('categories', {})) + list(self.files)
+
+    def is_loaded(self, category_name):
+        """Return True if a category's items are in memory"""
+        return category_name in self.categories
+
+    def has_unloaded(self):
+        """Return True while some category file has not been read"""
+        return any(name not in self.categories for name in self.files)
+
+    def get(self, category_name):
+        """Return a category's items, reading its file on first access; raises ConfigError"""
+        items = self.categories.get(category_name)
+        if items is not None:
+            return items
+
+        with self.lock:
+            if category_name in self.categories:
+                return self.categories[category_name]
+            path = self.files[category_name]
+            stamp = file_stamp(path)
+
+            # A broken file is not parsed again until it changes
+            error = self.errors.get(category_name)
+            if error is not None and self.stamps.get(category_name) == stamp:
+                raise error
+
+            self.stamps[category_name] = stamp
+            try:
+                items = load_category_file(path, category_name, self.base_dir)
+            except ConfigError as e:
+                self.errors[category_name] = e
+                raise
+            self.errors.pop(category_name, None)
+            synced = self.config.get('synced_items', {}).get(category_name)
+            if synced:
+                items = merge_items(items, synced, {url_key(item['url']) for item in items})
+            self.lookups[category_name] = build_lookup({category_name: items})
+            self.categories[category_name] = items
+            return items
+
+    def loaded(self):
+        """Return {name: items} for the categories in memory, in tab order"""
+        return {name: self.categories[name] for name in self.names() if name in self.categories}
+
+    def view(self):
+        """Return {name: items, or None if not read yet} in tab order"""
+        return {name: self.categories.get(name) for name in self.names()}
+
+    def load_all(self):
+        """Read every category file; files with errors are skipped (get() reports them)"""
+        for category_name in self.files:
+            try:
+                self.get(category_name)
+            except ConfigError:
+                continue
+        return self.loaded()
+
+    def find(self, reference):
+        """Return the item whose shortName or name matches reference, reading files until found"""
+        item = find_item(self.config, reference)
+        if item is not None:
+            return item
+
+        for category_name in self.files:
+            if category_name not in self.categories:
+                try:
+                    self.get(category_name)
+                except ConfigError:
+                    continue
+            location = self.lookups[category_name].get(reference.lower())
+            if location is not None:
+                return self.categories[category_name][location[1]]
+        return None
+
+    def launch_sets(self):
+        """Return the launch sets with their items, resolving references into category files once"""
+        if not self.files:
+            return self.config.get('launch_sets', {})
+        if self.resolved_sets is None:
+            config = {'launch_sets': self.config.get('launch_sets', {})}
+            for error in resolve_launch_sets(config, find=self.find):
+                print(f"Error in config: {error}")
+            self.resolved_sets = config['launch_sets']
+        return self.resolved_sets
+
+    def files_changed(self):
+        """Return True if a category file that was read, or the Okta sync cache, has changed on disk"""
+        synced_path = self.config.get('synced_path')
+        if synced_path and file_stamp(synced_path) != self.config.get('synced_stamp'):
+            return True
+        # Workers add stamps while loading files; stat the files outside the lock
+        with self.lock:
+            stamps = list(self.stamps.items())
+        return any(file_stamp(self.files[name]) != stamp for name, stamp in stamps)
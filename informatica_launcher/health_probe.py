@@ -0,0 +1,130 @@
+"""
+Environment health probe for the Informatica Quick Launcher
+Checks every item's URL (or its health_url) concurrently and caches the
+latency and up/down state for a short time
+"""
+import threading
+import time
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+import requests
+from requests.adapters import HTTPAdapter
+from scheduler import ResultQueue
+
+
+# status is 'up', 'slow' or 'down'; latency_ms is None when no response arrived
+ProbeResult = namedtuple('ProbeResult', 'status latency_ms detail checked_at')
+
+
+def probe_url(item):
+    """Return the URL whose health is shown on an item's button"""
+    return item.get('health_url') or item.get('url')
+
+
+def probe_targets(config):
+    """Return the unique URLs to probe, preferring each item's health_url"""
+    targets = []
+    seen = set()
+    for items in config.get('categories', {}).values():
+        for item in items:
+            url = probe_url(item)
+            if url and url not in seen:
+                seen.add(url)
+                targets.append(url)
+    return targets
+
+
+class HealthProber:
+    """Probes URLs on a bounded worker pool and delivers results through a ResultQueue"""
+
+    def __init__(self, root, interval=60, ttl=120, max_concurrency=8, timeout=5.0,
+                 slow_ms=1500, poll_interval_ms=50):
+        self.root = root
+        self.interval = interval
+        self.ttl = ttl
+        self.timeout = timeout
+        self.slow_ms = slow_ms
+
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=max_concurrency, pool_maxsize=max_concurrency, max_retries=0)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        self.executor = ThreadPoolExecutor(max_workers=max_concurrency, thread_name_prefix="health")
+
+        self.lock = threading.Lock()
+        self.cache = {}
+        self.in_flight = set()
+        self.results = ResultQueue(root, poll_interval_ms)
+
+    @classmethod
+    def from_config(cls, root, config):
+        """Create a prober from the optional 'health_check' section, or None if disabled"""
+        settings = config.get('health_check', {})
+        if settings is False:
+            return None
+        if not isinstance(settings, dict):
+            settings = {}
+        if not settings.get('enabled', True):
+            return None
+        return cls(
+            root,
+            interval=settings.get('interval_seconds', 60),
+            ttl=settings.get('ttl_seconds', 120),
+            max_concurrency=settings.get('max_concurrency', 8),
+            timeout=settings.get('timeout_seconds', 5.0),
+            slow_ms=settings.get('slow_ms', 1500)
+        )
+
+    def get(self, url):
+        """Return the cached result for a URL while it is fresh, else None"""
+        with self.lock:
+            result = self.cache.get(url)
+        if result is None or time.time() - result.checked_at > self.ttl:
+            return None
+        return result
+
+    def check(self, urls, on_result):
+        """Probe every URL whose cached result is older than the interval; on_result(url, result) runs on the Tk thread"""
+        now = time.time()
+        for url in urls:
+            with self.lock:
+                cached = self.cache.get(url)
+                if url in self.in_flight or (cached and now - cached.checked_at < self.interval):
+                    continue
+                self.in_flight.add(url)
+            future = self.executor.submit(self.probe, url)
+            self.results.watch(future, lambda f, url=url: on_result(url, f.result()), f"health result for {url}")
+
+    def probe(self, url):
+        """Send one lightweight request (runs on a worker thread)"""
+        started = time.perf_counter()
+        try:
+            # SSO-protected URLs answer with a redirect; any response below 500 means the host is up
+            response = self.session.head(url, timeout=self.timeout, allow_redirects=False)
+            if response.status_code == 405:
+                response = self.session.get(url, timeout=self.timeout, allow_redirects=False, stream=True)
+                response.close()
+        except requests.Timeout:
+            result = ProbeResult('down', None, "timed out", time.time())
+        except (requests.RequestException, ValueError) as e:
+            result = ProbeResult('down', None, type(e).__name__, time.time())
+        else:
+            latency_ms = (time.perf_counter() - started) * 1000
+            if response.status_code >= 500:
+                status = 'down'
+            elif latency_ms > self.slow_ms:
+                status = 'slow'
+            else:
+                status = 'up'
+            result = ProbeResult(status, latency_ms, f"HTTP {response.status_code}", time.time())
+
+        with self.lock:
+            self.cache[url] = result
+            self.in_flight.discard(url)
+        return result
+
+    def shutdown(self):
+        """Drop queued probes and close the connection pool"""
+        self.results.close()
+        self.executor.shutdown(wait=False, cancel_futures=True)
+        self.session.close()
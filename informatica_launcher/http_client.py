@@ -0,0 +1,157 @@
+"""
+Shared HTTP client for the Informatica Quick Launcher
+Pooled keep-alive connections, jittered exponential backoff and a per-host
+circuit breaker whose state survives restarts
+"""
+import json
+import random
+import threading
+import time
+from pathlib import Path
+from urllib.parse import urlsplit
+import requests
+from requests.adapters import HTTPAdapter
+from shared_state import replace_atomically
+
+
+# Status codes worth retrying; anything else is returned to the caller
+RETRY_STATUS_CODES = {429, 500, 502, 503, 504}
+
+
+class CircuitOpenError(Exception):
+    """Raised when a host is in its cool-down period after repeated failures"""
+
+
+class StoppedError(requests.RequestException):
+    """Raised instead of retrying once the client's stop event is set (the launcher is closing)"""
+
+
+class HttpClient:
+    """requests.Session wrapper with retry, backoff and a persistent circuit breaker"""
+
+    def __init__(self, state_path, connect_timeout=3.05, read_timeout=10, retries=2,
+                 backoff_base=0.5, backoff_max=8.0, failure_threshold=2, cooldown=300,
+                 pool_size=4, stop_event=None):
+        self.state_path = Path(state_path)
+        self.timeout = (connect_timeout, read_timeout)
+        self.retries = retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.failure_threshold = failure_threshold
+        self.cooldown = cooldown
+        # Set on shutdown; backoff waits end early so worker threads do not hold up exit
+        self.stop_event = stop_event or threading.Event()
+
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=0)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+
+        self.lock = threading.Lock()
+        self.breakers = self.load_state()
+
+    @classmethod
+    def from_config(cls, state_path, config, stop_event=None):
+        """Create a client using the optional 'http' section of config.json"""
+        settings = config.get('http', {})
+        return cls(
+            state_path,
+            connect_timeout=settings.get('connect_timeout', 3.05),
+            read_timeout=settings.get('read_timeout', 10),
+            retries=settings.get('retries', 2),
+            cooldown=settings.get('cooldown_seconds', 300),
+            stop_event=stop_event
+        )
+
+    def get(self, url, **kwargs):
+        """GET a URL, retrying transient failures; raises CircuitOpenError if the host is cooling down"""
+        return self.request('GET', url, **kwargs)
+
+    def request(self, method, url, retries=None, **kwargs):
+        """Send a request with jittered exponential backoff between attempts"""
+        host = urlsplit(url).netloc
+        if self.is_open(host):
+            raise CircuitOpenError(f"{host} is unavailable, skipping until cool-down ends")
+
+        kwargs.setdefault('timeout', self.timeout)
+        retries = self.retries if retries is None else retries
+        error = None
+        for attempt in range(retries + 1):
+            delay = self.backoff_delay(attempt, error) if attempt else 0
+            if self.stop_event.wait(delay):
+                raise StoppedError(f"Stopped before requesting {host}")
+            try:
+                response = self.session.request(method, url, **kwargs)
+            except (requests.ConnectionError, requests.Timeout) as e:
+                error = e
+                continue
+
+            if response.status_code in RETRY_STATUS_CODES:
+                error = requests.HTTPError(f"HTTP {response.status_code} from {host}", response=response)
+                continue
+
+            self.record_success(host)
+            return response
+
+        self.record_failure(host)
+        raise error
+
+    def backoff_delay(self, attempt, error=None):
+        """Return a full-jitter exponential delay, honouring Retry-After when present"""
+        response = getattr(error, 'response', None)
+        if response is not None:
+            retry_after = response.headers.get('Retry-After', '')
+            if retry_after.isdigit():
+                return min(float(retry_after), self.backoff_max)
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * (2 ** attempt)))
+
+    def is_open(self, host):
+        """Return True while a host's circuit breaker is open"""
+        with self.lock:
+            state = self.breakers.get(host)
+            return bool(state) and state.get('open_until', 0) > time.time()
+
+    def record_success(self, host):
+        """Close the breaker for a host after a successful response"""
+        with self.lock:
+            if host not in self.breakers:
+                return
+            del self.breakers[host]
+            self.save_state()
+
+    def record_failure(self, host):
+        """Count a failed call and open the breaker once the threshold is reached"""
+        with self.lock:
+            state = self.breakers.setdefault(host, {'failures': 0, 'open_until': 0})
+            state['failures'] += 1
+            if state['failures'] >= self.failure_threshold:
+                state['open_until'] = time.time() + self.cooldown
+            self.save_state()
+
+    def load_state(self):
+        """Read persisted breaker state, dropping entries whose cool-down has ended"""
+        if not self.state_path.exists():
+            return {}
+        try:
+            with open(self.state_path, 'r', encoding='utf-8') as f:
+                breakers = json.load(f).get('breakers', {})
+        except Exception as e:
+            print(f"Error loading HTTP client state: {e}")
+            return {}
+        now = time.time()
+        return {
+            host: state for host, state in breakers.items()
+            if state.get('open_until', 0) > now or state.get('failures', 0) < self.failure_threshold
+        }
+
+    def save_state(self):
+        """Write breaker state atomically (caller holds the lock)"""
+        try:
+            # A per-process temp file, so launchers sharing the state never rename a half-written file
+            replace_atomically(self.state_path, json.dumps({'breakers': self.breakers}).encode('utf-8'))
+        except Exception as e:
+            print(f"Error saving HTTP client state: {e}")
+
+    def close(self):
+        """Close pooled connections"""
+        self.session.close()
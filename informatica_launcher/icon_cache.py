@@ -0,0 +1,150 @@
+"""
+Shared icon cache for the Informatica Quick Launcher
+Decodes each icon once per (path, mtime, size) and keeps resized thumbnails on disk.
+Icons are loaded with Tk's own PNG support; Pillow is imported only when an
+icon has no pre-sized asset or thumbnail yet and needs resampling
+"""
+import hashlib
+import math
+import os
+import re
+import sys
+import tkinter as tk
+from collections import OrderedDict
+from pathlib import Path
+
+
+# Sizes the launcher shows its own logos at (window icon, header, buttons);
+# CREATE_PACKAGE.bat writes pre-sized copies of the bundled PNGs for them
+ICON_SIZES = ((64, 64), (50, 50), (24, 24))
+
+
+def presized_path(path, size):
+    """Return the location of a packaged pre-sized copy, e.g. logo_24x24.png"""
+    path = Path(path)
+    return path.with_name(f"{path.stem}_{size[0]}x{size[1]}{path.suffix}")
+
+
+class IconCache:
+    """Bounded LRU of decoded PhotoImages backed by a disk store of pre-resized thumbnails"""
+
+    def __init__(self, cache_dir, max_entries=64):
+        self.cache_dir = Path(cache_dir)
+        self.max_entries = max_entries
+        self.images = OrderedDict()
+
+    def get(self, path, size=None):
+        """Return a PhotoImage for path, resized to size (width, height) if given, or None"""
+        path = Path(path)
+        try:
+            stat = path.stat()
+        except OSError:
+            return None
+
+        key = (str(path.resolve()), stat.st_mtime_ns, size)
+        image = self.images.get(key)
+        if image is not None:
+            self.images.move_to_end(key)
+            return image
+
+        try:
+            image = self.load(path, stat, size)
+        except Exception as e:
+            print(f"Could not load icon {path.name}: {e}")
+            return None
+
+        self.images[key] = image
+        # Widgets keep their own reference (widget.image), so evicting here
+        # never blanks an icon that is still on screen
+        while len(self.images) > self.max_entries:
+            self.images.popitem(last=False)
+        return image
+
+    def load(self, path, stat, size):
+        """Decode an icon, using a cached thumbnail when one matches the source file"""
+        if size is None:
+            return tk.PhotoImage(file=str(path))
+
+        # Pre-sized asset shipped with the package, unless the source was edited since
+        presized = presized_path(path, size)
+        try:
+            if presized.stat().st_mtime_ns >= stat.st_mtime_ns:
+                return tk.PhotoImage(file=str(presized))
+        except (OSError, tk.TclError):
+            pass
+
+        thumb_path = self.thumbnail_path(path, stat, size)
+        if thumb_path.exists():
+            try:
+                return tk.PhotoImage(file=str(thumb_path))
+            except tk.TclError:
+                pass  # Corrupt thumbnail, regenerate below
+
+        try:
+            from PIL import Image, ImageTk
+        except ImportError:
+            return self.scale_native(path, size)
+
+        img = Image.open(path)
+        img = img.resize(size, Image.LANCZOS)
+        self.save_thumbnail(img, thumb_path)
+
+        if thumb_path.exists():
+            return tk.PhotoImage(file=str(thumb_path))
+
+        return ImageTk.PhotoImage(img)
+
+    def scale_native(self, path, size):
+        """Scale with Tk's subsample/zoom when Pillow is not installed (nearest-neighbour quality)"""
+        image = tk.PhotoImage(file=str(path))
+        width, height = image.width(), image.height()
+        if width > size[0] or height > size[1]:
+            factor = max(math.ceil(width / size[0]), math.ceil(height / size[1]))
+            return image.subsample(factor)
+        factor = min(size[0] // width, size[1] // height)
+        return image.zoom(factor) if factor > 1 else image
+
+    def thumbnail_path(self, path, stat, size):
+        """Return the on-disk thumbnail location for a source file and target size"""
+        path_digest = hashlib.sha1(str(path.resolve()).encode('utf-8')).hexdigest()[:16]
+        return self.cache_dir / f"{path_digest}_{stat.st_mtime_ns}_{size[0]}x{size[1]}.png"
+
+    def save_thumbnail(self, img, thumb_path):
+        """Write a resized thumbnail atomically and drop stale versions of it"""
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+            # Remove thumbnails for older versions of the same source and size
+            path_digest, _, size_part = thumb_path.stem.split('_')
+            for stale in self.cache_dir.glob(f"{path_digest}_*_{size_part}.png"):
+                if stale != thumb_path:
+                    stale.unlink(missing_ok=True)  # Another launcher may have removed it
+
+            # Per-process temp file, so launchers sharing the cache never write the same one
+            tmp_path = thumb_path.with_name(f"{thumb_path.name}.{os.getpid()}.tmp")
+            img.save(tmp_path, format='PNG')
+            os.replace(tmp_path, thumb_path)
+        except Exception as e:
+            print(f"Could not write icon thumbnail: {e}")
+
+
+def create_presized_icons(directory, sizes=ICON_SIZES):
+    """Write high-quality pre-sized copies of the PNGs in directory (needs Pillow); returns the paths"""
+    from PIL import Image
+
+    written = []
+    for path in sorted(Path(directory).glob("*.png")):
+        if re.search(r'_\d+x\d+$', path.stem):
+            continue  # Already a pre-sized copy
+        with Image.open(path) as img:
+            for size in sizes:
+                target = presized_path(path, size)
+                img.resize(size, Image.LANCZOS).save(target, format='PNG', optimize=True)
+                written.append(target)
+    return written
+
+
+if __name__ == "__main__":
+    # Used by CREATE_PACKAGE.bat: python icon_cache.py [directory]
+    for written_path in create_presized_icons(sys.argv[1] if len(sys.argv) > 1 else Path(__file__).parent):
+        print(f"Wrote {written_path.name}")
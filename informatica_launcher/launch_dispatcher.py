@@ -0,0 +1,64 @@
+"""
+Asynchronous launch dispatcher for the Informatica Quick Launcher
+Opens URLs on a worker pool and reports each result back on the Tk loop
+"""
+import webbrowser
+from concurrent.futures import ThreadPoolExecutor
+from scheduler import ResultQueue
+
+
+class LaunchError(Exception):
+    """Raised when the browser could not be asked to open a URL"""
+
+
+class LaunchDispatcher:
+    """Runs browser launches off the Tk thread and delivers results through a ResultQueue"""
+
+    def __init__(self, root, max_workers=4, poll_interval_ms=30):
+        self.root = root
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="launch")
+        self.results = ResultQueue(root, poll_interval_ms)
+        # BrowserProfiles for the isolated_profiles launch mode, None for the default browser
+        self.profiles = None
+
+    def warm_up(self):
+        """Probe for the default browser in the background so the first click is fast"""
+        self.executor.submit(webbrowser.get)
+
+    def open_url(self, url):
+        """Open a URL in the default browser (runs on a worker thread)"""
+        if not webbrowser.open(url):
+            raise LaunchError("No browser could be started")
+
+    def launch(self, url, name, on_done, item=None):
+        """Open one URL; on_done(name, url, error) runs on the Tk thread"""
+        profiles = self.profiles
+        if profiles is not None and item is not None:
+            self.submit(lambda u: profiles.open_item(u, item), url, name, on_done)
+        else:
+            self.submit(self.open_url, url, name, on_done)
+
+    def launch_set(self, items, on_item_done, on_set_done):
+        """Open several items in parallel with a result per URL and one summary at the end"""
+        remaining = len(items)
+        results = []
+
+        def item_done(name, url, error):
+            nonlocal remaining
+            remaining -= 1
+            results.append((name, url, error))
+            on_item_done(name, url, error)
+            if remaining == 0:
+                on_set_done(results)
+
+        for item in items:
+            self.launch(item.get('url', ''), item.get('name', 'Unknown'), item_done, item=item)
+
+    def submit(self, func, url, name, on_done):
+        """Run func(url) on the pool and hand its outcome to on_done on the Tk thread"""
+        future = self.executor.submit(func, url)
+        self.results.watch(future, lambda f: on_done(name, url, f.exception()), f"launch result for {name}")
+
+    def shutdown(self):
+        """Stop accepting launches and let running ones finish"""
+        self.executor.shutdown(wait=False)
@@ -17,7 +17,7 @@ if errorlevel 1 (
 
 REM Launch the application
 cd /d "%~dp0"
-python launcher.py
+python launcher.py %*
 
 if errorlevel 1 (
     echo.
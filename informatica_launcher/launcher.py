@@ -2,25 +2,97 @@
 Informatica Environment Quick Launcher
 One-click access to all Informatica environments through Okta SSO
 """
+import sys
+
+if __name__ == "__main__":
+    from single_instance import forward_command
+    args = sys.argv[1:]
+    has_command = bool(args) and not args[0].startswith('-')
+    
+    # Hand the command to the resident launcher when one is already running
+    # (options such as --profile always start a fresh window)
+    if (has_command or not args) and forward_command(args or ['show']):
+        sys.exit(0)
+    
+    if has_command and args[0] != 'show':
+        # Headless commands (list/open/logout) skip the tkinter, Pillow and requests imports
+        from launcher_cli import main as cli_main
+        sys.exit(cli_main(args))
+
+import time
+IMPORTS_STARTED_NS = time.perf_counter_ns()
+
 import tkinter as tk
 from tkinter import ttk, messagebox
-import json
-import webbrowser
-import os
-import subprocess
-import platform
-import html
+import argparse
 import random
 from pathlib import Path
 from datetime import datetime
-from PIL import Image, ImageTk
-import requests
+from icon_cache import IconCache
+from access_log import AccessLogWriter
+from access_history import AccessHistory
+from quiz_bank import QuizBank, DEFAULT_API_URL
+from quiz_cache import QuizCache
+from http_client import HttpClient
+from search_index import SearchIndex
+from virtual_list import VirtualList
+from config_compiler import compile_config, CategoryStore, ConfigError
+from launch_dispatcher import LaunchDispatcher
+from browser_profiles import BrowserProfiles
+from single_instance import InstanceServer
+from health_probe import HealthProber, probe_url, probe_targets
+from timing import tracer, traced
+from scheduler import Scheduler, NETWORK_POOL
+from okta_sync import OktaSync
+
+IMPORTS_FINISHED_NS = time.perf_counter_ns()
+# The imports are traced too, so the trace starts with them instead of with the timing import
+tracer.set_origin(IMPORTS_STARTED_NS)
+
+
+# How often the config file is checked for changes on disk
+CONFIG_POLL_INTERVAL_MS = 1000
+
+# Tab listing the named launch sets from config
+SETS_TAB = "Sets"
+
+# Tab listing pinned and most used items across all categories
+FREQUENT_TAB = "Frequent"
+
+# Maximum number of rows in the search result list
+SEARCH_RESULT_LIMIT = 15
+
+# Height of one item row (button plus spacing) in the scrolling item lists
+ITEM_ROW_HEIGHT = 58
+
+# How often commands forwarded by later invocations are picked up
+INSTANCE_POLL_INTERVAL_MS = 100
+
+# Delay before the first health probe so startup is not slowed down
+HEALTH_FIRST_CHECK_MS = 1500
+
+# Badge text colour per probe status
+HEALTH_COLORS = {'up': '#1B7F1B', 'slow': '#B36B00', 'down': '#C62828'}
+
+# Delay before the first Okta dashboard sync after startup or a change to the
+# sync settings, so neither is slowed down and edited rules apply promptly
+OKTA_FIRST_SYNC_MS = 5000
+
+# How long a status message stays before the bar returns to "Ready"
+STATUS_RESET_MS = 3000
+
+# Files written by --profile and --cprofile
+TRACE_FILE = "launcher_trace.json"
+CPROFILE_FILE = "launcher_profile.pstats"
 
 
 class InformaticaLauncher:
     """Main launcher application"""
     
-    def __init__(self, root):
+    def __init__(self, root, resident=True):
+        self.init_started = time.perf_counter()
+        self.first_paint_ms = None
+        
         self.root = root
         self.root.title("Informatica Quick Launcher")
         self.root.geometry("520x700")
@@ -31,33 +103,82 @@ class InformaticaLauncher:
         self.quiz_answered = False
         self.selected_answer = None
         self.answer_buttons = []
-        
-        # Load button icons
-        self.button_icon = None
-        self.app_icons = {}
-        icon_path = Path(__file__).parent / "informatica_logo.png"
-        if icon_path.exists():
-            try:
-                # Set window icon
-                icon_img = tk.PhotoImage(file=str(icon_path))
-                self.root.iconphoto(True, icon_img)
-                
+        self.quiz_loading = False
+        self.quiz_generation = 0
+        self.current_tab = None
+        
+        # Search state
+        self.search_index = None
+        self.search_results = []
+        self.search_results_query = None
+        
+        with tracer.span("init.icons"):
+            # Load button icons through the shared icon cache
+            self.icons = IconCache(Path(__file__).parent / ".icon_cache")
+            self.button_icon = None
+            icon_path = Path(__file__).parent / "informatica_logo.png"
+            if icon_path.exists():
+                # Set window icon (a 64x64 copy; decoding the full-size logo is slow and memory hungry)
+                icon_img = self.icons.get(icon_path, (64, 64))
+                if icon_img:
+                    self.root.iconphoto(True, icon_img)
+            
                 # Load smaller icon for buttons
-                img = Image.open(icon_path)
-                img = img.resize((24, 24), Image.LANCZOS)
-                self.button_icon = ImageTk.PhotoImage(img)
-            except Exception as e:
-                print(f"Could not load icons: {e}")
+                self.button_icon = self.icons.get(icon_path, (24, 24))
         
-        # Load configuration
+        # Load configuration; category files are read when their tab is first opened
         self.config = self.load_config()
+        self.categories = CategoryStore(self.config)
+        self.category_errors = {}
+        self.search_covers_all = False
+        
+        with tracer.span("init.services"):
+            # Timers and periodic background work share one scheduler on the Tk loop;
+            # network work runs on its own pool so it never delays index builds or quiz loads
+            self.scheduler = Scheduler(self.root)
+            
+            # Browser launches run on a worker pool
+            self.launcher = LaunchDispatcher(self.root)
+            self.launcher.profiles = BrowserProfiles.from_config(self.config)
+            self.launcher.warm_up()
+            
+            # Shared HTTP client for all outbound calls
+            self.http = HttpClient.from_config(
+                Path(__file__).parent / "http_state.json", self.config, stop_event=self.scheduler.stopping
+            )
+            
+            # Today's question and the de-duplicated question history
+            self.quiz_cache = QuizCache(
+                Path(__file__).parent / "quiz_cache.json",
+                Path(__file__).parent / "quiz_history.jsonl"
+            )
+            
+            # Local question bank, refilled in bulk in the background
+            self.quiz_bank = QuizBank(
+                Path(__file__).parent / "quiz_bank.json",
+                self.http,
+                api_url=self.config.get('quiz_api_url', DEFAULT_API_URL),
+                stop_event=self.scheduler.stopping
+            )
+            
+            # Launch history store, queried for the Frequent tab
+            try:
+                self.history = AccessHistory(Path(__file__).parent / "access_history.db")
+            except Exception as e:
+                print(f"Could not open access history: {e}")
+                self.history = None
+            
+            # Access log records are written in batches on a background thread
+            self.access_log = AccessLogWriter.from_config(
+                Path(__file__).parent / "access_log.txt", self.config, history=self.history
+            )
+            
+            # Background up/down and latency checks shown as badges on the item buttons
+            self.health = HealthProber.from_config(self.root, self.config)
         
         # Set window icon and style
         self.setup_styles()
         
-        # Load daily quiz
-        self.load_daily_quiz()
-        
         # Create UI
         self.create_header()
         self.create_environment_buttons()
@@ -65,30 +186,79 @@ class InformaticaLauncher:
         
         # Center window
         self.center_window()
+        
+        # Record time-to-first-paint once the initial draw has been processed
+        self.root.after_idle(self.record_first_paint)
+        
+        # Load daily quiz in the background so the window is usable immediately
+        self.load_daily_quiz()
+        
+        # Watch config.json and apply edits automatically
+        self.scheduler.every("config.watch", CONFIG_POLL_INTERVAL_MS, self.watch_config)
+        
+        self.schedule_health_checks()
+        
+        # Pull app links from the Okta dashboard; watch_config picks up the merged result
+        self.okta_sync = None
+        self.schedule_okta_sync(first_delay_ms=OKTA_FIRST_SYNC_MS)
+        
+        # The launcher may stay open for days: roll the quiz over and trim caches at midnight
+        self.scheduler.at_midnight("quiz.rollover", self.load_daily_quiz)
+        self.scheduler.at_midnight("cache.compact", None, work=self.compact_caches)
+        
+        # Become the resident instance that later invocations hand their commands to
+        self.instance_server = None
+        if resident and self.config.get('single_instance', True):
+            self.start_instance_server()
+        if resident and self.config.get('keep_resident', False):
+            self.root.protocol("WM_DELETE_WINDOW", self.root.withdraw)
+        
+        # Hidden diagnostics view with recent timing spans
+        self.root.bind('<Control-D>', self.show_diagnostics)
     
+    def record_first_paint(self):
+        """Record elapsed time from construction to the first idle UI loop"""
+        if self.first_paint_ms is None:
+            self.first_paint_ms = (time.perf_counter() - self.init_started) * 1000
+            if tracer.enabled:
+                tracer.record("init.first_paint", int(self.init_started * 1e9), int(self.first_paint_ms * 1e6))
+    
+    @traced("config.load")
     def load_config(self):
-        """Load environment configuration from JSON file"""
-        config_path = Path(__file__).parent / "config.json"
-        
-        if not config_path.exists():
-            messagebox.showerror(
-                "Configuration Error",
-                f"Config file not found: {config_path}\n\nPlease create config.json"
-            )
-            self.root.quit()
-            return {}
+        """Load the validated, normalized configuration (from snapshot when unchanged)"""
+        self.config_stamp = self.get_config_stamp()
         
         try:
-            with open(config_path, 'r') as f:
-                return json.load(f)
-        except json.JSONDecodeError as e:
-            messagebox.showerror(
-                "Configuration Error",
-                f"Invalid JSON in config.json:\n{e}"
-            )
+            return self.compile_config()
+        except ConfigError as e:
+            messagebox.showerror("Configuration Error", self.format_config_errors(e))
             self.root.quit()
-            return {}
+            return {'categories': {}}
+    
+    def compile_config(self):
+        """Compile config.json, reusing the binary snapshot keyed by its hash"""
+        return compile_config(
+            Path(__file__).parent / "config.json",
+            Path(__file__).parent / ".config_snapshot.bin"
+        )
+    
+    def format_config_errors(self, error):
+        """Return all config problems as one message"""
+        if len(error.errors) == 1:
+            return error.errors[0]
+        problems = "\n".join(f"• {problem}" for problem in error.errors)
+        return f"config.json has {len(error.errors)} problems:\n\n{problems}"
     
+    def get_config_stamp(self):
+        """Return a cheap (mtime, size) fingerprint of config.json"""
+        config_path = Path(__file__).parent / "config.json"
+        try:
+            stat = config_path.stat()
+        except OSError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size)
+    
+    @traced("init.styles")
     def setup_styles(self):
         """Configure UI styles"""
         style = ttk.Style()
@@ -125,32 +295,26 @@ class InformaticaLauncher:
         style.map('UAT.TButton', background=[('active', '#F57C00')])
         style.map('Prod.TButton', background=[('active', '#D32F2F')])
     
+    @traced("init.header")
     def create_header(self):
         """Create header section"""
-        header_frame = tk.Frame(self.root, bg='#E6F3FF', height=120)
+        header_frame = tk.Frame(self.root, bg='#E6F3FF', height=150)
         header_frame.pack(fill=tk.X, padx=0, pady=0)
         header_frame.pack_propagate(False)
         
         # Try to load and display logo
         logo_path = Path(__file__).parent / "informatica_logo.png"
-        if logo_path.exists():
-            try:
-                # Load and resize logo
-                img = Image.open(logo_path)
-                img = img.resize((50, 50), Image.LANCZOS)
-                photo = ImageTk.PhotoImage(img)
-                
-                # Store reference to prevent garbage collection
-                self.logo_image = photo
-                
-                logo_label = tk.Label(
-                    header_frame,
-                    image=photo,
-                    bg='#E6F3FF'
-                )
-                logo_label.pack(pady=(10, 5))
-            except Exception as e:
-                print(f"Could not load logo: {e}")
+        photo = self.icons.get(logo_path, (50, 50))
+        if photo:
+            # Store reference to prevent garbage collection
+            self.logo_image = photo
+            
+            logo_label = tk.Label(
+                header_frame,
+                image=photo,
+                bg='#E6F3FF'
+            )
+            logo_label.pack(pady=(10, 5))
         
         title_label = tk.Label(
             header_frame,
@@ -164,13 +328,31 @@ class InformaticaLauncher:
         
         subtitle_label = tk.Label(
             header_frame,
-            text="Click environment to launch via Okta SSO",
+            text="Click environment to launch via Okta SSO • Type below to search",
             font=('Arial', 8),
             bg='#E6F3FF',
             fg='#555'
         )
         subtitle_label.pack(pady=(0, 5))
+        
+        # Search box - results update as you type, Enter launches the top hit
+        self.search_var = tk.StringVar()
+        search_entry = tk.Entry(
+            header_frame,
+            textvariable=self.search_var,
+            font=('Arial', 10),
+            bg='white',
+            fg='#1a1a1a',
+            relief=tk.FLAT
+        )
+        search_entry.pack(fill=tk.X, padx=30, pady=(0, 8), ipady=3)
+        search_entry.bind('<Return>', lambda e: self.launch_search_result())
+        search_entry.bind('<Escape>', lambda e: self.search_var.set(''))
+        search_entry.bind('<Down>', lambda e: self.move_search_selection(1))
+        search_entry.bind('<Up>', lambda e: self.move_search_selection(-1))
+        self.search_var.trace_add('write', lambda *args: self.update_search_results())
     
+    @traced("init.tabs")
     def create_environment_buttons(self):
         """Create tabbed interface for categories"""
         # Create tab container
@@ -186,43 +368,43 @@ class InformaticaLauncher:
         self.content_frame = tk.Frame(tab_container, bg='white')
         self.content_frame.pack(fill=tk.BOTH, expand=True, padx=30, pady=20)
         
-        # Get categories
-        categories = self.config.get('categories', {})
-        
-        if not categories:
-            # Fallback to old format
-            environments = self.config.get('environments', [])
-            categories = {'Informatica': environments}
+        # Tabs come from the category names; items of category files stay unread for now
+        categories = self.categories.view()
         
         # Create tab buttons
+        self.tab_bar = tab_frame
         self.tab_buttons = {}
         self.tab_contents = {}
         
-        for idx, (category_name, items) in enumerate(categories.items()):
-            # Create tab button
-            tab_btn = tk.Button(
-                tab_frame,
-                text=category_name,
-                font=('Arial', 11, 'bold'),
-                bg='#D6E8FF',
-                fg='#0055aa',
-                activebackground='#B8D8F5',
-                activeforeground='#0055aa',
-                relief=tk.FLAT,
-                borderwidth=0,
-                cursor='hand2',
-                padx=20,
-                pady=10,
-                command=lambda cat=category_name: self.switch_tab(cat)
-            )
-            tab_btn.pack(side=tk.LEFT, padx=2)
-            self.tab_buttons[category_name] = tab_btn
+        # Per-tab widget cache, swapped in and out by switch_tab; a tab's generation
+        # is bumped whenever its content changes
+        self.tab_frames = {}
+        self.tab_frame_signatures = {}
+        self.tab_generations = {}
+        self.item_lists = {}
+        self.visible_tab_frame = None
+        self.search_frame = None
+        
+        for category_name, items in categories.items():
+            self.tab_buttons[category_name] = self.create_tab_button(category_name)
             self.tab_contents[category_name] = items
         
-        # Add Quiz tab
-        quiz_tab_btn = tk.Button(
-            tab_frame,
-            text="Quiz",
+        self.build_search_index()
+        
+        # Add Sets and Frequent tabs as configured, then the Quiz tab
+        self.tab_buttons["Quiz"] = self.create_tab_button("Quiz")
+        self.update_optional_tabs()
+        
+        # Show first tab by default
+        first_category = list(categories.keys())[0] if categories else None
+        if first_category:
+            self.switch_tab(first_category)
+    
+    def create_tab_button(self, category_name):
+        """Create a tab button for a category"""
+        return tk.Button(
+            self.tab_bar,
+            text=category_name,
             font=('Arial', 11, 'bold'),
             bg='#D6E8FF',
             fg='#0055aa',
@@ -233,18 +415,38 @@ class InformaticaLauncher:
             cursor='hand2',
             padx=20,
             pady=10,
-            command=lambda: self.switch_tab("Quiz")
+            command=lambda cat=category_name: self.switch_tab(cat)
         )
-        quiz_tab_btn.pack(side=tk.LEFT, padx=2)
-        self.tab_buttons["Quiz"] = quiz_tab_btn
-        
-        # Show first tab by default
-        first_category = list(categories.keys())[0] if categories else None
-        if first_category:
-            self.switch_tab(first_category)
     
+    def update_optional_tabs(self):
+        """Add or remove the Sets and Frequent tabs to match the config"""
+        wanted = {
+            SETS_TAB: bool(self.config.get('launch_sets')),
+            FREQUENT_TAB: self.config.get('frequent_tab', {}) is not False
+        }
+        for tab, enabled in wanted.items():
+            if enabled and tab not in self.tab_buttons:
+                self.tab_buttons[tab] = self.create_tab_button(tab)
+            elif not enabled and tab in self.tab_buttons:
+                self.invalidate_tab(tab)
+                self.tab_buttons.pop(tab).destroy()
+        self.layout_tab_buttons()
+    
+    def layout_tab_buttons(self):
+        """Pack tab buttons in config order with the Sets, Frequent and Quiz tabs last"""
+        order = list(self.tab_contents) + [
+            tab for tab in (SETS_TAB, FREQUENT_TAB, "Quiz") if tab in self.tab_buttons
+        ]
+        for btn in self.tab_buttons.values():
+            btn.pack_forget()
+        for category_name in order:
+            self.tab_buttons[category_name].pack(side=tk.LEFT, padx=2)
+    
+    @traced("ui.switch_tab")
     def switch_tab(self, category_name):
         """Switch to selected tab"""
+        self.current_tab = category_name
+        
         # Update tab button styles
         for cat, btn in self.tab_buttons.items():
             if cat == category_name:
@@ -252,22 +454,120 @@ class InformaticaLauncher:
             else:
                 btn.config(bg='#D6E8FF', relief=tk.FLAT, borderwidth=0)
         
-        # Clear content frame
-        for widget in self.content_frame.winfo_children():
-            widget.destroy()
-        
-        # Check if this is the Quiz tab
+        # Rebuild the cached frame only if its content changed since it was built
+        signature = self.get_tab_signature(category_name)
+        if self.tab_frame_signatures.get(category_name) != signature:
+            self.invalidate_tab(category_name)
+        
+        frame = self.tab_frames.get(category_name)
+        if frame is None:
+            frame = tk.Frame(self.content_frame, bg='white')
+            if category_name == "Quiz":
+                self.show_quiz_tab(frame)
+            elif category_name == SETS_TAB:
+                self.build_sets_frame(frame)
+            else:
+                self.build_category_frame(frame, category_name)
+            self.tab_frames[category_name] = frame
+            self.tab_frame_signatures[category_name] = signature
+        
+        # Swap the visible frame without destroying the others
+        if self.visible_tab_frame is not frame:
+            if self.visible_tab_frame is not None:
+                self.visible_tab_frame.pack_forget()
+            frame.pack(fill=tk.BOTH, expand=True)
+            self.visible_tab_frame = frame
+        
+        # Leaving the search results clears the query
+        if self.search_var.get():
+            self.search_var.set('')
+    
+    def get_tab_signature(self, category_name):
+        """Return a value that changes whenever a tab's content needs rebuilding"""
         if category_name == "Quiz":
-            self.show_quiz_tab()
-            return
+            return (self.quiz_generation, self.quiz_loading)
+        generation = self.tab_generations.get(category_name, 0)
+        if category_name == FREQUENT_TAB and self.history is not None:
+            return (generation, self.history.version)
+        return generation
+    
+    def touch_tab(self, category_name):
+        """Mark a tab's content as changed so its cached frame is patched or rebuilt"""
+        self.tab_generations[category_name] = self.tab_generations.get(category_name, 0) + 1
+    
+    def get_tab_items(self, category_name):
+        """Return the items shown on a category tab or the Frequent tab"""
+        if category_name == FREQUENT_TAB:
+            return self.get_frequent_items()
+        if category_name in self.tab_contents and self.tab_contents[category_name] is None:
+            self.tab_contents[category_name] = self.load_category(category_name)
+        return self.tab_contents.get(category_name) or []
+    
+    @traced("config.load_category")
+    def load_category(self, category_name):
+        """Read a category file on first use; returns None and records the error if it is invalid"""
+        try:
+            items = self.categories.get(category_name)
+        except ConfigError as e:
+            self.category_errors[category_name] = self.format_config_errors(e)
+            return None
+        self.category_errors.pop(category_name, None)
+        return items
+    
+    def get_frequent_items(self):
+        """Return pinned items followed by the most used (or most recent) items"""
+        settings = self.config.get('frequent_tab')
+        if not isinstance(settings, dict):
+            settings = {}
+        limit = settings.get('limit', 8)
+        
+        by_name = {}
+        frequent = []
+        for items in self.categories.load_all().values():
+            for item in items:
+                by_name.setdefault(item.get('name', 'Unknown'), item)
+                if item.get('pinned') and item not in frequent:
+                    frequent.append(item)
+        
+        if self.history is not None:
+            if settings.get('order', 'most_used') == 'recent':
+                ranked = self.history.recent_environments(limit + len(frequent))
+            else:
+                ranked = self.history.top_environments(limit + len(frequent))
+            
+            for name, _ in ranked:
+                item = by_name.get(name)
+                if item is not None and item not in frequent:
+                    frequent.append(item)
         
+        return frequent[:max(limit, sum(1 for item in frequent if item.get('pinned')))]
+    
+    def invalidate_tab(self, category_name):
+        """Drop the cached frame for a tab so it is rebuilt on next display"""
+        frame = self.tab_frames.pop(category_name, None)
+        self.tab_frame_signatures.pop(category_name, None)
+        self.item_lists.pop(category_name, None)
+        if frame is not None:
+            if self.visible_tab_frame is frame:
+                self.visible_tab_frame = None
+            frame.destroy()
+    
+    @traced("ui.build_category_frame")
+    def build_category_frame(self, parent, category_name):
+        """Populate a tab frame with the logout button and item buttons"""
         # Get items for this category
-        items = self.tab_contents.get(category_name, [])
+        items = self.get_tab_items(category_name)
         
         if not items:
+            if category_name in self.category_errors:
+                empty_text = self.category_errors[category_name]
+            elif category_name == FREQUENT_TAB:
+                empty_text = "Launched and pinned items will appear here"
+            else:
+                empty_text = f"No items in {category_name}"
             no_env_label = tk.Label(
-                self.content_frame,
-                text=f"No items in {category_name}",
+                parent,
+                text=empty_text,
                 font=('Arial', 12),
                 fg='#888',
                 bg='white'
@@ -277,7 +577,7 @@ class InformaticaLauncher:
         
         # Add logout button at the top
         logout_btn = tk.Button(
-            self.content_frame,
+            parent,
             text="Logout from Okta",
             font=('Arial', 10),
             bg='#FFB6C1',
@@ -292,39 +592,57 @@ class InformaticaLauncher:
         logout_btn.pack(fill=tk.X, pady=(0, 15), ipady=8)
         
         # Add separator
-        separator = tk.Frame(self.content_frame, height=2, bg='#e0e0e0')
+        separator = tk.Frame(parent, height=2, bg='#e0e0e0')
         separator.pack(fill=tk.X, pady=5)
         
-        # Add environment/app buttons
-        for idx, item in enumerate(items):
-            self.create_environment_button(self.content_frame, item, idx)
+        # Add environment/app buttons - only rows on screen get widgets
+        item_list = VirtualList(
+            parent,
+            create_row=self.create_environment_button,
+            configure_row=lambda btn, item, idx: self.configure_environment_button(btn, item),
+            row_height=ITEM_ROW_HEIGHT,
+            items=items
+        )
+        item_list.pack(fill=tk.BOTH, expand=True)
+        self.item_lists[category_name] = item_list
+    
+    def build_sets_frame(self, parent):
+        """Populate the Sets tab with one button per named launch set"""
+        for set_name, items in self.categories.launch_sets().items():
+            btn = tk.Button(
+                parent,
+                text=f"  {set_name}",
+                font=('Arial', 12, 'bold'),
+                bg='#87CEEB',
+                fg='#1a1a1a',
+                activebackground='#6FB8DC',
+                activeforeground='#1a1a1a',
+                relief=tk.RAISED,
+                borderwidth=1,
+                cursor='hand2',
+                anchor='w',
+                command=lambda name=set_name: self.launch_set(name)
+            )
+            btn.pack(fill=tk.X, pady=(6, 0), ipady=10)
+            btn.bind('<Enter>', lambda e, b=btn: b.config(bg='#6FB8DC'))
+            btn.bind('<Leave>', lambda e, b=btn: b.config(bg='#87CEEB'))
+            
+            members = ", ".join(item['shortName'] for item in items)
+            members_label = tk.Label(
+                parent,
+                text=f"Opens {members}",
+                font=('Arial', 8),
+                bg='white',
+                fg='#666',
+                anchor='w'
+            )
+            members_label.pack(fill=tk.X, pady=(2, 6))
     
     def create_environment_button(self, parent, env, index):
         """Create a single environment button"""
-        name = env.get('name', 'Unknown')
-        short_name = env.get('shortName', name)
-        url = env.get('url', '')
-        custom_icon = env.get('icon', None)
-        
-        # Load custom icon if specified
-        btn_icon = self.button_icon  # Default to Informatica icon
-        if custom_icon:
-            icon_path = Path(__file__).parent / custom_icon
-            if icon_path.exists() and custom_icon not in self.app_icons:
-                try:
-                    img = Image.open(icon_path)
-                    img = img.resize((24, 24), Image.LANCZOS)
-                    self.app_icons[custom_icon] = ImageTk.PhotoImage(img)
-                    btn_icon = self.app_icons[custom_icon]
-                except Exception as e:
-                    print(f"Could not load icon {custom_icon}: {e}")
-            elif custom_icon in self.app_icons:
-                btn_icon = self.app_icons[custom_icon]
-        
         # Create button - all light blue with icon
         btn = tk.Button(
             parent,
-            text=f"  {short_name}",
             font=('Arial', 12, 'bold'),
             bg='#87CEEB',
             fg='#1a1a1a',
@@ -333,36 +651,104 @@ class InformaticaLauncher:
             relief=tk.RAISED,
             borderwidth=1,
             cursor='hand2',
-            command=lambda u=url, n=name: self.launch_environment(u, n),
-            compound=tk.LEFT,
-            image=btn_icon if btn_icon else None
+            compound=tk.LEFT
         )
-        btn.pack(fill=tk.X, pady=6, ipady=10)
+        
+        # Health badge on the right edge of the button; clicks fall through to the button
+        btn.badge = tk.Label(btn, font=('Arial', 9, 'bold'), bg='#87CEEB')
+        btn.badge.bind('<Button-1>', lambda e, b=btn: b.invoke())
+        self.configure_environment_button(btn, env)
         
         # Bind hover effects
-        btn.bind('<Enter>', lambda e, b=btn: b.config(bg='#6FB8DC'))
-        btn.bind('<Leave>', lambda e, b=btn: b.config(bg='#87CEEB'))
+        btn.bind('<Enter>', lambda e, b=btn: self.set_button_background(b, '#6FB8DC'))
+        btn.bind('<Leave>', lambda e, b=btn: self.set_button_background(b, '#87CEEB'))
+        return btn
     
+    def set_button_background(self, btn, color):
+        """Recolor an item button together with its health badge"""
+        btn.config(bg=color)
+        btn.badge.config(bg=color)
     
-    def launch_environment(self, url, name):
-        """Launch environment in browser"""
+    def configure_environment_button(self, btn, env):
+        """Apply an item's label, icon and launch target to an existing button"""
+        name = env.get('name', 'Unknown')
+        short_name = env.get('shortName', name)
+        url = env.get('url', '')
+        icon_path = env.get('icon_path')
+        
+        # Load custom icon if specified (path resolved by the config compiler)
+        btn_icon = self.button_icon  # Default to Informatica icon
+        if icon_path:
+            btn_icon = self.icons.get(icon_path, (24, 24)) or btn_icon
+        
+        btn.config(
+            text=f"  {short_name}",
+            command=lambda u=url, n=name, e=env: self.launch_environment(u, n, e),
+            image=btn_icon if btn_icon else ''
+        )
+        btn.image = btn_icon  # Keep icon alive independently of the cache
+        btn.probe_url = probe_url(env)
+        self.update_health_badge(btn)
+    
+    @traced("launch.environment")
+    def launch_environment(self, url, name, item=None):
+        """Launch environment in browser via the worker pool (in its own profile when isolated)"""
         if not url:
             messagebox.showerror("Error", f"No URL configured for {name}")
             return
         
-        try:
-            webbrowser.open(url)
-            self.log_access(name)
-            
-            # Show confirmation
-            status_text = f"✓ Launched {name}"
-            self.update_status(status_text)
-            
-        except Exception as e:
+        self.status_label.config(text=f"Opening {name}...")
+        self.launcher.launch(url, name, self.on_launch_done, item=item)
+    
+    def on_launch_done(self, name, url, error):
+        """Report a finished launch on the Tk thread"""
+        if error:
             messagebox.showerror(
                 "Launch Error",
-                f"Failed to open {name}:\n{e}"
+                f"Failed to open {name}:\n{error}"
             )
+            return
+        
+        self.log_access(name)
+        
+        # Show confirmation
+        status_text = f"✓ Launched {name}"
+        self.update_status(status_text)
+    
+    @traced("launch.set")
+    def launch_set(self, set_name):
+        """Open every item of a named launch set in parallel"""
+        items = self.categories.launch_sets().get(set_name, [])
+        if not items:
+            return
+        
+        self.status_label.config(text=f"Opening {set_name} ({len(items)} items)...")
+        self.launcher.launch_set(
+            items,
+            on_item_done=self.on_set_item_done,
+            on_set_done=lambda results: self.on_set_done(set_name, results)
+        )
+    
+    def on_set_item_done(self, name, url, error):
+        """Log each successfully opened item of a launch set"""
+        if not error:
+            self.log_access(name)
+    
+    def on_set_done(self, set_name, results):
+        """Summarize a launch set with the outcome of each URL"""
+        failed = [(name, error) for name, url, error in results if error]
+        opened = len(results) - len(failed)
+        
+        if not failed:
+            self.update_status(f"✓ Launched {set_name} ({opened} items)")
+            return
+        
+        self.update_status(f"Launched {opened}/{len(results)} of {set_name}")
+        details = "\n".join(f"{name}: {error}" for name, error in failed)
+        messagebox.showerror(
+            "Launch Error",
+            f"Failed to open {len(failed)} item(s) of {set_name}:\n{details}"
+        )
     
     def logout_okta(self):
         """Logout from Okta SSO"""
@@ -380,41 +766,43 @@ class InformaticaLauncher:
                 )
                 return
         
-        try:
-            webbrowser.open(logout_url)
-            self.update_status("✓ Opened Okta logout page")
-            
-            # Log the logout
-            log_file = Path(__file__).parent / "access_log.txt"
-            timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-            try:
-                with open(log_file, 'a') as f:
-                    f.write(f"{timestamp} - Logged out from Okta\n")
-            except Exception:
-                pass
-                
-        except Exception as e:
+        self.launcher.launch(logout_url, "Okta logout", self.on_logout_done)
+    
+    def on_logout_done(self, name, url, error):
+        """Report the Okta logout launch on the Tk thread"""
+        if error:
             messagebox.showerror(
                 "Logout Error",
-                f"Failed to open logout page:\n{e}"
+                f"Failed to open logout page:\n{error}"
             )
+            return
+        
+        self.update_status("✓ Opened Okta logout page")
+        
+        # Log the logout
+        self.access_log.log_logout()
     
     def log_access(self, env_name):
-        """Log environment access for tracking"""
-        log_file = Path(__file__).parent / "access_log.txt"
-        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        
-        try:
-            with open(log_file, 'a') as f:
-                f.write(f"{timestamp} - Accessed: {env_name}\n")
-        except Exception:
-            pass  # Silent fail for logging
+        """Log environment access for tracking (queued, no file I/O on the UI thread)"""
+        self.access_log.log_access(env_name)
     
-    def show_quiz_tab(self):
+    @traced("quiz.show_tab")
+    def show_quiz_tab(self, parent):
         """Show quiz in its own tab"""
+        if self.quiz_loading and not self.current_quiz:
+            loading_label = tk.Label(
+                parent,
+                text="Loading today's quiz...",
+                font=('Arial', 12),
+                fg='#888',
+                bg='white'
+            )
+            loading_label.pack(pady=50)
+            return
+        
         if not self.current_quiz:
             no_quiz_label = tk.Label(
-                self.content_frame,
+                parent,
                 text="No quiz available today",
                 font=('Arial', 12),
                 fg='#888',
@@ -425,7 +813,7 @@ class InformaticaLauncher:
         
         # Header with date
         today = datetime.now().strftime("%B %d, %Y")
-        header_frame = tk.Frame(self.content_frame, bg='#FFE5B4')
+        header_frame = tk.Frame(parent, bg='#FFE5B4')
         header_frame.pack(fill=tk.X, pady=(0, 20))
         
         header_label = tk.Label(
@@ -438,7 +826,7 @@ class InformaticaLauncher:
         header_label.pack(pady=15)
         
         # Question text
-        question_frame = tk.Frame(self.content_frame, bg='white')
+        question_frame = tk.Frame(parent, bg='white')
         question_frame.pack(fill=tk.X, padx=30, pady=(10, 20))
         
         question_label = tk.Label(
@@ -453,7 +841,7 @@ class InformaticaLauncher:
         question_label.pack(anchor=tk.W)
         
         # Answer buttons frame
-        answers_frame = tk.Frame(self.content_frame, bg='white')
+        answers_frame = tk.Frame(parent, bg='white')
         answers_frame.pack(fill=tk.BOTH, expand=True, padx=30, pady=10)
         
         # Prepare all answers and shuffle
@@ -486,7 +874,7 @@ class InformaticaLauncher:
             self.answer_buttons.append((btn, answer))
         
         # Control buttons
-        control_frame = tk.Frame(self.content_frame, bg='white')
+        control_frame = tk.Frame(parent, bg='white')
         control_frame.pack(fill=tk.X, padx=30, pady=(20, 10))
         
         self.show_answer_btn = tk.Button(
@@ -514,6 +902,7 @@ class InformaticaLauncher:
         )
         self.result_label.pack(side=tk.LEFT, padx=15)
     
+    @traced("init.footer")
     def create_footer(self):
         """Create footer with status bar"""
         footer_frame = tk.Frame(self.root, bg='#f5f5f5', height=40)
@@ -546,31 +935,430 @@ class InformaticaLauncher:
     def update_status(self, message):
         """Update status bar message"""
         self.status_label.config(text=message)
-        self.root.after(3000, lambda: self.status_label.config(text="Ready"))
+        # Rescheduling replaces the pending reset, so rapid updates do not stack timers
+        self.scheduler.call_later(
+            "status.reset", STATUS_RESET_MS, lambda: self.status_label.config(text="Ready")
+        )
     
-    def reload_config(self):
-        """Reload configuration and rebuild UI"""
-        # Reload icons
-        self.app_icons = {}
+    @traced("config.reload")
+    def reload_config(self, show_errors=True):
+        """Reload configuration and patch only the widgets that changed"""
+        stamp = self.get_config_stamp()
         
-        # Reset quiz state
-        self.quiz_answered = False
-        self.selected_answer = None
-        self.answer_buttons = []
+        try:
+            new_config = self.compile_config()
+        except (OSError, ConfigError) as e:
+            # Keep running on the previous config; a half-saved edit is common
+            self.config_stamp = stamp
+            if show_errors:
+                if isinstance(e, ConfigError):
+                    message = self.format_config_errors(e)
+                else:
+                    message = f"Could not reload config.json:\n{e}"
+                messagebox.showerror("Configuration Error", message)
+            else:
+                self.update_status("Config has errors - keeping previous version")
+            return
         
-        self.config = self.load_config()
-        self.load_daily_quiz()
+        self.config_stamp = stamp
+        sync_changed = new_config.get('okta_sync') != self.config.get('okta_sync')
+        health_changed = new_config.get('health_check') != self.config.get('health_check')
+        self.config = new_config
+        self.categories = CategoryStore(new_config, previous=self.categories)
+        if sync_changed:
+            self.schedule_okta_sync(first_delay_ms=OKTA_FIRST_SYNC_MS)
+        if health_changed:
+            self.restart_health_checks()
+        self.search_covers_all = False
+        self.launcher.profiles = BrowserProfiles.from_config(new_config)
+        # Launch sets and Frequent tab settings live in config.json itself
+        self.touch_tab(SETS_TAB)
+        self.touch_tab(FREQUENT_TAB)
+        changed = self.apply_categories(self.categories.view())
+        self.update_optional_tabs()
+        if self.current_tab not in self.tab_buttons:
+            self.switch_tab(next(iter(self.tab_contents), "Quiz"))
+        elif self.current_tab in (SETS_TAB, FREQUENT_TAB) and not self.is_searching():
+            self.switch_tab(self.current_tab)
+        
+        if changed:
+            self.update_status(f"Configuration reloaded ({len(changed)} tab(s) updated)")
+        else:
+            self.update_status("Configuration reloaded")
+    
+    def apply_categories(self, categories):
+        """Diff new categories against the current ones and patch changed tabs"""
+        changed = []
+        old_order = list(self.tab_contents)
+        
+        # Drop removed categories
+        for category_name in old_order:
+            if category_name not in categories:
+                self.invalidate_tab(category_name)
+                self.tab_buttons.pop(category_name).destroy()
+                del self.tab_contents[category_name]
+                changed.append(category_name)
+        
+        # Add new categories and patch changed ones (None: category file not read yet)
+        for category_name, items in categories.items():
+            is_new = category_name not in self.tab_contents
+            old_items = self.tab_contents.get(category_name)
+            if not is_new and old_items == items:
+                continue
+            
+            changed.append(category_name)
+            self.touch_tab(category_name)
+            self.tab_contents[category_name] = items
+            self.category_errors.pop(category_name, None)
+            if is_new:
+                self.tab_buttons[category_name] = self.create_tab_button(category_name)
+            elif items is None or old_items is None:
+                self.invalidate_tab(category_name)
+            else:
+                self.patch_category_frame(category_name, old_items, items)
         
-        # Clear and rebuild UI
-        for widget in self.root.winfo_children():
-            widget.destroy()
+        # Re-pack the tab bar only if the set or order of categories changed
+        if list(categories) != old_order:
+            self.tab_contents = {name: categories[name] for name in categories}
+            self.layout_tab_buttons()
         
-        self.create_header()
-        self.create_environment_buttons()
-        self.create_footer()
+        if changed:
+            # Launch sets and the Frequent tab show items from any category
+            self.touch_tab(SETS_TAB)
+            self.touch_tab(FREQUENT_TAB)
+            self.build_search_index()
+        
+        if self.current_tab not in self.tab_buttons:
+            first_category = next(iter(self.tab_contents), "Quiz")
+            self.switch_tab(first_category)
+        elif self.is_searching():
+            pass  # The current tab is refreshed when the search is closed
+        elif self.current_tab in changed or (changed and self.current_tab == FREQUENT_TAB):
+            self.switch_tab(self.current_tab)
+        
+        return changed
+    
+    def patch_category_frame(self, category_name, old_items, items):
+        """Update a cached tab's item list in place, rebinding only changed rows"""
+        item_list = self.item_lists.get(category_name)
+        if item_list is None or not items:
+            return  # Not built yet or now empty; switch_tab rebuilds the frame on demand
+        
+        item_list.set_items(items)
+        self.tab_frame_signatures[category_name] = self.get_tab_signature(category_name)
+    
+    def build_search_index(self, load_all=False):
+        """Rebuild the search index on a background thread; load_all first reads every category file"""
+        store = self.categories
+        self.search_index = None
+        # Results from the old index may name items that no longer exist
+        self.clear_search_results()
+        if self.is_searching():
+            self.show_search_results(empty_text="Searching...")
+        
+        def worker():
+            categories = store.load_all() if load_all else store.loaded()
+            return SearchIndex(categories)
+        
+        # A rebuild requested while one is running replaces it and its result is dropped
+        self.scheduler.call_later("search.index", 0, self.on_search_index_built, work=worker)
+    
+    def on_search_index_built(self, index):
+        """Install a freshly built index and run a query that arrived while it was building"""
+        self.search_index = index
+        if self.is_searching():
+            self.update_search_results()
+    
+    def update_search_results(self):
+        """Refresh the result list for the current query"""
+        query = self.search_var.get().strip()
+        if not query:
+            self.clear_search_results()
+            self.hide_search_results()
+            return
+        
+        if not self.search_covers_all and self.categories.has_unloaded():
+            # The first search reads the remaining category files in the background
+            self.search_covers_all = True
+            self.build_search_index(load_all=True)
+        
+        if self.search_index is None:
+            # Index still building; on_search_index_built runs the query
+            self.clear_search_results()
+            self.show_search_results(empty_text="Searching...")
+            return
+        
+        self.search_results = self.search_index.search(query, limit=SEARCH_RESULT_LIMIT)
+        self.search_results_query = query
+        self.show_search_results()
+    
+    def clear_search_results(self):
+        """Forget the last results so Enter cannot launch a hit from an earlier query"""
+        self.search_results = []
+        self.search_results_query = None
+        if self.search_frame is not None:
+            self.search_listbox.delete(0, tk.END)
+    
+    def show_search_results(self, empty_text="No matches"):
+        """Swap the search result list into the content area"""
+        if self.search_frame is None:
+            self.search_frame = tk.Frame(self.content_frame, bg='white')
+            self.search_listbox = tk.Listbox(
+                self.search_frame,
+                font=('Arial', 11),
+                bg='white',
+                fg='#1a1a1a',
+                selectbackground='#87CEEB',
+                selectforeground='#1a1a1a',
+                activestyle='none',
+                relief=tk.FLAT,
+                highlightthickness=0
+            )
+            self.search_listbox.pack(fill=tk.BOTH, expand=True)
+            self.search_listbox.bind('<Double-Button-1>', lambda e: self.launch_search_result())
+            self.search_listbox.bind('<Return>', lambda e: self.launch_search_result())
+        
+        if self.visible_tab_frame is not self.search_frame:
+            if self.visible_tab_frame is not None:
+                self.visible_tab_frame.pack_forget()
+            self.search_frame.pack(fill=tk.BOTH, expand=True)
+            self.visible_tab_frame = self.search_frame
+        
+        self.search_listbox.delete(0, tk.END)
+        if not self.search_results:
+            self.search_listbox.insert(tk.END, empty_text)
+            return
         
-        self.update_status("Configuration reloaded")
+        for category_name, item in self.search_results:
+            name = item.get('name', 'Unknown')
+            short_name = item.get('shortName', name)
+            self.search_listbox.insert(tk.END, f"{short_name}  -  {name}   [{category_name}]")
+        self.search_listbox.selection_set(0)
+    
+    def hide_search_results(self):
+        """Return from the search results to the current tab"""
+        if self.is_searching():
+            self.switch_tab(self.current_tab)
+    
+    def is_searching(self):
+        """Return True while the search result list is showing"""
+        return self.search_frame is not None and self.visible_tab_frame is self.search_frame
+    
+    def move_search_selection(self, step):
+        """Move the highlighted search result up or down"""
+        if not self.search_results or not self.is_searching():
+            return
+        selection = self.search_listbox.curselection()
+        index = (selection[0] if selection else 0) + step
+        index = max(0, min(index, len(self.search_results) - 1))
+        self.search_listbox.selection_clear(0, tk.END)
+        self.search_listbox.selection_set(index)
+        self.search_listbox.see(index)
+    
+    def launch_search_result(self):
+        """Launch the highlighted search result, or the top hit"""
+        if not self.search_results or not self.is_searching():
+            return
+        if self.search_results_query != self.search_var.get().strip():
+            return  # The results shown are for an earlier query
+        selection = self.search_listbox.curselection()
+        _, item = self.search_results[selection[0] if selection else 0]
+        self.launch_environment(item.get('url', ''), item.get('name', 'Unknown'), item)
+    
+    def watch_config(self):
+        """Poll config.json's mtime and size and reload when it changes"""
+        if self.get_config_stamp() != self.config_stamp or self.categories.files_changed():
+            self.reload_config(show_errors=False)
+    
+    def schedule_health_checks(self):
+        """Start the periodic health checks, or stop them when they are turned off"""
+        if self.health is None:
+            self.scheduler.cancel("health.check")
+            return
+        self.scheduler.every(
+            "health.check", int(self.health.interval * 1000), self.run_health_checks,
+            first_delay_ms=HEALTH_FIRST_CHECK_MS
+        )
+    
+    def restart_health_checks(self):
+        """Replace the prober after the 'health_check' settings changed and refresh the badges"""
+        if self.health is not None:
+            self.health.shutdown()
+        self.health = HealthProber.from_config(self.root, self.config)
+        self.schedule_health_checks()
+        for item_list in self.item_lists.values():
+            for btn, _, index in item_list.rows:
+                if index is not None:
+                    self.update_health_badge(btn)
+    
+    def run_health_checks(self):
+        """Probe every item on the configured interval while the window is shown"""
+        if self.root.state() != 'withdrawn':
+            self.health.check(probe_targets({'categories': self.categories.loaded()}), self.on_health_result)
+    
+    def schedule_okta_sync(self, first_delay_ms=None):
+        """(Re)start the periodic Okta dashboard sync, or stop it when it is not configured"""
+        self.okta_sync = OktaSync.from_config(Path(__file__).parent, self.config, self.http)
+        if self.okta_sync is None:
+            self.scheduler.cancel("okta.sync")
+            return
+        sync = self.okta_sync
+        self.scheduler.every(
+            "okta.sync", int(sync.interval * 1000), self.on_okta_synced,
+            work=lambda: self.run_okta_sync(sync), first_delay_ms=first_delay_ms, pool=NETWORK_POOL
+        )
+    
+    def run_okta_sync(self, sync):
+        """Refresh the Okta app cache; returns the app count when it changed (runs on a scheduler worker)"""
+        try:
+            return sync.sync()
+        except Exception as e:
+            print(f"Error syncing Okta apps: {e}")
+            return None
+    
+    def on_okta_synced(self, app_count):
+        """Report a changed Okta app list; watch_config reloads the merged categories"""
+        if app_count is not None:
+            self.update_status(f"Synced {app_count} app(s) from Okta")
+    
+    def on_health_result(self, url, result):
+        """Refresh the badges of visible buttons that show this URL"""
+        for item_list in self.item_lists.values():
+            for btn, _, index in item_list.rows:
+                if index is not None and btn.probe_url == url:
+                    self.update_health_badge(btn)
+    
+    def update_health_badge(self, btn):
+        """Show the cached probe result for a button's URL, or hide the badge"""
+        result = self.health.get(btn.probe_url) if self.health is not None else None
+        if result is None:
+            btn.badge.place_forget()
+            return
+        
+        if result.status == 'down':
+            text = f"● {result.detail}"
+        elif result.latency_ms >= 1000:
+            text = f"● {result.latency_ms / 1000:.1f} s"
+        else:
+            text = f"● {result.latency_ms:.0f} ms"
+        btn.badge.config(text=text, fg=HEALTH_COLORS[result.status])
+        btn.badge.place(relx=1.0, rely=0.5, x=-12, anchor='e')
+    
+    def show_diagnostics(self, event=None):
+        """Open the hidden diagnostics window (Ctrl+Shift+D) listing recent timing spans"""
+        if not tracer.enabled:
+            tracer.enable()
+        
+        window = tk.Toplevel(self.root)
+        window.title("Diagnostics")
+        window.geometry("560x480")
+        
+        text = tk.Text(window, font=('Consolas', 9), wrap=tk.NONE, bg='white')
+        
+        def refresh():
+            lines = []
+            if self.first_paint_ms is not None:
+                lines.append(f"First paint: {self.first_paint_ms:.1f} ms")
+            lines.append(f"Imports: {(IMPORTS_FINISHED_NS - IMPORTS_STARTED_NS) / 1e6:.1f} ms")
+            lines.append("")
+            lines.append(f"{'Span':<28}{'Count':>7}{'Avg ms':>10}{'Max ms':>10}")
+            summary = sorted(tracer.summary().items(), key=lambda entry: -entry[1][1])
+            for name, (count, total_ms, max_ms) in summary:
+                lines.append(f"{name:<28}{count:>7}{total_ms / count:>10.2f}{max_ms:>10.2f}")
+            if not summary:
+                lines.append("Recording started - use the launcher and press Refresh")
+            lines.append("")
+            lines.append("Recent spans (newest first)")
+            for name, start_ms, duration_ms, args in reversed(tracer.recent_spans()[-50:]):
+                lines.append(f"{start_ms:>10.1f}  {name:<28}{duration_ms:>10.2f} ms")
+            
+            text.config(state=tk.NORMAL)
+            text.delete('1.0', tk.END)
+            text.insert('1.0', "\n".join(lines))
+            text.config(state=tk.DISABLED)
+        
+        def save_trace():
+            path = Path(__file__).parent / TRACE_FILE
+            try:
+                tracer.write_chrome_trace(path)
+                self.update_status(f"Trace written to {path.name}")
+            except OSError as e:
+                messagebox.showerror("Diagnostics", f"Could not write trace:\n{e}")
+        
+        buttons = tk.Frame(window)
+        buttons.pack(side=tk.BOTTOM, fill=tk.X)
+        tk.Button(buttons, text="Refresh", command=refresh).pack(side=tk.LEFT, padx=5, pady=5)
+        tk.Button(buttons, text="Save trace", command=save_trace).pack(side=tk.LEFT, pady=5)
+        text.pack(fill=tk.BOTH, expand=True)
+        refresh()
+    
+    def start_instance_server(self):
+        """Listen for commands from later invocations of the launcher"""
+        try:
+            self.instance_server = InstanceServer(Path(__file__).parent)
+        except OSError as e:
+            print(f"Could not start single-instance listener: {e}")
+            return
+        self.scheduler.every("instance.poll", INSTANCE_POLL_INTERVAL_MS, self.poll_instance_commands)
+    
+    def poll_instance_commands(self):
+        """Run forwarded commands on the Tk thread"""
+        while True:
+            argv = self.instance_server.get_command()
+            if argv is None:
+                break
+            try:
+                self.handle_instance_command(argv[0], argv[1:])
+            except Exception as e:
+                print(f"Error handling forwarded command {argv}: {e}")
+    
+    def handle_instance_command(self, command, args):
+        """Apply one forwarded command (show, open, logout, reload, quit)"""
+        if command == 'quit':
+            self.shutdown()
+            return
+        if command == 'reload':
+            self.reload_config(show_errors=False)
+            return
+        if command == 'logout':
+            self.logout_okta()
+            return
+        if command == 'open':
+            self.open_references(args)
+            return
+        self.show_window()
+    
+    def open_references(self, references):
+        """Open items or launch sets by shortName or name"""
+        launch_sets = {name.lower(): name for name in self.config.get('launch_sets', {})}
+        for reference in references:
+            item = self.categories.find(reference)
+            if item is not None:
+                self.launch_environment(item['url'], item['name'], item)
+            elif reference.lower() in launch_sets:
+                self.launch_set(launch_sets[reference.lower()])
+            else:
+                self.update_status(f"No item or launch set named '{reference}'")
+    
+    def show_window(self):
+        """Bring the (possibly withdrawn) window to the front"""
+        self.root.deiconify()
+        self.root.lift()
+        self.root.focus_force()
     
+    def shutdown(self):
+        """Close the window; main() then releases background services"""
+        self.root.destroy()
+    
+    def close_services(self):
+        """Stop scheduled tasks, listening for forwarded commands and pending health probes"""
+        self.scheduler.shutdown()
+        if self.instance_server is not None:
+            self.instance_server.close()
+        if self.health is not None:
+            self.health.shutdown()
+    
+    @traced("init.center")
     def center_window(self):
         """Center the window on screen"""
         self.root.update_idletasks()
@@ -580,132 +1368,63 @@ class InformaticaLauncher:
         y = (self.root.winfo_screenheight() // 2) - (height // 2)
         self.root.geometry(f'{width}x{height}+{x}+{y}')
     
+    @traced("quiz.load")
     def load_daily_quiz(self):
-        """Load or fetch daily quiz question"""
-        cache_file = Path(__file__).parent / "quiz_cache.json"
-        today = datetime.now().strftime("%Y-%m-%d")
-        
-        # Try to load from cache
-        cache_data = {'history': []}
-        if cache_file.exists():
-            try:
-                with open(cache_file, 'r', encoding='utf-8') as f:
-                    cache_data = json.load(f)
-                    
-                # If we have today's question, use it
-                if cache_data.get('current_date') == today and cache_data.get('current_question'):
-                    self.current_quiz = cache_data['current_question']
-                    return
-            except Exception as e:
-                print(f"Error loading quiz cache: {e}")
-                cache_data = {'history': []}
-        
-        # Fetch new question
-        self.current_quiz = self.fetch_quiz_question()
-        
-        # Add to history
-        if 'history' not in cache_data:
-            cache_data['history'] = []
-        
-        # Keep last 30 days of history
-        cache_data['history'] = cache_data['history'][-29:] if len(cache_data['history']) > 29 else cache_data['history']
-        cache_data['history'].append({
-            'date': today,
-            'question': self.current_quiz['question']
-        })
-        
-        # Save to cache
-        self.save_quiz_cache(today, cache_data['history'])
-    
-    def fetch_quiz_question(self):
-        """Fetch a quiz question from Open Trivia Database API"""
-        fallback_questions = [
-            {
-                "question": "What is the capital of Australia?",
-                "correct_answer": "Canberra",
-                "incorrect_answers": ["Sydney", "Melbourne", "Brisbane"]
-            },
-            {
-                "question": "What is the largest planet in our solar system?",
-                "correct_answer": "Jupiter",
-                "incorrect_answers": ["Saturn", "Neptune", "Uranus"]
-            },
-            {
-                "question": "In what year did World War II end?",
-                "correct_answer": "1945",
-                "incorrect_answers": ["1944", "1946", "1943"]
-            },
-            {
-                "question": "What is the smallest prime number?",
-                "correct_answer": "2",
-                "incorrect_answers": ["1", "3", "5"]
-            },
-            {
-                "question": "Which element has the chemical symbol 'Au'?",
-                "correct_answer": "Gold",
-                "incorrect_answers": ["Silver", "Aluminum", "Argon"]
-            },
-            {
-                "question": "What is the speed of light in vacuum (approximately)?",
-                "correct_answer": "299,792 km/s",
-                "incorrect_answers": ["150,000 km/s", "500,000 km/s", "250,000 km/s"]
-            },
-            {
-                "question": "Which country has the longest coastline in the world?",
-                "correct_answer": "Canada",
-                "incorrect_answers": ["Russia", "Indonesia", "Norway"]
-            },
-            {
-                "question": "What is the most abundant gas in Earth's atmosphere?",
-                "correct_answer": "Nitrogen",
-                "incorrect_answers": ["Oxygen", "Carbon Dioxide", "Argon"]
-            }
-        ]
-        
-        # Analytical/Educational categories only:
-        # 17=Science & Nature, 22=Geography, 23=History, 9=General Knowledge
-        categories = [17, 22, 23, 9]
-        selected_category = random.choice(categories)
-        
+        """Load the daily quiz in a background worker and hand it back to the Tk loop"""
+        self.quiz_generation += 1
+        self.quiz_loading = True
+        self.scheduler.call_later("quiz.load", 0, self.apply_daily_quiz, work=self.fetch_daily_quiz)
+    
+    def fetch_daily_quiz(self):
+        """Return today's quiz or None on errors (runs on a scheduler worker)"""
         try:
-            # Try to fetch from API with specific analytical categories
-            response = requests.get(
-                f"https://opentdb.com/api.php?amount=1&difficulty=medium&type=multiple&category={selected_category}",
-                timeout=5
-            )
-            
-            if response.status_code == 200:
-                data = response.json()
-                if data.get('response_code') == 0 and data.get('results'):
-                    result = data['results'][0]
-                    # Decode HTML entities
-                    return {
-                        'question': html.unescape(result['question']),
-                        'correct_answer': html.unescape(result['correct_answer']),
-                        'incorrect_answers': [html.unescape(ans) for ans in result['incorrect_answers']]
-                    }
+            return self.get_daily_quiz()
         except Exception as e:
-            print(f"Error fetching quiz from API: {e}")
-        
-        # Fallback to built-in questions
-        return random.choice(fallback_questions)
+            print(f"Error loading daily quiz: {e}")
+            return None
+    
+    @traced("quiz.apply")
+    def apply_daily_quiz(self, quiz):
+        """Show a freshly loaded quiz on the Tk thread"""
+        if quiz != self.current_quiz:
+            self.quiz_answered = False
+            self.selected_answer = None
+        self.quiz_loading = False
+        self.current_quiz = quiz
+        
+        # Fill the Quiz tab in place if it is currently showing
+        if self.current_tab == "Quiz" and not self.is_searching():
+            self.switch_tab("Quiz")
+        
+        # Top up the local question bank after the quiz has been handed over
+        self.scheduler.call_later("quiz.refill", 0, None, work=self.refill_quiz_bank, pool=NETWORK_POOL)
     
-    def save_quiz_cache(self, date, history=None):
-        """Save current quiz to cache file"""
-        cache_file = Path(__file__).parent / "quiz_cache.json"
+    def refill_quiz_bank(self):
+        """Fetch more questions when the local bank runs low (runs on a scheduler worker)"""
+        if self.quiz_bank.needs_refill():
+            self.quiz_bank.refill()
+    
+    def compact_caches(self):
+        """Trim the quiz history log (runs on a scheduler worker)"""
+        if self.quiz_cache.history_lines > self.quiz_cache.history_limit:
+            self.quiz_cache.compact()
+    
+    @traced("quiz.get_daily")
+    def get_daily_quiz(self):
+        """Return today's quiz question from cache or the local bank (runs off the Tk thread)"""
+        today = datetime.now().strftime("%Y-%m-%d")
         
-        try:
-            cache = {
-                'current_date': date,
-                'current_question': self.current_quiz,
-                'history': history if history is not None else []
-            }
-            
-            with open(cache_file, 'w', encoding='utf-8') as f:
-                json.dump(cache, f, indent=2, ensure_ascii=False)
-        except Exception as e:
-            print(f"Error saving quiz cache: {e}")
+        # If we have today's question, use it
+        quiz = self.quiz_cache.get_current(today)
+        if quiz:
+            return quiz
+        
+        # Take a question from the local bank that has not been asked before
+        quiz = self.quiz_bank.next_question(self.quiz_cache)
+        # Another launcher sharing the cache may have picked today's question first
+        return self.quiz_cache.record(today, quiz)
     
+    @traced("quiz.check_answer")
     def check_answer(self, selected_answer):
         """Check if selected answer is correct and provide visual feedback"""
         if self.quiz_answered:
@@ -759,11 +1478,51 @@ class InformaticaLauncher:
         self.show_answer_btn.config(state=tk.DISABLED)
 
 
-def main():
+def parse_args(argv):
+    """Parse the options of the windowed launcher"""
+    parser = argparse.ArgumentParser(prog="launcher.py", description="Informatica Quick Launcher")
+    parser.add_argument('command', nargs='?', choices=['show'], help=argparse.SUPPRESS)
+    parser.add_argument('--profile', action='store_true',
+                        help=f"Record timing spans and write {TRACE_FILE} on exit")
+    parser.add_argument('--cprofile', action='store_true',
+                        help=f"With --profile, also write a cProfile capture to {CPROFILE_FILE}")
+    return parser.parse_args(argv)
+
+
+def write_profile(profiler):
+    """Write the Chrome trace and, when captured, the cProfile stats next to the launcher"""
+    trace_path = Path(__file__).parent / TRACE_FILE
+    tracer.write_chrome_trace(trace_path)
+    print(f"Timing trace written to {trace_path}")
+    if profiler is not None:
+        profile_path = Path(__file__).parent / CPROFILE_FILE
+        profiler.dump_stats(profile_path)
+        print(f"cProfile stats written to {profile_path}")
+
+
+def main(argv=None):
     """Main entry point"""
+    args = parse_args(sys.argv[1:] if argv is None else argv)
+    profiler = None
+    if args.profile:
+        tracer.enable(keep_all=True)
+        tracer.record("init.imports", IMPORTS_STARTED_NS, IMPORTS_FINISHED_NS - IMPORTS_STARTED_NS)
+        if args.cprofile:
+            import cProfile
+            profiler = cProfile.Profile()
+            profiler.enable()
+    
     root = tk.Tk()
-    app = InformaticaLauncher(root)
-    root.mainloop()
+    # A profiling run is a fresh process and does not take over the running launcher's commands
+    app = InformaticaLauncher(root, resident=not args.profile)
+    try:
+        root.mainloop()
+    finally:
+        app.close_services()
+        if profiler is not None:
+            profiler.disable()
+        if args.profile:
+            write_profile(profiler)
 
 
 if __name__ == "__main__":
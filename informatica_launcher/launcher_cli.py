@@ -0,0 +1,226 @@
+"""
+Headless command-line mode for the Informatica Quick Launcher
+Opens environments without importing tkinter, Pillow or requests
+
+Usage:
+    launcher.py list
+    launcher.py open PROD [QA ...]
+    launcher.py logout
+    launcher.py export OUTPUT_DIR [--format csv|parquet] [--full]
+    launcher.py sync
+    launcher.py show | reload | quit   (handled by a running launcher)
+"""
+import argparse
+import sys
+import webbrowser
+from pathlib import Path
+from config_compiler import compile_config, CategoryStore, ConfigError
+from access_log import AccessLogWriter
+from access_history import AccessHistory
+from browser_profiles import BrowserProfiles
+from launch_dispatcher import LaunchError
+from usage_export import export_usage, ExportError
+from okta_sync import OktaSync
+
+
+APP_DIR = Path(__file__).parent
+
+
+def load_config():
+    """Load the compiled config, reusing the snapshot shared with the GUI"""
+    return compile_config(APP_DIR / "config.json", APP_DIR / ".config_snapshot.bin")
+
+
+def open_access_log(config):
+    """Create the access log writer, recording launches in the history store when possible"""
+    try:
+        history = AccessHistory(APP_DIR / "access_history.db")
+    except Exception as e:
+        print(f"Could not open access history: {e}", file=sys.stderr)
+        history = None
+    return AccessLogWriter.from_config(APP_DIR / "access_log.txt", config, history=history)
+
+
+def command_list(config, args):
+    """Print every category with its items"""
+    store = CategoryStore(config)
+    for category_name in store.names():
+        try:
+            items = store.get(category_name)
+        except ConfigError as e:
+            print(f"{category_name}: {e}", file=sys.stderr)
+            continue
+        print(f"{category_name}:")
+        for item in items:
+            print(f"  {item['shortName']:<16} {item['name']}")
+    for set_name, items in store.launch_sets().items():
+        print(f"Set '{set_name}': {', '.join(item['shortName'] for item in items)}")
+    return 0
+
+
+def command_open(config, args):
+    """Open items or launch sets by shortName or name"""
+    store = CategoryStore(config)
+    items = []
+    for reference in args.names:
+        item = store.find(reference)
+        if item is not None:
+            items.append(item)
+            continue
+        launch_sets = {name.lower(): members for name, members in store.launch_sets().items()}
+        if reference.lower() in launch_sets:
+            items.extend(launch_sets[reference.lower()])
+            continue
+        print(f"No item or launch set named '{reference}'. Run 'launcher.py list' to see them.",
+              file=sys.stderr)
+        return 1
+
+    profiles = BrowserProfiles.from_config(config)
+    access_log = open_access_log(config)
+    status = 0
+    for item in items:
+        try:
+            if profiles is not None:
+                profiles.open_item(item['url'], item)
+            elif not webbrowser.open(item['url']):
+                raise LaunchError("no browser could be started")
+        except LaunchError as e:
+            print(f"Failed to open {item['name']}: {e}", file=sys.stderr)
+            status = 1
+            continue
+        access_log.log_access(item['name'])
+        print(f"Launched {item['name']}")
+    access_log.close()
+    return status
+
+
+def command_logout(config, args):
+    """Open the Okta logout page"""
+    logout_url = config.get('okta_logout_url')
+    if not logout_url:
+        okta_domain = config.get('okta_domain', '')
+        if not okta_domain:
+            print("No Okta logout URL configured in config.json", file=sys.stderr)
+            return 1
+        logout_url = f"{okta_domain.rstrip('/')}/login/signout"
+
+    if not webbrowser.open(logout_url):
+        print("Failed to open logout page: no browser could be started", file=sys.stderr)
+        return 1
+
+    access_log = open_access_log(config)
+    access_log.log_logout()
+    access_log.close()
+    print("Opened Okta logout page")
+    return 0
+
+
+def command_export(config, args):
+    """Export access_log.txt and its rotations as day-partitioned files plus a daily rollup"""
+    backup_count = config.get('access_log', {}).get('backup_count', 5)
+    try:
+        exported, skipped = export_usage(
+            APP_DIR / "access_log.txt",
+            args.output_dir,
+            file_format=args.format,
+            full=args.full,
+            backup_count=max(backup_count, 20)
+        )
+    except (ExportError, OSError) as e:
+        print(f"Export failed: {e}", file=sys.stderr)
+        return 1
+
+    print(f"Exported {exported} new record(s) to {args.output_dir}")
+    if skipped:
+        print(f"Skipped {skipped} unrecognized line(s)", file=sys.stderr)
+    return 0
+
+
+def command_sync(config, args):
+    """Fetch the Okta dashboard apps now and show where the rules put them"""
+    # Imported here so the other commands do not load requests
+    from http_client import HttpClient
+    http = HttpClient.from_config(APP_DIR / "http_state.json", config)
+    sync = OktaSync.from_config(APP_DIR, config, http)
+    if sync is None:
+        print("Okta sync is off; add an 'okta_sync' section to config.json", file=sys.stderr)
+        return 1
+    try:
+        app_count = sync.sync()
+    except Exception as e:
+        print(f"Okta sync failed: {e}", file=sys.stderr)
+        return 1
+    finally:
+        http.close()
+
+    if app_count is None:
+        print("Okta apps unchanged")
+    else:
+        print(f"Synced {app_count} app(s) from Okta")
+    store = CategoryStore(load_config())
+    for category_name in store.names():
+        try:
+            synced = [item for item in store.get(category_name) if item.get('source') == 'okta']
+        except ConfigError:
+            continue
+        if synced:
+            print(f"  {category_name}: {', '.join(item['name'] for item in synced)}")
+    for problem in store.config.get('synced_errors', []):
+        print(f"Skipped {problem}", file=sys.stderr)
+    return 0
+
+
+def command_not_running(config, args):
+    """Report a command that only a running launcher can handle"""
+    print(f"No running launcher to {args.command}", file=sys.stderr)
+    return 1
+
+
+def build_parser():
+    """Create the argument parser for the headless commands"""
+    parser = argparse.ArgumentParser(
+        prog="launcher.py",
+        description="Open Informatica environments without starting the window"
+    )
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    subparsers.add_parser('list', help="List all items and launch sets")
+    open_parser = subparsers.add_parser('open', help="Open items or launch sets by shortName or name")
+    open_parser.add_argument('names', nargs='+')
+    subparsers.add_parser('logout', help="Open the Okta logout page")
+    export_parser = subparsers.add_parser(
+        'export', help="Export usage as day-partitioned CSV/Parquet plus a daily rollup"
+    )
+    export_parser.add_argument('output_dir')
+    export_parser.add_argument('--format', choices=['csv', 'parquet'], default='csv')
+    export_parser.add_argument('--full', action='store_true',
+                               help="Ignore the checkpoint and export everything again")
+    subparsers.add_parser('sync', help="Fetch the app list from the Okta dashboard now")
+    subparsers.add_parser('reload', help="Reload config.json in the running launcher")
+    subparsers.add_parser('quit', help="Close the running launcher")
+    return parser
+
+
+def main(argv=None):
+    """Run a headless command and return the exit code"""
+    args = build_parser().parse_args(argv)
+    try:
+        config = load_config()
+    except ConfigError as e:
+        print("\n".join(e.errors), file=sys.stderr)
+        return 2
+
+    handlers = {
+        'list': command_list,
+        'open': command_open,
+        'logout': command_logout,
+        'export': command_export,
+        'sync': command_sync,
+        'reload': command_not_running,
+        'quit': command_not_running,
+    }
+    return handlers[args.command](config, args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
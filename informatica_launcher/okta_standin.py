@@ -0,0 +1,101 @@
+"""
+Local stand-in for the Okta apps endpoint, for trying out okta_sync rules
+Serves the app links in a JSON file at /api/v1/users/me/appLinks with ETag and
+Last-Modified headers and answers conditional requests with 304. Edit the
+file while it runs to simulate dashboard changes
+
+Usage:
+    python okta_standin.py apps.json [--port 8765]
+
+Then set "okta_sync": {"apps_url": "http://127.0.0.1:8765/api/v1/users/me/appLinks", ...}
+in config.json and run: python launcher.py sync
+"""
+import argparse
+import hashlib
+import sys
+from email.utils import formatdate, parsedate_to_datetime
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from pathlib import Path
+from okta_sync import APPS_PATH
+
+
+EXAMPLE_APPS = """[
+  {"label": "Informatica MDM Dev", "appName": "salesforce_informaticamdmdev_1",
+   "linkUrl": "https://example.okta.com/home/salesforce_informaticamdmdev_1/0oa1/aln1", "sortOrder": 0},
+  {"label": "Optum HSA", "appName": "bookmark",
+   "linkUrl": "https://example.okta.com/home/bookmark/0oa2/2557", "sortOrder": 1}
+]
+"""
+
+
+class StandInHandler(BaseHTTPRequestHandler):
+    """Serves the apps file with validators and counts full and 304 responses"""
+
+    apps_path = None
+    counts = {'200': 0, '304': 0}
+
+    def do_GET(self):
+        if self.path.split('?')[0] != '/' + APPS_PATH:
+            self.send_error(404)
+            return
+        body = self.apps_path.read_bytes()
+        etag = '"' + hashlib.sha1(body).hexdigest()[:16] + '"'
+        mtime = int(self.apps_path.stat().st_mtime)
+        last_modified = formatdate(mtime, usegmt=True)
+
+        if self.not_modified(etag, mtime):
+            self.counts['304'] += 1
+            self.send_response(304)
+            self.send_header('ETag', etag)
+            self.end_headers()
+            return
+
+        self.counts['200'] += 1
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.send_header('ETag', etag)
+        self.send_header('Last-Modified', last_modified)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def not_modified(self, etag, mtime):
+        """Apply If-None-Match, or If-Modified-Since when no ETag was sent"""
+        if_none_match = self.headers.get('If-None-Match')
+        if if_none_match is not None:
+            return etag in [tag.strip() for tag in if_none_match.split(',')]
+        if_modified_since = self.headers.get('If-Modified-Since')
+        if if_modified_since:
+            try:
+                return mtime <= parsedate_to_datetime(if_modified_since).timestamp()
+            except (TypeError, ValueError):
+                return False
+        return False
+
+    def log_message(self, format, *args):
+        print(f"{self.command} {self.path} -> {args[1]}  (200: {self.counts['200']}, 304: {self.counts['304']})")
+
+
+def main(argv=None):
+    """Serve the apps file until interrupted"""
+    parser = argparse.ArgumentParser(description="Serve app links like the Okta dashboard API")
+    parser.add_argument('apps_file', help="JSON list of app links (created with an example if missing)")
+    parser.add_argument('--port', type=int, default=8765)
+    args = parser.parse_args(argv)
+
+    apps_path = Path(args.apps_file)
+    if not apps_path.exists():
+        apps_path.write_text(EXAMPLE_APPS, encoding='utf-8')
+    StandInHandler.apps_path = apps_path
+
+    server = ThreadingHTTPServer(('127.0.0.1', args.port), StandInHandler)
+    print(f"Serving {apps_path} at http://127.0.0.1:{args.port}/{APPS_PATH}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,244 @@
+"""
+Okta dashboard sync for the Informatica Quick Launcher
+Fetches the user's app links from the Okta apps endpoint into a per-user cache
+file with conditional requests (ETag / If-Modified-Since). The config compiler maps
+the cached apps into categories with the 'okta_sync' rules and merges them
+with the items configured by hand
+"""
+import hashlib
+import json
+import os
+import re
+import time
+from pathlib import Path
+from shared_state import replace_atomically, user_data_dir
+
+
+# End-user dashboard endpoint, relative to okta_domain
+APPS_PATH = "api/v1/users/me/appLinks"
+
+# Environment variable holding the API token sent with the request
+DEFAULT_TOKEN_ENV = "OKTA_API_TOKEN"
+
+# Category of apps that match no rule, unless 'default_category' says otherwise
+DEFAULT_CATEGORY = "Okta"
+
+# App link fields a rule's pattern can be matched against
+MATCH_FIELDS = ('label', 'appName', 'linkUrl')
+
+# App link fields kept in the cache
+APP_FIELDS = ('label', 'linkUrl', 'appName', 'appInstanceId', 'logoUrl', 'sortOrder', 'hidden')
+
+
+class SyncError(Exception):
+    """Raised when the apps endpoint cannot be read"""
+
+
+def sync_settings(config):
+    """Return the 'okta_sync' section as a dict, or None when sync is off"""
+    settings = config.get('okta_sync')
+    if settings is True:
+        settings = {}
+    if not isinstance(settings, dict) or not settings.get('enabled', True):
+        return None
+    return settings
+
+
+def validate_sync_settings(settings):
+    """Return a list of problems in an 'okta_sync' section"""
+    errors = []
+    apps_url = settings.get('apps_url')
+    if apps_url is not None and (not isinstance(apps_url, str) or not apps_url.startswith(('http://', 'https://'))):
+        errors.append("okta_sync.apps_url must be an http or https URL")
+    interval = settings.get('interval_minutes', 60)
+    if not isinstance(interval, (int, float)) or isinstance(interval, bool) or interval <= 0:
+        errors.append("okta_sync.interval_minutes must be a positive number")
+    default_category = settings.get('default_category', DEFAULT_CATEGORY)
+    if default_category is not None and not isinstance(default_category, str):
+        errors.append("okta_sync.default_category must be a category name or null")
+
+    rules = settings.get('rules', [])
+    if not isinstance(rules, list):
+        return errors + ["okta_sync.rules must be a list"]
+    for index, rule in enumerate(rules):
+        location = f"okta_sync.rules[{index}]"
+        if not isinstance(rule, dict):
+            errors.append(f"{location} must be an object")
+            continue
+        try:
+            re.compile(rule.get('match', ''))
+        except (re.error, TypeError) as e:
+            errors.append(f"{location}.match is not a valid pattern: {e}")
+        if rule.get('field', 'any') not in MATCH_FIELDS + ('any',):
+            errors.append(f"{location}.field must be one of {', '.join(MATCH_FIELDS)} or any")
+        if not rule.get('exclude') and not isinstance(rule.get('category'), str):
+            errors.append(f"{location} needs a 'category' (or \"exclude\": true)")
+        for key in ('type', 'profile', 'description'):
+            if key in rule and not isinstance(rule[key], str):
+                errors.append(f"{location}.{key} must be a string")
+    return errors
+
+
+def url_key(url):
+    """Normalize a URL for duplicate detection"""
+    return url.strip().rstrip('/').lower()
+
+
+def map_apps(apps, settings):
+    """Return {category: [item]} for the cached apps, in dashboard order, using the first matching rule"""
+    rules = [
+        (re.compile(rule.get('match', ''), re.IGNORECASE), rule)
+        for rule in settings.get('rules', [])
+    ]
+    default_category = settings.get('default_category', DEFAULT_CATEGORY)
+
+    mapped = {}
+    for app in sorted(apps, key=lambda app: app.get('sortOrder', 0)):
+        label = app.get('label')
+        url = app.get('linkUrl')
+        if app.get('hidden') or not label or not url:
+            continue
+
+        target = None
+        for pattern, rule in rules:
+            field = rule.get('field', 'any')
+            fields = MATCH_FIELDS if field == 'any' else (field,)
+            if any(pattern.search(app.get(name) or '') for name in fields):
+                target = rule
+                break
+        if target is not None and target.get('exclude'):
+            continue
+        category_name = target['category'] if target is not None else default_category
+        if category_name is None:
+            continue
+
+        item = {
+            'name': label,
+            'shortName': label,
+            'url': url,
+            'type': (target or {}).get('type', 'default'),
+            'description': (target or {}).get('description', "From the Okta dashboard"),
+            'source': 'okta',
+        }
+        if target is not None and target.get('profile'):
+            item['profile'] = target['profile']
+        mapped.setdefault(category_name, []).append(item)
+    return mapped
+
+
+def merge_items(items, synced, known_urls):
+    """Return items followed by the synced items whose URL is not configured already"""
+    merged = list(items)
+    for item in synced:
+        key = url_key(item['url'])
+        if key not in known_urls:
+            known_urls.add(key)
+            merged.append(item)
+    return merged
+
+
+def cache_path(app_dir):
+    """Return this user's cache file for a launcher folder.
+
+    The apps are fetched with the user's own token, so the cache lives in the
+    per-user folder rather than next to a (possibly shared) config.json
+    """
+    digest = hashlib.sha1(str(Path(app_dir).resolve()).encode('utf-8')).hexdigest()[:12]
+    return user_data_dir() / f"okta_apps_{digest}.json"
+
+
+def read_cache(path):
+    """Return the cached sync state, or an empty one"""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        return {'apps': []}
+    return cache if isinstance(cache, dict) else {'apps': []}
+
+
+class OktaSync:
+    """Fetches the app links with conditional requests and caches them per user"""
+
+    def __init__(self, cache_path, http, apps_url, token=None, interval=3600):
+        self.cache_path = Path(cache_path)
+        self.http = http
+        self.apps_url = apps_url
+        self.token = token
+        self.interval = interval
+
+    @classmethod
+    def from_config(cls, app_dir, config, http):
+        """Create a sync from the optional 'okta_sync' section, or None if it is off"""
+        settings = sync_settings(config)
+        if settings is None:
+            return None
+        apps_url = settings.get('apps_url')
+        if not apps_url:
+            okta_domain = config.get('okta_domain')
+            if not okta_domain:
+                print("Okta sync needs okta_domain or okta_sync.apps_url")
+                return None
+            apps_url = okta_domain.rstrip('/') + '/' + APPS_PATH
+        return cls(
+            cache_path(app_dir),
+            http,
+            apps_url,
+            token=os.environ.get(settings.get('token_env', DEFAULT_TOKEN_ENV)),
+            interval=settings.get('interval_minutes', 60) * 60
+        )
+
+    def request_headers(self, cache):
+        """Return the headers for a conditional request"""
+        headers = {'Accept': 'application/json'}
+        if self.token:
+            token = self.token.strip()
+            headers['Authorization'] = token if token.startswith(('SSWS ', 'Bearer ')) else f"SSWS {token}"
+        # Validators only count for the URL they came from
+        if cache.get('url') == self.apps_url:
+            if cache.get('etag'):
+                headers['If-None-Match'] = cache['etag']
+            if cache.get('last_modified'):
+                headers['If-Modified-Since'] = cache['last_modified']
+        return headers
+
+    def sync(self):
+        """Refresh the cache; returns the number of apps when they changed, else None (runs on a worker)"""
+        cache = read_cache(self.cache_path)
+        response = self.http.get(self.apps_url, headers=self.request_headers(cache), allow_redirects=False)
+
+        if response.status_code == 304:
+            return None
+        if response.status_code in (401, 403):
+            raise SyncError(
+                f"Okta rejected the request (HTTP {response.status_code}); "
+                f"check the API token in ${DEFAULT_TOKEN_ENV} or okta_sync.token_env"
+            )
+        if response.status_code != 200:
+            raise SyncError(f"Okta apps endpoint returned HTTP {response.status_code}")
+        try:
+            apps = response.json()
+        except ValueError:
+            raise SyncError("Okta apps endpoint did not return JSON (is the URL right?)")
+        if not isinstance(apps, list):
+            raise SyncError("Okta apps endpoint did not return a list of app links")
+
+        apps = [
+            {field: app[field] for field in APP_FIELDS if field in app}
+            for app in apps if isinstance(app, dict)
+        ]
+        updated = {
+            'url': self.apps_url,
+            'etag': response.headers.get('ETag'),
+            'last_modified': response.headers.get('Last-Modified'),
+            'apps': apps,
+        }
+        unchanged = all(cache.get(key) == value for key, value in updated.items())
+        if unchanged:
+            return None
+
+        # Rewriting the file is what makes running launchers reload, so only do it on changes
+        updated['synced_at'] = time.strftime("%Y-%m-%d %H:%M:%S")
+        self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+        replace_atomically(self.cache_path, json.dumps(updated, ensure_ascii=False, indent=1).encode('utf-8'))
+        return len(apps)
@@ -0,0 +1,179 @@
+"""
+Local quiz question bank for the Informatica Quick Launcher
+Questions are prefetched in bulk from the Open Trivia Database so the daily
+question never needs the network on the startup path
+"""
+import html
+import random
+import threading
+from pathlib import Path
+from http_client import CircuitOpenError, StoppedError
+from shared_state import SharedJsonFile, ConflictError
+
+
+# Open Trivia Database API endpoint
+DEFAULT_API_URL = "https://opentdb.com/api.php"
+
+# Analytical/Educational categories only:
+# 17=Science & Nature, 22=Geography, 23=History, 9=General Knowledge
+QUIZ_CATEGORIES = (9, 17, 22, 23)
+
+# Built-in questions used when the bank is empty and the API is unreachable
+FALLBACK_QUESTIONS = (
+    {
+        "question": "What is the capital of Australia?",
+        "correct_answer": "Canberra",
+        "incorrect_answers": ["Sydney", "Melbourne", "Brisbane"]
+    },
+    {
+        "question": "What is the largest planet in our solar system?",
+        "correct_answer": "Jupiter",
+        "incorrect_answers": ["Saturn", "Neptune", "Uranus"]
+    },
+    {
+        "question": "In what year did World War II end?",
+        "correct_answer": "1945",
+        "incorrect_answers": ["1944", "1946", "1943"]
+    },
+    {
+        "question": "What is the smallest prime number?",
+        "correct_answer": "2",
+        "incorrect_answers": ["1", "3", "5"]
+    },
+    {
+        "question": "Which element has the chemical symbol 'Au'?",
+        "correct_answer": "Gold",
+        "incorrect_answers": ["Silver", "Aluminum", "Argon"]
+    },
+    {
+        "question": "What is the speed of light in vacuum (approximately)?",
+        "correct_answer": "299,792 km/s",
+        "incorrect_answers": ["150,000 km/s", "500,000 km/s", "250,000 km/s"]
+    },
+    {
+        "question": "Which country has the longest coastline in the world?",
+        "correct_answer": "Canada",
+        "incorrect_answers": ["Russia", "Indonesia", "Norway"]
+    },
+    {
+        "question": "What is the most abundant gas in Earth's atmosphere?",
+        "correct_answer": "Nitrogen",
+        "incorrect_answers": ["Oxygen", "Carbon Dioxide", "Argon"]
+    }
+)
+
+
+class QuizBank:
+    """File-backed pool of unused quiz questions, refilled in bulk when it runs low"""
+
+    def __init__(self, path, http, api_url=DEFAULT_API_URL, batch_size=50, low_water=20,
+                 request_interval=5.0, stop_event=None):
+        self.path = Path(path)
+        self.http = http
+        self.api_url = api_url
+        self.batch_size = batch_size
+        self.low_water = low_water
+        # opentdb.com allows one request per IP every 5 seconds
+        self.request_interval = request_interval
+        # Set on shutdown so a refill stops between requests instead of sleeping on
+        self.stop_event = stop_event or threading.Event()
+        self.lock = threading.Lock()
+        # Launchers sharing the bank take questions with compare-and-swap, so none is handed out twice
+        self.store = SharedJsonFile(self.path, default={'questions': []})
+
+    def next_question(self, asked=()):
+        """Take the next question whose text is not in asked (any container) from the local bank"""
+        taken = []
+
+        def take(bank):
+            del taken[:]
+            questions = bank.get('questions', [])
+            while questions:
+                question = questions.pop(0)
+                if question['question'] not in asked:
+                    taken.append(question)
+                    break
+            return {'questions': questions}
+
+        with self.lock:
+            try:
+                self.store.update(take)
+            except (OSError, ConflictError) as e:
+                print(f"Error saving quiz bank: {e}")
+        if taken:
+            return taken[0]
+
+        # Bank exhausted - fall back to built-in questions
+        unasked = [q for q in FALLBACK_QUESTIONS if q['question'] not in asked]
+        return dict(random.choice(unasked or FALLBACK_QUESTIONS))
+
+    def needs_refill(self):
+        """Return True when fewer than low_water questions remain"""
+        bank, _ = self.store.read()
+        return len(bank.get('questions', [])) < self.low_water
+
+    def refill(self, asked=()):
+        """Fetch batch_size questions per category and add the new ones to the bank"""
+        fetched = []
+        for index, category in enumerate(QUIZ_CATEGORIES):
+            if index and self.request_interval and self.stop_event.wait(self.request_interval):
+                break
+            try:
+                fetched.extend(self.fetch_category(category))
+            except CircuitOpenError as e:
+                print(f"Skipping quiz refill: {e}")
+                break
+            except StoppedError:
+                break
+
+        random.shuffle(fetched)
+
+        def merge(bank):
+            questions = bank.get('questions', [])
+            known = set(asked) | {q['question'] for q in questions}
+            for question in fetched:
+                if question['question'] not in known:
+                    known.add(question['question'])
+                    questions.append(question)
+            return {'questions': questions}
+
+        with self.lock:
+            try:
+                return len(self.store.update(merge)['questions'])
+            except (OSError, ConflictError) as e:
+                print(f"Error saving quiz bank: {e}")
+                return 0
+
+    def fetch_category(self, category):
+        """Fetch one bulk batch of questions for a category"""
+        try:
+            response = self.http.get(
+                self.api_url,
+                params={
+                    'amount': self.batch_size,
+                    'difficulty': 'medium',
+                    'type': 'multiple',
+                    'category': category
+                }
+            )
+            if response.status_code != 200:
+                return []
+
+            data = response.json()
+            if data.get('response_code') != 0:
+                return []
+
+            # Decode HTML entities
+            return [
+                {
+                    'question': html.unescape(result['question']),
+                    'correct_answer': html.unescape(result['correct_answer']),
+                    'incorrect_answers': [html.unescape(ans) for ans in result['incorrect_answers']]
+                }
+                for result in data.get('results', [])
+            ]
+        except (CircuitOpenError, StoppedError):
+            raise
+        except Exception as e:
+            print(f"Error fetching quiz questions from API: {e}")
+            return []
@@ -0,0 +1,146 @@
+"""
+Crash-safe quiz cache for the Informatica Quick Launcher
+Today's question is written atomically to quiz_cache.json and the question
+history is kept as an append-only log with an in-memory hash index. Both are
+safe to share between launchers (see shared_state.py)
+"""
+import hashlib
+import json
+import threading
+from pathlib import Path
+from shared_state import SharedJsonFile, ConflictError, FileLock, append_record, replace_atomically
+
+
+def question_hash(question_text):
+    """Return a stable hash of a question's normalized text"""
+    normalized = " ".join(question_text.split()).lower()
+    return hashlib.sha1(normalized.encode('utf-8')).hexdigest()
+
+
+class QuizCache:
+    """Current daily question plus an append-only, de-duplicated question history"""
+
+    def __init__(self, path, history_path, history_limit=30):
+        self.path = Path(path)
+        self.history_path = Path(history_path)
+        self.history_limit = history_limit
+        self.store = SharedJsonFile(self.path)
+        self.lock = threading.Lock()
+        self.current = {}
+        self.hashes = set()
+        self.history_lines = 0
+        self.compacting = False
+        self.load()
+
+    def load(self):
+        """Read the current question and index the history log"""
+        self.current, _ = self.store.read()
+
+        # Older caches kept the history inside quiz_cache.json
+        legacy_history = self.current.pop('history', None)
+        if legacy_history and not self.history_path.exists():
+            self.append_history(legacy_history)
+            try:
+                self.current = self.store.update(
+                    lambda current: {key: value for key, value in current.items() if key != 'history'}
+                )
+            except (OSError, ConflictError) as e:
+                print(f"Error saving quiz cache: {e}")
+
+        if self.history_path.exists():
+            with open(self.history_path, 'r', encoding='utf-8') as f:
+                for line in f:
+                    entry = self.parse_history_line(line)
+                    if entry:
+                        self.hashes.add(entry['hash'])
+                        self.history_lines += 1
+
+    def parse_history_line(self, line):
+        """Parse one history record, skipping a torn final line after a crash"""
+        try:
+            entry = json.loads(line)
+        except ValueError:
+            return None
+        if 'hash' not in entry and entry.get('question'):
+            entry['hash'] = question_hash(entry['question'])
+        return entry if 'hash' in entry else None
+
+    def __contains__(self, question_text):
+        """Return True if a question has been asked before (O(1))"""
+        return question_hash(question_text) in self.hashes
+
+    def get_current(self, date):
+        """Return the cached question for date, or None"""
+        if self.current.get('current_date') == date and self.current.get('current_question'):
+            return self.current['current_question']
+        return None
+
+    def record(self, date, quiz):
+        """Store today's question and append it to the history; returns the question to show.
+
+        When another launcher sharing this cache already picked a question for date,
+        that one is kept and returned so everybody sees the same quiz.
+        """
+        def choose(current):
+            if current.get('current_date') == date and current.get('current_question'):
+                return current
+            return {'current_date': date, 'current_question': quiz}
+
+        with self.lock:
+            try:
+                self.current = self.store.update(choose)
+            except (OSError, ConflictError) as e:
+                print(f"Error saving quiz cache: {e}")
+                self.current = {'current_date': date, 'current_question': quiz}
+            stored = self.current['current_question']
+            if stored['question'] == quiz['question']:
+                self.append_history([{'date': date, 'question': quiz['question']}])
+
+        if self.history_lines > 2 * self.history_limit:
+            self.compact_async()
+        return stored
+
+    def append_history(self, entries):
+        """Append history entries in a single write (locked, because compaction rewrites the file)"""
+        lines = []
+        for entry in entries:
+            digest = question_hash(entry['question'])
+            self.hashes.add(digest)
+            lines.append(json.dumps({
+                'date': entry.get('date'),
+                'question': entry['question'],
+                'hash': digest
+            }, ensure_ascii=False) + "\n")
+        try:
+            append_record(self.history_path, "".join(lines), locked=True)
+            self.history_lines += len(lines)
+        except Exception as e:
+            print(f"Error appending quiz history: {e}")
+
+    def compact_async(self):
+        """Trim the history log to history_limit entries on a background thread"""
+        with self.lock:
+            if self.compacting:
+                return
+            self.compacting = True
+        threading.Thread(target=self.compact, name="quiz-history-compactor", daemon=True).start()
+
+    def compact(self):
+        """Rewrite the history log keeping only the most recent entries"""
+        try:
+            # The file lock keeps other launchers from appending while the log is rewritten
+            with self.lock, FileLock(self.history_path):
+                with open(self.history_path, 'r', encoding='utf-8') as f:
+                    entries = [e for e in (self.parse_history_line(line) for line in f) if e]
+                entries = entries[-self.history_limit:]
+
+                replace_atomically(self.history_path, "".join(
+                    json.dumps(entry, ensure_ascii=False) + "\n" for entry in entries
+                ).encode('utf-8'))
+
+                self.hashes = {entry['hash'] for entry in entries}
+                self.history_lines = len(entries)
+        except Exception as e:
+            print(f"Error compacting quiz history: {e}")
+        finally:
+            self.compacting = False
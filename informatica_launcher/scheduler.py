@@ -0,0 +1,203 @@
+"""
+Task scheduler for the Informatica Quick Launcher
+Runs named one-shot, interval and daily (wall-clock) tasks on the Tk event
+loop. Scheduling a name again replaces the pending task, and a task's
+optional heavy work runs on a worker thread before its callback. Blocking
+network work runs on its own pool so it never holds up local work.
+ResultQueue hands finished work back to the Tk thread, here and for the
+launch dispatcher and health prober
+"""
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+
+
+# Longest single wait for a wall-clock task, so a clock change or a
+# suspended laptop delays it by at most this much
+WALL_CLOCK_CHECK_MS = 60 * 1000
+
+# Worker pool for a task's work: local work (index builds, cache reads) or
+# slow network calls with retries and back-off sleeps
+DEFAULT_POOL = "default"
+NETWORK_POOL = "network"
+
+
+class ResultQueue:
+    """Runs callbacks for finished futures on the Tk thread; polls root.after only while some are pending"""
+
+    def __init__(self, root, poll_interval_ms=50):
+        self.root = root
+        self.poll_interval_ms = poll_interval_ms
+        self.queue = queue.Queue()
+        self.pending = 0
+        self.closed = False
+
+    def watch(self, future, callback, description):
+        """Call callback(future) on the Tk thread once future is done; cancelled futures are dropped"""
+        future.add_done_callback(lambda f: self.queue.put((f, callback, description)))
+        self.pending += 1
+        if self.pending == 1 and not self.closed:
+            self.root.after(self.poll_interval_ms, self.poll)
+
+    def poll(self):
+        """Deliver finished futures (Tk thread)"""
+        while True:
+            try:
+                future, callback, description = self.queue.get_nowait()
+            except queue.Empty:
+                break
+            self.pending -= 1
+            if future.cancelled():
+                continue
+            try:
+                callback(future)
+            except Exception as e:
+                print(f"Error handling {description}: {e}")
+
+        if self.pending > 0 and not self.closed:
+            self.root.after(self.poll_interval_ms, self.poll)
+
+    def close(self):
+        """Stop polling; results that arrive later are dropped"""
+        self.closed = True
+
+
+class Task:
+    """One named entry in the scheduler"""
+
+    def __init__(self, name, callback, work=None, interval_ms=None, daily=False, pool=DEFAULT_POOL):
+        self.name = name
+        self.callback = callback
+        self.work = work
+        self.pool = pool
+        self.interval_ms = interval_ms
+        self.daily = daily
+        self.due = None
+        self.after_id = None
+        self.running = False
+
+
+class Scheduler:
+    """Named, cancellable tasks on root.after with heavy work on small worker pools"""
+
+    def __init__(self, root, max_workers=2, network_workers=2, poll_interval_ms=50):
+        self.root = root
+        self.executors = {
+            DEFAULT_POOL: ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="scheduler"),
+            NETWORK_POOL: ThreadPoolExecutor(max_workers=network_workers, thread_name_prefix="scheduler-net"),
+        }
+        self.tasks = {}
+        self.results = ResultQueue(root, poll_interval_ms)
+        # Set by shutdown; long-running work waits on it instead of sleeping so it can stop early
+        self.stopping = threading.Event()
+
+    def call_later(self, name, delay_ms, callback, work=None, pool=DEFAULT_POOL):
+        """Run a task once after delay_ms; replaces any task of the same name"""
+        task = self.add(Task(name, callback, work, pool=pool))
+        self.arm(task, delay_ms)
+        return task
+
+    def every(self, name, interval_ms, callback, work=None, first_delay_ms=None, pool=DEFAULT_POOL):
+        """Run a task repeatedly, interval_ms after each run finishes"""
+        task = self.add(Task(name, callback, work, interval_ms=interval_ms, pool=pool))
+        self.arm(task, interval_ms if first_delay_ms is None else first_delay_ms)
+        return task
+
+    def at_midnight(self, name, callback, work=None, pool=DEFAULT_POOL):
+        """Run a task each time the local date changes"""
+        task = self.add(Task(name, callback, work, daily=True, pool=pool))
+        self.arm_daily(task)
+        return task
+
+    def add(self, task):
+        """Register a task, cancelling the one it replaces"""
+        self.cancel(task.name)
+        self.tasks[task.name] = task
+        return task
+
+    def cancel(self, name):
+        """Cancel a task by name; a result still being computed for it is discarded"""
+        task = self.tasks.pop(name, None)
+        if task is not None and task.after_id is not None:
+            self.root.after_cancel(task.after_id)
+            task.after_id = None
+        return task is not None
+
+    def is_scheduled(self, name):
+        """Return True while a task of this name is pending or running"""
+        return name in self.tasks
+
+    def arm(self, task, delay_ms):
+        """Start the Tk timer for a task's next run"""
+        task.after_id = self.root.after(max(0, int(delay_ms)), lambda: self.fire(task))
+
+    def arm_daily(self, task):
+        """Wait for the next midnight in steps of at most WALL_CLOCK_CHECK_MS"""
+        now = datetime.now()
+        if task.due is None:
+            task.due = datetime.combine(now.date() + timedelta(days=1), datetime.min.time())
+        remaining_ms = (task.due - now).total_seconds() * 1000
+        self.arm(task, min(max(remaining_ms, 0), WALL_CLOCK_CHECK_MS))
+
+    def fire(self, task):
+        """Timer callback: run the task now, or keep waiting for a wall-clock task"""
+        task.after_id = None
+        if self.tasks.get(task.name) is not task:
+            return
+        if task.daily and datetime.now() < task.due:
+            self.arm_daily(task)
+            return
+
+        if task.work is None:
+            self.finish(task, None)
+            return
+
+        task.running = True
+        future = self.executors[task.pool].submit(task.work)
+        self.results.watch(future, lambda f: self.work_done(task, f), f"scheduled task {task.name}")
+
+    def work_done(self, task, future):
+        """Pass finished work to the task's callback (Tk thread)"""
+        task.running = False
+        if self.tasks.get(task.name) is not task:
+            return  # Cancelled or replaced while the work was running
+        error = future.exception()
+        if error is not None:
+            print(f"Error in scheduled task {task.name}: {error}")
+            self.reschedule(task)
+        else:
+            self.finish(task, future.result())
+
+    def finish(self, task, result):
+        """Run the callback on the Tk thread, then schedule the next run"""
+        try:
+            if task.callback is not None:
+                if task.work is None:
+                    task.callback()
+                else:
+                    task.callback(result)
+        except Exception as e:
+            print(f"Error in scheduled task {task.name}: {e}")
+        self.reschedule(task)
+
+    def reschedule(self, task):
+        """Re-arm repeating tasks and forget finished one-shot tasks"""
+        if self.tasks.get(task.name) is not task:
+            return  # The callback cancelled or replaced it
+        if task.interval_ms is not None:
+            self.arm(task, task.interval_ms)
+        elif task.daily:
+            task.due = None
+            self.arm_daily(task)
+        else:
+            del self.tasks[task.name]
+
+    def shutdown(self):
+        """Cancel every task, drop queued work and tell running work to stop"""
+        self.results.close()
+        self.stopping.set()
+        for name in list(self.tasks):
+            self.cancel(name)
+        for executor in self.executors.values():
+            executor.shutdown(wait=False, cancel_futures=True)
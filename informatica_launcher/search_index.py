@@ -0,0 +1,143 @@
+"""
+In-memory search index for the Informatica Quick Launcher
+Prefix trie over item words plus trigram postings for fuzzy matches, and
+sorted short names and names so exact and prefix matches are never cut off
+"""
+import re
+from bisect import bisect_left
+from collections import Counter
+
+
+# Fields of an item that are searchable
+SEARCH_FIELDS = ('shortName', 'name', 'description')
+
+# Word-match candidates collected per query; keeps keystroke latency flat for huge configs
+MAX_CANDIDATES = 200
+
+WORD_PATTERN = re.compile(r"[a-z0-9]+")
+
+
+def trigrams(text):
+    """Return the set of padded character trigrams of a string"""
+    padded = f"  {text} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+class SearchIndex:
+    """Index of (category, item) entries searchable by prefix and fuzzy trigram match"""
+
+    def __init__(self, categories):
+        self.entries = []
+        self.exact_ids = {}
+        self.name_keys = []
+        self.name_keys_sorted = True
+        self.trie = {}
+        self.trigram_postings = {}
+        for category_name, items in categories.items():
+            for item in items:
+                self.add(category_name, item)
+        self.sort_name_keys()
+
+    def add(self, category_name, item):
+        """Index one item under its category"""
+        entry_id = len(self.entries)
+        self.entries.append((category_name, item))
+
+        short_name = item.get('shortName', item.get('name', '')).lower()
+        name = item.get('name', '').lower()
+        self.exact_ids.setdefault(short_name, []).append(entry_id)
+        self.name_keys.append((short_name, entry_id))
+        if name != short_name:
+            self.name_keys.append((name, entry_id))
+        self.name_keys_sorted = False
+
+        words = set()
+        for field in SEARCH_FIELDS:
+            words.update(WORD_PATTERN.findall(str(item.get(field, '')).lower()))
+
+        for word in words:
+            node = self.trie
+            for char in word:
+                node = node.setdefault(char, {})
+                ids = node.setdefault('', [])
+                if not ids or ids[-1] != entry_id:
+                    ids.append(entry_id)
+
+        for word in words:
+            for gram in trigrams(word):
+                postings = self.trigram_postings.setdefault(gram, [])
+                if not postings or postings[-1] != entry_id:
+                    postings.append(entry_id)
+
+    def prefix_ids(self, word):
+        """Return the ids of entries with a word starting with word"""
+        node = self.trie
+        for char in word:
+            node = node.get(char)
+            if node is None:
+                return []
+        return node.get('', [])
+
+    def sort_name_keys(self):
+        """Sort the name keys after items were added"""
+        if not self.name_keys_sorted:
+            self.name_keys.sort()
+            self.name_keys_sorted = True
+
+    def name_prefix_ids(self, query):
+        """Return the ids of entries whose short name or name starts with query"""
+        self.sort_name_keys()
+        upper = query[:-1] + chr(ord(query[-1]) + 1)
+        start = bisect_left(self.name_keys, (query,))
+        end = bisect_left(self.name_keys, (upper,), start)
+        return {entry_id for _, entry_id in self.name_keys[start:end]}
+
+    def search(self, query, limit=10):
+        """Return up to limit (category, item) entries best matching query"""
+        query = query.strip().lower()
+        words = WORD_PATTERN.findall(query)
+        if not words:
+            return []
+
+        # Exact and prefix matches on the names come first and are looked up in full
+        exact = self.exact_ids.get(query, [])
+        results = exact[:limit]
+        if len(results) < limit:
+            prefix = self.name_prefix_ids(query).difference(exact)
+            results += sorted(prefix)[:limit - len(results)]
+
+        # Then entries where every query word prefix-matches some word of the entry
+        if len(results) < limit:
+            seen = set(results)
+            postings = sorted((self.prefix_ids(word) for word in words), key=len)
+            candidates = []
+            if postings[0]:
+                others = [set(ids) for ids in postings[1:]]
+                for entry_id in postings[0]:
+                    if entry_id not in seen and all(entry_id in ids for ids in others):
+                        candidates.append(entry_id)
+                        if len(candidates) >= MAX_CANDIDATES:
+                            break
+            results += candidates[:limit - len(results)]
+
+        # Top up with fuzzy matches for typos
+        if len(results) < limit and len(query) >= 3:
+            seen = set(results)
+            for entry_id in self.fuzzy_ids(query):
+                if entry_id not in seen:
+                    results.append(entry_id)
+                    if len(results) >= limit:
+                        break
+
+        return [self.entries[entry_id] for entry_id in results]
+
+    def fuzzy_ids(self, query, min_score=0.4):
+        """Return ids ordered by the share of query trigrams found in the entry's words"""
+        grams = set()
+        for word in WORD_PATTERN.findall(query):
+            grams |= trigrams(word)
+        counts = Counter()
+        for gram in grams:
+            counts.update(self.trigram_postings.get(gram, ()))
+        threshold = min_score * len(grams)
+        return [entry_id for entry_id, hits in counts.most_common(MAX_CANDIDATES) if hits >= threshold]
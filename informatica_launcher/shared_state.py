@@ -0,0 +1,194 @@
+"""
+Multi-process safe shared files for the Informatica Quick Launcher
+Several launchers (for example on a shared drive) may write the same logs and
+caches: log records are appended with one O_APPEND write each, and JSON caches
+are updated with compare-and-swap under a short advisory file lock
+"""
+import hashlib
+import json
+import os
+import random
+import time
+from pathlib import Path
+
+if os.name == 'nt':
+    import msvcrt
+else:
+    import fcntl
+
+
+class LockTimeout(OSError):
+    """Raised when a file lock is not acquired in time"""
+
+
+class ConflictError(Exception):
+    """Raised when a compare-and-swap update keeps losing to other writers"""
+
+
+class FileLock:
+    """Advisory exclusive lock on <path>.lock, usable as a context manager"""
+
+    def __init__(self, path, timeout=10.0, poll_interval=0.01):
+        self.lock_path = Path(f"{path}.lock")
+        self.timeout = timeout
+        self.poll_interval = poll_interval
+        self.fd = None
+
+    def acquire(self):
+        """Block until the lock is held or raise LockTimeout"""
+        fd = os.open(self.lock_path, os.O_RDWR | os.O_CREAT, 0o666)
+        deadline = time.monotonic() + self.timeout
+        delay = self.poll_interval
+        while True:
+            try:
+                if os.name == 'nt':
+                    msvcrt.locking(fd, msvcrt.LK_NBLCK, 1)
+                else:
+                    fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                self.fd = fd
+                return
+            except OSError:
+                if time.monotonic() >= deadline:
+                    os.close(fd)
+                    raise LockTimeout(f"Timed out waiting for {self.lock_path.name}")
+                # Jittered backoff so waiting processes do not retry in lockstep
+                time.sleep(delay * random.uniform(0.5, 1.5))
+                delay = min(delay * 2, 0.2)
+
+    def release(self):
+        """Release the lock"""
+        if self.fd is None:
+            return
+        try:
+            if os.name == 'nt':
+                os.lseek(self.fd, 0, os.SEEK_SET)
+                msvcrt.locking(self.fd, msvcrt.LK_UNLCK, 1)
+            else:
+                fcntl.flock(self.fd, fcntl.LOCK_UN)
+        finally:
+            os.close(self.fd)
+            self.fd = None
+
+    def __enter__(self):
+        self.acquire()
+        return self
+
+    def __exit__(self, *exc):
+        self.release()
+        return False
+
+
+def append_record(path, data, locked=False):
+    """Append data (str or bytes) to a file in a single write so concurrent writers never interleave.
+
+    POSIX O_APPEND makes the seek-and-write atomic without a lock. Files that are
+    compacted by rewriting need locked=True, as does Windows, where the C runtime
+    emulates O_APPEND with a separate seek.
+    """
+    if isinstance(data, str):
+        data = data.encode('utf-8')
+    flags = os.O_WRONLY | os.O_APPEND | os.O_CREAT | getattr(os, 'O_BINARY', 0)
+    if locked or os.name == 'nt':
+        with FileLock(path):
+            write_all(path, data, flags)
+    else:
+        write_all(path, data, flags)
+
+
+def write_all(path, data, flags):
+    """Write data with one write call where the OS allows it"""
+    fd = os.open(path, flags, 0o666)
+    try:
+        view = memoryview(data)
+        while view:
+            written = os.write(fd, view)
+            view = view[written:]
+    finally:
+        os.close(fd)
+
+
+def replace_atomically(path, data):
+    """Write bytes to a unique temp file and rename it over path"""
+    path = Path(path)
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    try:
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            tmp_path.unlink()
+        except OSError:
+            pass
+        raise
+
+
+def user_data_dir():
+    """Return the per-user local folder for files that must never be shared between people"""
+    local_app_data = os.environ.get('LOCALAPPDATA')
+    if os.name == 'nt' and local_app_data:
+        return Path(local_app_data) / "InformaticaLauncher"
+    return Path.home() / ".informatica_launcher"
+
+
+class SharedJsonFile:
+    """JSON document updated with optimistic compare-and-swap.
+
+    The version of the document is a digest of its bytes, so the file format is
+    unchanged. Readers never lock: files are only ever replaced by rename, so a
+    reader sees either the old or the new document, never a torn one.
+    """
+
+    def __init__(self, path, default=None, retries=20, lock_timeout=10.0):
+        self.path = Path(path)
+        self.default = default if default is not None else {}
+        self.retries = retries
+        self.lock_timeout = lock_timeout
+
+    def read(self):
+        """Return (document, version); a missing or unreadable file gives a copy of the default"""
+        try:
+            data = self.path.read_bytes()
+        except OSError:
+            return json.loads(json.dumps(self.default)), None
+        version = hashlib.sha1(data).hexdigest()
+        try:
+            return json.loads(data.decode('utf-8')), version
+        except ValueError:
+            # Left behind by an older, non-atomic writer; the next update replaces it
+            return json.loads(json.dumps(self.default)), version
+
+    def current_version(self):
+        """Return the digest of the file as it is on disk now"""
+        try:
+            return hashlib.sha1(self.path.read_bytes()).hexdigest()
+        except OSError:
+            return None
+
+    def compare_and_swap(self, expected_version, document):
+        """Write document if the file still has expected_version; returns True on success"""
+        data = json.dumps(document, ensure_ascii=False).encode('utf-8')
+        with FileLock(self.path, timeout=self.lock_timeout):
+            if self.current_version() != expected_version:
+                return False
+            replace_atomically(self.path, data)
+        return True
+
+    def update(self, mutate):
+        """Apply mutate(document) -> new document until it commits; returns the committed document.
+
+        mutate may run several times and must only depend on its argument. When it
+        returns the document unchanged, nothing is written.
+        """
+        for attempt in range(self.retries):
+            document, version = self.read()
+            snapshot = json.dumps(document, sort_keys=True)
+            updated = mutate(document)
+            if version is not None and json.dumps(updated, sort_keys=True) == snapshot:
+                return updated
+            if self.compare_and_swap(version, updated):
+                return updated
+            time.sleep(random.uniform(0, 0.005 * (attempt + 1)))
+        raise ConflictError(f"Gave up updating {self.path.name} after {self.retries} conflicting writes")
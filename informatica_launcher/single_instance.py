@@ -0,0 +1,112 @@
+"""
+Single-instance support for the Informatica Quick Launcher
+The first launcher listens on a local socket; later invocations forward
+their command to it and exit immediately
+"""
+import getpass
+import hashlib
+import json
+import os
+import queue
+import secrets
+import socket
+import tempfile
+import threading
+from pathlib import Path
+
+
+# Commands a running launcher accepts from later invocations
+FORWARDED_COMMANDS = ('show', 'open', 'logout', 'reload', 'quit')
+
+# Seconds to wait for a running launcher before starting a new one
+CONNECT_TIMEOUT = 0.5
+
+
+def endpoint_path(app_dir=None):
+    """Return the per-user file that records the running launcher's port and token"""
+    app_dir = Path(app_dir or Path(__file__).parent).resolve()
+    digest = hashlib.sha1(f"{getpass.getuser()}|{app_dir}".encode('utf-8')).hexdigest()[:12]
+    return Path(tempfile.gettempdir()) / f"informatica_launcher_{digest}.json"
+
+
+def forward_command(argv, app_dir=None):
+    """Send argv to a running launcher; return True if it accepted the command"""
+    if not argv or argv[0] not in FORWARDED_COMMANDS:
+        return False
+
+    path = endpoint_path(app_dir)
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            endpoint = json.load(f)
+        with socket.create_connection(('127.0.0.1', endpoint['port']), timeout=CONNECT_TIMEOUT) as conn:
+            message = json.dumps({'token': endpoint['token'], 'argv': list(argv)}) + "\n"
+            conn.sendall(message.encode('utf-8'))
+            reply = conn.makefile('r', encoding='utf-8').readline().strip()
+        return reply == 'ok'
+    except (OSError, ValueError, KeyError):
+        return False
+
+
+class InstanceServer:
+    """Local socket server that queues commands forwarded by later invocations"""
+
+    def __init__(self, app_dir=None):
+        self.path = endpoint_path(app_dir)
+        self.token = secrets.token_hex(16)
+        self.commands = queue.Queue()
+        self.sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self.sock.bind(('127.0.0.1', 0))
+        self.sock.listen(5)
+        self.port = self.sock.getsockname()[1]
+        self.closed = False
+
+        self.write_endpoint()
+        self.thread = threading.Thread(target=self.serve, name="instance-server", daemon=True)
+        self.thread.start()
+
+    def write_endpoint(self):
+        """Publish the port and token atomically for later invocations"""
+        tmp_path = self.path.with_suffix('.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({'port': self.port, 'token': self.token, 'pid': os.getpid()}, f)
+        os.replace(tmp_path, self.path)
+
+    def serve(self):
+        """Accept connections and queue authenticated commands"""
+        while not self.closed:
+            try:
+                conn, _ = self.sock.accept()
+            except OSError:
+                return
+            with conn:
+                try:
+                    conn.settimeout(CONNECT_TIMEOUT)
+                    message = json.loads(conn.makefile('r', encoding='utf-8').readline())
+                    argv = message.get('argv')
+                    if message.get('token') != self.token or not argv or argv[0] not in FORWARDED_COMMANDS:
+                        conn.sendall(b"denied\n")
+                        continue
+                    self.commands.put(argv)
+                    conn.sendall(b"ok\n")
+                except (OSError, ValueError, AttributeError):
+                    continue
+
+    def get_command(self):
+        """Return the next forwarded argv, or None"""
+        try:
+            return self.commands.get_nowait()
+        except queue.Empty:
+            return None
+
+    def close(self):
+        """Stop listening and withdraw the endpoint if it is still ours"""
+        if self.closed:
+            return
+        self.closed = True
+        self.sock.close()
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                if json.load(f).get('token') == self.token:
+                    self.path.unlink()
+        except (OSError, ValueError):
+            pass
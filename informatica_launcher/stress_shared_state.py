@@ -0,0 +1,221 @@
+"""
+Multi-process stress test for the launcher's shared files
+Starts 1, 2, 4 and 8 writer processes against one scratch directory and
+checks that no log line is lost, torn or duplicated (including across log
+rotation) and that no compare-and-swap cache update is lost. Prints the write
+throughput per writer count
+
+Usage:
+    python stress_shared_state.py                        # 1, 2, 4 and 8 writers
+    python stress_shared_state.py --writers 2 16 --operations 500
+    python stress_shared_state.py --dir S:\\team\\launcher   # Test a shared drive
+
+Exits with 1 when any check fails.
+"""
+import argparse
+import json
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+
+DEFAULT_WRITERS = (1, 2, 4, 8)
+DEFAULT_OPERATIONS = 300
+DEFAULT_OUTPUT = "stress_results.json"
+
+# Seconds given to every writer process to start before they all begin at once
+START_DELAY = 1.0
+
+# Small enough that the access log rotates many times during a run
+ROTATE_BYTES = 16 * 1024
+
+
+def child_append(directory, writer, operations):
+    """Append one line per operation with lock-free O_APPEND writes (child mode)"""
+    from shared_state import append_record
+    path = Path(directory) / "append.log"
+    for sequence in range(operations):
+        append_record(path, f"writer={writer} seq={sequence} {'x' * 40}\n")
+
+
+def child_access_log(directory, writer, operations):
+    """Write through AccessLogWriter so batches race with log rotation (child mode)"""
+    from access_log import AccessLogWriter
+    log = AccessLogWriter(
+        Path(directory) / "access_log.txt",
+        max_bytes=ROTATE_BYTES,
+        backup_count=10000,
+        batch_size=10,
+        flush_interval=0.01
+    )
+    for sequence in range(operations):
+        log.log_access(f"w{writer}-{sequence}")
+    log.close(timeout=60)
+
+
+def child_cas(directory, writer, operations):
+    """Increment a shared counter with compare-and-swap (child mode)"""
+    from shared_state import SharedJsonFile
+    store = SharedJsonFile(Path(directory) / "cache.json", retries=1000)
+
+    def increment(document):
+        document['total'] = document.get('total', 0) + 1
+        counts = document.setdefault('writers', {})
+        counts[str(writer)] = counts.get(str(writer), 0) + 1
+        return document
+
+    for _ in range(operations):
+        store.update(increment)
+
+
+CHILD_MODES = {
+    'append': child_append,
+    'access_log': child_access_log,
+    'cas': child_cas,
+}
+
+
+def check_append(directory, writers, operations):
+    """Return problems found in append.log"""
+    expected = {(writer, sequence) for writer in range(writers) for sequence in range(operations)}
+    seen = set()
+    problems = []
+    with open(Path(directory) / "append.log", 'r', encoding='utf-8') as f:
+        for line in f:
+            fields = line.split()
+            if len(fields) != 3 or fields[2] != 'x' * 40:
+                problems.append(f"torn line: {line[:60]!r}")
+                continue
+            key = (int(fields[0].split('=')[1]), int(fields[1].split('=')[1]))
+            if key in seen:
+                problems.append(f"duplicate line: {key}")
+            seen.add(key)
+    missing = expected - seen
+    if missing:
+        problems.append(f"{len(missing)} lines lost")
+    return problems
+
+
+def check_access_log(directory, writers, operations):
+    """Return problems found across access_log.txt and its rotations"""
+    expected = {f"w{writer}-{sequence}" for writer in range(writers) for sequence in range(operations)}
+    seen = []
+    problems = []
+    for path in Path(directory).glob("access_log.txt*"):
+        if path.name.endswith('.lock'):
+            continue
+        with open(path, 'r', encoding='utf-8') as f:
+            for line in f:
+                _, separator, name = line.rstrip("\n").partition(" - Accessed: ")
+                if not separator or name not in expected:
+                    problems.append(f"torn line in {path.name}: {line[:60]!r}")
+                    continue
+                seen.append(name)
+    if len(seen) != len(set(seen)):
+        problems.append(f"{len(seen) - len(set(seen))} duplicate records")
+    missing = expected - set(seen)
+    if missing:
+        problems.append(f"{len(missing)} records lost")
+    return problems
+
+
+def check_cas(directory, writers, operations):
+    """Return problems found in the shared counter"""
+    with open(Path(directory) / "cache.json", 'r', encoding='utf-8') as f:
+        document = json.load(f)
+    problems = []
+    if document.get('total') != writers * operations:
+        problems.append(f"lost updates: total {document.get('total')} != {writers * operations}")
+    for writer in range(writers):
+        if document.get('writers', {}).get(str(writer)) != operations:
+            problems.append(f"writer {writer} has {document.get('writers', {}).get(str(writer))} updates")
+    return problems
+
+
+CHECKS = {
+    'append': check_append,
+    'access_log': check_access_log,
+    'cas': check_cas,
+}
+
+
+def run_round(mode, directory, writers, operations):
+    """Start the writers together and return (seconds, problems)"""
+    start_at = time.time() + START_DELAY
+    processes = [
+        subprocess.Popen([
+            sys.executable, str(Path(__file__).resolve()),
+            '--child', mode, '--child-dir', str(directory),
+            '--child-writer', str(writer), '--operations', str(operations),
+            '--child-start', str(start_at),
+        ], stdout=subprocess.PIPE, text=True)
+        for writer in range(writers)
+    ]
+    # Each writer prints when it finished, so interpreter start-up is not counted
+    finished = [process.communicate()[0] for process in processes]
+    if any(process.returncode != 0 for process in processes):
+        failed = sum(process.returncode != 0 for process in processes)
+        return time.time() - start_at, [f"{failed} writer process(es) failed"]
+    elapsed = max(float(output.strip().splitlines()[-1]) for output in finished) - start_at
+    return elapsed, CHECKS[mode](directory, writers, operations)
+
+
+def build_parser():
+    """Create the argument parser for the stress test"""
+    parser = argparse.ArgumentParser(description="Stress-test the launcher's shared files with many processes")
+    parser.add_argument('--writers', type=int, nargs='+', default=list(DEFAULT_WRITERS),
+                        help="Writer process counts to test")
+    parser.add_argument('--operations', type=int, default=DEFAULT_OPERATIONS,
+                        help="Writes per process and mode")
+    parser.add_argument('--modes', nargs='+', choices=list(CHILD_MODES), default=list(CHILD_MODES),
+                        help="Which shared-file operations to test")
+    parser.add_argument('--dir', help="Directory to test in (default: a temporary directory)")
+    parser.add_argument('--output', default=DEFAULT_OUTPUT, help="Where to write the JSON results")
+    parser.add_argument('--child', choices=list(CHILD_MODES), help=argparse.SUPPRESS)
+    parser.add_argument('--child-dir', help=argparse.SUPPRESS)
+    parser.add_argument('--child-writer', type=int, help=argparse.SUPPRESS)
+    parser.add_argument('--child-start', type=float, help=argparse.SUPPRESS)
+    return parser
+
+
+def main(argv=None):
+    """Run every mode for every writer count; returns the exit code"""
+    args = build_parser().parse_args(argv)
+
+    if args.child:
+        sys.path.insert(0, str(Path(__file__).parent))
+        time.sleep(max(0.0, args.child_start - time.time()))
+        CHILD_MODES[args.child](args.child_dir, args.child_writer, args.operations)
+        print(time.time())
+        return 0
+
+    results = []
+    failures = 0
+    for mode in args.modes:
+        for writers in args.writers:
+            with tempfile.TemporaryDirectory(prefix="launcher_stress_", dir=args.dir) as scratch:
+                elapsed, problems = run_round(mode, Path(scratch), writers, args.operations)
+            writes = writers * args.operations
+            results.append({
+                'mode': mode,
+                'writers': writers,
+                'writes': writes,
+                'seconds': round(elapsed, 3),
+                'writes_per_second': round(writes / elapsed, 1),
+                'problems': problems,
+            })
+            status = "ok" if not problems else "FAILED: " + "; ".join(problems[:3])
+            print(f"{mode:<12}{writers:>3} writers  {writes:>6} writes  "
+                  f"{writes / elapsed:>9.0f} writes/s  {status}")
+            failures += bool(problems)
+
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump({'operations': args.operations, 'results': results}, f, indent=2)
+    print(f"Results written to {args.output}")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
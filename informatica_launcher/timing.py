@@ -0,0 +1,140 @@
+"""
+Timing spans for the Informatica Quick Launcher
+Spans cost a single flag check while tracing is off; when on they are kept
+in a ring buffer for the diagnostics view and can be dumped as a Chrome trace
+"""
+import functools
+import json
+import os
+import threading
+import time
+from collections import deque
+
+
+# Spans kept for the diagnostics view
+RECENT_SPAN_LIMIT = 500
+
+
+class NullSpan:
+    """Context manager used while tracing is off"""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+NULL_SPAN = NullSpan()
+
+
+class Span:
+    """Context manager that records one complete event on exit"""
+
+    def __init__(self, tracer, name, args):
+        self.tracer = tracer
+        self.name = name
+        self.args = args
+
+    def __enter__(self):
+        self.start_ns = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, *exc):
+        self.tracer.record(self.name, self.start_ns, time.perf_counter_ns() - self.start_ns, self.args)
+        return False
+
+
+class Tracer:
+    """Collects timing spans; keeps all of them only while a trace file is requested"""
+
+    def __init__(self):
+        self.enabled = False
+        self.keep_all = False
+        self.recent = deque(maxlen=RECENT_SPAN_LIMIT)
+        self.events = []
+        self.lock = threading.Lock()
+        self.origin_ns = time.perf_counter_ns()
+
+    def set_origin(self, origin_ns):
+        """Measure span offsets from an earlier perf_counter_ns() reading, such as process start"""
+        self.origin_ns = min(self.origin_ns, origin_ns)
+
+    def enable(self, keep_all=False):
+        """Start recording spans; keep_all retains every span for write_chrome_trace"""
+        self.enabled = True
+        self.keep_all = self.keep_all or keep_all
+
+    def span(self, name, **args):
+        """Return a context manager timing the enclosed block"""
+        if not self.enabled:
+            return NULL_SPAN
+        return Span(self, name, args)
+
+    def record(self, name, start_ns, duration_ns, args=None):
+        """Store a finished span"""
+        event = (name, start_ns, duration_ns, threading.get_ident(), args or None)
+        with self.lock:
+            self.recent.append(event)
+            if self.keep_all:
+                self.events.append(event)
+
+    def recent_spans(self):
+        """Return the recent spans as (name, start_ms, duration_ms, args), oldest first"""
+        with self.lock:
+            events = list(self.recent)
+        return [
+            (name, (start_ns - self.origin_ns) / 1e6, duration_ns / 1e6, args)
+            for name, start_ns, duration_ns, _, args in events
+        ]
+
+    def summary(self):
+        """Return {name: (count, total_ms, max_ms)} over the recent spans"""
+        stats = {}
+        for name, _, duration_ms, _ in self.recent_spans():
+            count, total, longest = stats.get(name, (0, 0.0, 0.0))
+            stats[name] = (count + 1, total + duration_ms, max(longest, duration_ms))
+        return stats
+
+    def write_chrome_trace(self, path):
+        """Write every recorded span in Chrome trace format (chrome://tracing, Perfetto)"""
+        with self.lock:
+            events = list(self.events if self.keep_all else self.recent)
+        pid = os.getpid()
+        trace = {
+            'displayTimeUnit': 'ms',
+            'traceEvents': [
+                {
+                    'name': name,
+                    'cat': name.split('.', 1)[0],
+                    'ph': 'X',
+                    'ts': (start_ns - self.origin_ns) / 1000,
+                    'dur': duration_ns / 1000,
+                    'pid': pid,
+                    'tid': tid,
+                    'args': args or {},
+                }
+                for name, start_ns, duration_ns, tid, args in events
+            ],
+        }
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(trace, f)
+        os.replace(tmp_path, path)
+
+
+# Process-wide tracer shared by all modules
+tracer = Tracer()
+
+
+def traced(name):
+    """Decorator timing every call of a function under the given span name"""
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not tracer.enabled:
+                return func(*args, **kwargs)
+            with Span(tracer, name, None):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
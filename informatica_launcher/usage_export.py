@@ -0,0 +1,271 @@
+"""
+Usage export for the Informatica Quick Launcher
+Streams access_log.txt and its rotated copies into day-partitioned CSV or
+Parquet files and keeps a per-environment daily rollup. A checkpoint records
+how far each log file was read, so repeated exports only handle new lines
+"""
+import csv
+import hashlib
+import json
+import os
+import shutil
+from datetime import datetime
+from pathlib import Path
+
+
+STATE_FILE = "_export_state.json"
+ROLLUP_FILE = "daily_rollup.csv"
+
+# Columns of the exported records
+COLUMNS = ('time', 'date', 'event', 'environment', 'user', 'host')
+
+# Rows buffered per Parquet row group
+PARQUET_ROW_GROUP = 10000
+
+# Bytes at the start of a log file checked to tell a rotated file from a new one with a reused inode
+HEAD_BYTES = 64
+
+
+class ExportError(Exception):
+    """Raised when the export cannot run (for example Parquet without pyarrow)"""
+
+
+def parse_line(line):
+    """Parse a text or JSON log line into (time, event, environment, user, host), or None.
+
+    Only JSON lines record the user and host; they are None for text lines.
+    """
+    line = line.strip()
+    if not line:
+        return None
+    try:
+        if line.startswith('{'):
+            record = json.loads(line)
+            return (
+                datetime.fromisoformat(record['time']), record['event'], record.get('name'),
+                record.get('user'), record.get('host')
+            )
+
+        timestamp, _, message = line.partition(" - ")
+        when = datetime.fromisoformat(timestamp)
+    except (ValueError, KeyError, TypeError):
+        return None
+
+    if message.startswith("Accessed: "):
+        return when, 'access', message[len("Accessed: "):], None, None
+    if message == "Logged out from Okta":
+        return when, 'logout', None, None, None
+    return None
+
+
+def log_files(log_path, backup_count=20):
+    """Return the existing log files, oldest rotation first"""
+    log_path = Path(log_path)
+    files = []
+    for index in range(backup_count, 0, -1):
+        rotated = log_path.with_name(f"{log_path.name}.{index}")
+        if rotated.exists():
+            files.append(rotated)
+    if log_path.exists():
+        files.append(log_path)
+    return files
+
+
+def file_key(path):
+    """Identify a log file across rotations (renames keep the inode)"""
+    stat = os.stat(path)
+    if not stat.st_ino:
+        return str(Path(path).name)  # File systems without inode numbers
+    return f"{stat.st_dev}:{stat.st_ino}"
+
+
+def head_digest(path, length):
+    """Return a digest of the first bytes of a file that were already exported"""
+    with open(path, 'rb') as f:
+        return hashlib.sha1(f.read(min(length, HEAD_BYTES))).hexdigest()[:16]
+
+
+def stream_new_records(path, offset):
+    """Yield (record, end_offset) for complete lines after offset; a torn last line is left for later"""
+    with open(path, 'rb') as f:
+        f.seek(offset)
+        position = offset
+        for raw in f:
+            if not raw.endswith(b"\n"):
+                break
+            position += len(raw)
+            yield parse_line(raw.decode('utf-8', errors='replace')), position
+
+
+class PartitionWriter:
+    """Writes records into <output>/date=YYYY-MM-DD/part-NNNNNN.<ext>, one open partition at a time"""
+
+    def __init__(self, output_dir, part_name, file_format='csv'):
+        self.output_dir = Path(output_dir)
+        self.part_name = part_name
+        self.file_format = file_format
+        self.current_date = None
+        self.started = {}
+        self.handle = None
+        self.writer = None
+        self.rows = []
+
+        if file_format == 'parquet':
+            try:
+                import pyarrow
+                import pyarrow.parquet
+            except ImportError:
+                raise ExportError("Parquet export needs pyarrow: pip install pyarrow")
+            self.pa = pyarrow
+            self.pq = pyarrow.parquet
+            self.schema = pyarrow.schema([
+                ('time', pyarrow.timestamp('s')),
+                ('date', pyarrow.date32()),
+                ('event', pyarrow.string()),
+                ('environment', pyarrow.string()),
+                ('user', pyarrow.string()),
+                ('host', pyarrow.string()),
+            ])
+        elif file_format != 'csv':
+            raise ExportError(f"Unknown export format: {file_format}")
+
+    def partition_path(self, date):
+        """Return the part file of this export for a day"""
+        directory = self.output_dir / f"date={date.isoformat()}"
+        directory.mkdir(parents=True, exist_ok=True)
+        return directory / f"{self.part_name}.{self.file_format}"
+
+    def write(self, row):
+        """Add one row (a tuple in COLUMNS order)"""
+        date = row[1]
+        if date != self.current_date:
+            self.close_partition()
+            self.open_partition(date)
+
+        if self.file_format == 'csv':
+            self.writer.writerow((row[0].isoformat(sep=' '), row[1].isoformat()) + row[2:])
+            return
+        self.rows.append(row)
+        if len(self.rows) >= PARQUET_ROW_GROUP:
+            self.flush_rows()
+
+    def open_partition(self, date):
+        """Open a day's part file; a day seen earlier in this run is appended to (CSV) or split (Parquet)"""
+        self.current_date = date
+        path = self.partition_path(date)
+        if self.file_format == 'csv':
+            append = date in self.started
+            self.handle = open(path, 'a' if append else 'w', encoding='utf-8', newline='')
+            self.writer = csv.writer(self.handle)
+            if not append:
+                self.writer.writerow(COLUMNS)
+        else:
+            if date in self.started:
+                path = path.with_name(f"{self.part_name}-{self.started[date]}.parquet")
+            self.writer = self.pq.ParquetWriter(str(path), self.schema)
+        self.started[date] = self.started.get(date, 0) + 1
+
+    def flush_rows(self):
+        """Write buffered Parquet rows as one row group"""
+        if not self.rows:
+            return
+        columns = list(zip(*self.rows))
+        table = self.pa.Table.from_arrays(
+            [self.pa.array(column, type=field.type) for column, field in zip(columns, self.schema)],
+            schema=self.schema
+        )
+        self.writer.write_table(table)
+        self.rows = []
+
+    def close_partition(self):
+        """Finish the open part file"""
+        if self.writer is None:
+            return
+        if self.file_format == 'csv':
+            self.handle.close()
+        else:
+            self.flush_rows()
+            self.writer.close()
+        self.writer = None
+        self.handle = None
+
+    def close(self):
+        """Finish all output"""
+        self.close_partition()
+
+
+def load_state(output_dir):
+    """Read the export checkpoint and rollup, or start fresh"""
+    try:
+        with open(Path(output_dir) / STATE_FILE, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {'sequence': 0, 'files': {}, 'rollup': {}}
+
+
+def save_state(output_dir, state):
+    """Write the rollup table, then commit the checkpoint atomically"""
+    output_dir = Path(output_dir)
+    rollup_tmp = output_dir / f"{ROLLUP_FILE}.tmp"
+    with open(rollup_tmp, 'w', encoding='utf-8', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(('date', 'event', 'environment', 'count'))
+        for date in sorted(state['rollup']):
+            for key, count in sorted(state['rollup'][date].items()):
+                event, _, environment = key.partition('|')
+                writer.writerow((date, event, environment, count))
+    os.replace(rollup_tmp, output_dir / ROLLUP_FILE)
+
+    state_tmp = output_dir / f"{STATE_FILE}.tmp"
+    with open(state_tmp, 'w', encoding='utf-8') as f:
+        json.dump(state, f)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(state_tmp, output_dir / STATE_FILE)
+
+
+def export_usage(log_path, output_dir, file_format='csv', full=False, backup_count=20):
+    """Export log lines appended since the last checkpoint; returns (exported, skipped) line counts"""
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    if full:
+        # Start over: drop earlier partitions so no record is exported twice
+        for partition in output_dir.glob("date=*"):
+            shutil.rmtree(partition)
+        state = {'sequence': 0, 'files': {}, 'rollup': {}}
+    else:
+        state = load_state(output_dir)
+
+    # The sequence names this run's part files; a rerun after a crash overwrites them
+    sequence = state['sequence'] + 1
+    writer = PartitionWriter(output_dir, f"part-{sequence:06d}", file_format)
+    offsets = {}
+    exported = skipped = 0
+    try:
+        for path in log_files(log_path, backup_count):
+            key = file_key(path)
+            checkpoint = state['files'].get(key, {})
+            offset = checkpoint.get('offset', 0)
+            if offset > os.path.getsize(path) or checkpoint.get('head') != head_digest(path, offset):
+                offset = 0  # A different file now has this identity
+            for record, end_offset in stream_new_records(path, offset):
+                offset = end_offset
+                if record is None:
+                    skipped += 1
+                    continue
+                when, event, environment, user, host = record
+                date = when.date()
+                writer.write((when, date, event, environment, user, host))
+                counts = state['rollup'].setdefault(date.isoformat(), {})
+                rollup_key = f"{event}|{environment or ''}"
+                counts[rollup_key] = counts.get(rollup_key, 0) + 1
+                exported += 1
+            offsets[key] = {'offset': offset, 'head': head_digest(path, offset)}
+    finally:
+        writer.close()
+
+    # Files that rotated out of existence are dropped from the checkpoint
+    state['files'] = offsets
+    state['sequence'] = sequence if exported else state['sequence']
+    save_state(output_dir, state)
+    return exported, skipped
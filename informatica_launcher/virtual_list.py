@@ -0,0 +1,118 @@
+"""
+Virtualized scrolling list for the Informatica Quick Launcher
+Only the rows on screen have widgets; they are recycled while scrolling
+"""
+import tkinter as tk
+
+
+class VirtualList(tk.Frame):
+    """Canvas-based list of fixed-height rows backed by a small pool of recycled widgets"""
+
+    def __init__(self, parent, create_row, configure_row, row_height, items=(),
+                 row_gap=12, bg='white'):
+        super().__init__(parent, bg=bg)
+        self.create_row = create_row
+        self.configure_row = configure_row
+        self.row_height = row_height
+        self.row_gap = row_gap
+        self.items = list(items)
+
+        # Pool of (widget, canvas window id, bound item index)
+        self.rows = []
+
+        self.canvas = tk.Canvas(
+            self,
+            bg=bg,
+            highlightthickness=0,
+            borderwidth=0,
+            yscrollincrement=row_height // 2
+        )
+        self.scrollbar = tk.Scrollbar(self, orient=tk.VERTICAL, command=self.yview)
+        self.canvas.configure(yscrollcommand=self.scrollbar.set)
+        self.canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        self.scrollbar_visible = False
+
+        self.canvas.bind('<Configure>', lambda e: self.refresh())
+        self.bind_mousewheel(self.canvas)
+
+    def set_items(self, items):
+        """Replace the list contents, rebinding only rows whose item changed"""
+        old_items, self.items = self.items, list(items)
+        for slot, (widget, window_id, index) in enumerate(self.rows):
+            if index is None or index >= len(self.items) or old_items[index] != self.items[index]:
+                self.rows[slot] = (widget, window_id, None)
+        self.refresh()
+
+    def refresh(self):
+        """Update the scroll region and scrollbar, then redraw the visible rows"""
+        width = self.canvas.winfo_width()
+        height = self.canvas.winfo_height()
+        total_height = len(self.items) * self.row_height
+        self.canvas.configure(scrollregion=(0, 0, width, total_height))
+
+        # Only show the scrollbar when the rows overflow the view
+        needs_scrollbar = total_height > height
+        if needs_scrollbar and not self.scrollbar_visible:
+            self.scrollbar.pack(side=tk.RIGHT, fill=tk.Y, before=self.canvas)
+        elif not needs_scrollbar and self.scrollbar_visible:
+            self.scrollbar.pack_forget()
+            self.canvas.yview_moveto(0)
+        self.scrollbar_visible = needs_scrollbar
+        self.render()
+
+    def yview(self, *args):
+        """Scrollbar callback: scroll the canvas and rebind rows that came into view"""
+        self.canvas.yview(*args)
+        self.render()
+
+    def render(self):
+        """Position pooled widgets over the visible slice of items"""
+        width = self.canvas.winfo_width()
+        height = self.canvas.winfo_height()
+        top = self.canvas.canvasy(0)
+
+        first = max(0, int(top // self.row_height))
+        count = max(0, min(len(self.items) - first, height // self.row_height + 2))
+
+        for slot in range(count):
+            index = first + slot
+            item = self.items[index]
+            if slot == len(self.rows):
+                widget = self.create_row(self.canvas, item, index)
+                self.bind_mousewheel(widget)
+                window_id = self.canvas.create_window(0, 0, window=widget, anchor=tk.NW)
+                self.rows.append((widget, window_id, index))
+            else:
+                widget, window_id, bound_index = self.rows[slot]
+                if bound_index != index:
+                    self.configure_row(widget, item, index)
+                    self.rows[slot] = (widget, window_id, index)
+
+            self.canvas.coords(window_id, 0, index * self.row_height + self.row_gap // 2)
+            self.canvas.itemconfigure(
+                window_id,
+                width=width,
+                height=self.row_height - self.row_gap,
+                state=tk.NORMAL
+            )
+
+        # Hide pooled rows that are not needed for this view
+        for widget, window_id, _ in self.rows[count:]:
+            self.canvas.itemconfigure(window_id, state=tk.HIDDEN)
+
+    def bind_mousewheel(self, widget):
+        """Scroll the list with the mouse wheel over any of its widgets (and their children)"""
+        for target in (widget, *widget.winfo_children()):
+            target.bind('<MouseWheel>', self.on_mousewheel)
+            target.bind('<Button-4>', lambda e: self.scroll_units(-1))
+            target.bind('<Button-5>', lambda e: self.scroll_units(1))
+
+    def on_mousewheel(self, event):
+        """Handle Windows/macOS wheel events"""
+        self.scroll_units(-1 if event.delta > 0 else 1)
+
+    def scroll_units(self, units):
+        """Scroll by units of half a row if the list overflows"""
+        if self.scrollbar_visible:
+            self.canvas.yview_scroll(units, 'units')
+            self.render()